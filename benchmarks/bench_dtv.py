@@ -0,0 +1,70 @@
+"""
+Benchmark the construction, sorting and comparison of `_DateTimeVersions` instances.
+
+- `create`: Construct the instances from `(date, version)` strings.
+- `sort`: `sorted()` the instances (rich comparisons).
+- `compare`: Compare every pair of neighbouring instances (`<`, `==`, `>=`).
+- `hash`: Hash every instance (E.g `set()` or `dict` keys).
+- `attrs`: Access `.date`, `.version` and `.base_version` of every instance.
+
+Usage:
+    python -m benchmarks.bench_dtv [--count 10000] [--repeat 3]
+"""
+import random
+import sys
+import time
+from argparse import ArgumentParser
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+from pkg_inspect.pkg_modules.pkg_versions import _DateTimeVersions  # noqa: E402
+
+
+def records(count: int) -> list[tuple[str, str]]:
+    """Return (shuffled) `('Mon D, YYYY', 'x.y.z')` records."""
+    start = date(2000, 1, 1)
+    rng = random.Random(0)
+    items = [
+        (
+            f"{start + timedelta(days=i // 3):%b} {(start + timedelta(days=i // 3)).day}, "
+            f"{(start + timedelta(days=i // 3)).year}",
+            f"{i // 1000}.{i // 10 % 100}.{i % 10}",
+        )
+        for i in range(count)
+    ]
+    rng.shuffle(items)
+    return items
+
+
+def main() -> None:
+    arg_parser = ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--count", type=int, default=10_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    items = records(args.count)
+    dtvs = [_DateTimeVersions(d, v) for d, v in items]
+    ordered = sorted(dtvs)
+    cases = {
+        "create": lambda: [_DateTimeVersions(d, v) for d, v in items],
+        "sort": lambda: sorted(dtvs),
+        "compare": lambda: [
+            (a < b, a == b, a >= b) for a, b in zip(ordered, ordered[1:])
+        ],
+        "hash": lambda: {*dtvs},
+        "attrs": lambda: [(i.date, i.version, i.base_version) for i in dtvs],
+    }
+    print(f"{args.count} instances")
+    for name, func in cases.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        print(f"{name:<8} min {min(timings) * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark the per-entry cost of scanning a synthetic 10k-entry site-packages directory.
+
+- `legacy`: `Path.glob("*")` + `search(r"pyobjc", ...)` + `check_sitepath_suffix` \
+    + `get_package_name` (the scan performed by `_PkgInspect._get_package_paths`).
+- `scandir`: the single-pass `os.scandir` scanner (`iter_site_dir`).
+
+Usage:
+    python -m benchmarks.bench_site_scanner [--entries 10000] [--repeat 5]
+"""
+import tempfile
+import timeit
+from argparse import ArgumentParser
+from pathlib import Path
+
+from src.pkg_inspect.pkg_utils.site_index import scan_site_dir
+from src.pkg_inspect.pkg_utils.utils import (
+    check_sitepath_suffix,
+    get_package_name,
+    search,
+)
+
+
+def make_site_packages(root: Path, entries: int) -> Path:
+    """Create a synthetic site-packages directory with `entries` children."""
+    site_dir = root / "lib" / "python3.12" / "site-packages"
+    site_dir.mkdir(parents=True)
+    for i in range(entries):
+        kind = i % 4
+        if kind == 0:
+            (site_dir / f"package_{i}-1.{i % 10}.{i % 7}.dist-info").mkdir()
+        elif kind == 1:
+            (site_dir / f"package_{i}").mkdir()
+        elif kind == 2:
+            (site_dir / f"module_{i}.py").touch()
+        else:
+            (site_dir / f"package_{i}-1.0.pth").touch()
+    return site_dir
+
+
+def legacy_scan(site_dir: Path) -> list:
+    return [
+        (get_package_name(pkg), pkg)
+        for pkg in site_dir.glob("*")
+        if all((not search(r"pyobjc", pkg), check_sitepath_suffix(pkg)))
+    ]
+
+
+def main():
+    arg_parser = ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--entries", type=int, default=10_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site_dir = make_site_packages(Path(tmp), args.entries)
+        assert len(legacy_scan(site_dir)) == len(scan_site_dir(site_dir))
+
+        for name, func in (("legacy", legacy_scan), ("scandir", scan_site_dir)):
+            best = min(
+                timeit.repeat(lambda: func(site_dir), number=1, repeat=args.repeat)
+            )
+            per_entry = best / args.entries * 1e6
+            print(f"{name:>8}: {best * 1e3:9.2f} ms total | {per_entry:7.3f} µs/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark the start-up time of the command-line interface.
+
+- `--version`: `python -m pkg_inspect --version` (must not compute the inspection fields).
+- `--options`: `python -m pkg_inspect --options` (computes `INSPECTION_FIELDS` on first access).
+- `import`: `python -c "import pkg_inspect"` (lazy top-level package only).
+
+Usage:
+    python -m benchmarks.bench_startup [--repeat 10]
+"""
+import os
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+# Source directory containing the 'pkg_inspect' package
+SRC_DIR = Path(__file__).parents[1] / "src"
+
+COMMANDS: dict[str, tuple[str, ...]] = {
+    "--version": ("-m", "pkg_inspect", "--version"),
+    "--options": ("-m", "pkg_inspect", "--options"),
+    "import": ("-c", "import pkg_inspect"),
+}
+
+
+def run(args: tuple[str, ...], repeat: int) -> list[float]:
+    """Return the wall-clock time (seconds) of each run of the specified interpreter arguments."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            (sys.executable, *args), check=True, env=env, stdout=subprocess.DEVNULL
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    arg_parser = ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    # Warm up the bytecode and site index caches
+    run(COMMANDS["--options"], 1)
+    for name, command in COMMANDS.items():
+        timings = run(command, args.repeat)
+        print(
+            f"{name:<10} min {min(timings) * 1e3:8.1f} ms"
+            f"   mean {sum(timings) / len(timings) * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
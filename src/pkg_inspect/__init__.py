@@ -1,2 +1,45 @@
-from .pkg_functions import *
-from .pkg_modules import *
+"""
+`pkg_inspect` - Inspect installed Python packages, Python versions and PyPI packages.
+
+The public API is resolved lazily (module `__getattr__`), so `import pkg_inspect` does not \
+import the inspection modules (or their dependencies) until one of them is first accessed.
+"""
+from importlib import import_module
+
+
+# Public names -> the subpackage providing them
+_LAZY_EXPORTS: dict[str, str] = {
+    # 'pkg_modules'
+    "PkgInspect": "pkg_modules",
+    "PkgMetrics": "pkg_modules",
+    "PkgVersions": "pkg_modules",
+    # 'pkg_functions'
+    "INSPECTION_FIELDS": "pkg_functions",
+    "check_environment": "pkg_functions",
+    "get_available_updates": "pkg_functions",
+    "get_installed_pythons": "pkg_functions",
+    "inspect_package": "pkg_functions",
+    "inspect_pypi": "pkg_functions",
+    "pkg_version_compare": "pkg_functions",
+}
+
+# Subpackages imported on first (attribute) access
+_SUBPACKAGES: tuple[str, ...] = ("pkg_functions", "pkg_modules", "pkg_utils")
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return import_module(f".{name}", __name__)
+    try:
+        subpackage = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = getattr(import_module(f".{subpackage}", __name__), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS, *_SUBPACKAGES})
+
+
+__all__ = (*_LAZY_EXPORTS,)
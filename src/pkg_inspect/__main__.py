@@ -0,0 +1,7 @@
+"""Entry point for `python -m pkg_inspect` (see `pkg_utils.cli`)."""
+from .pkg_utils.cli import cli_parser
+
+
+if __name__ == "__main__":
+    if (result := cli_parser()) is not None:
+        print(result)
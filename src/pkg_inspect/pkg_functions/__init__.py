@@ -1,5 +1,6 @@
+from . import functions
 from .functions import (
-    INSPECTION_FIELDS,
+    check_environment,
     pkg_version_compare,
     get_available_updates,
     get_installed_pythons,
@@ -8,8 +9,16 @@ from .functions import (
 )
 
 
+def __getattr__(name: str):
+    # 'INSPECTION_FIELDS' is only computed on first access
+    if name == "INSPECTION_FIELDS":
+        return functions.INSPECTION_FIELDS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = (
     "INSPECTION_FIELDS",
+    "check_environment",
     "inspect_package",
     "inspect_pypi",
     "get_available_updates",
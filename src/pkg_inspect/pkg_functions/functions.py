@@ -19,6 +19,7 @@ versions, and retrieve information from Python installations.
 - **get_installed_pythons**: Returns a tuple of all installed Python versions.
 - **inspection_fieldnames**: Lists the available fieldnames for inspection.
 - **inspect_pypi**: Inspects a package on PyPI (Python Package Index) and returns the requested item.
+- **check_environment**: Returns the unsatisfied requirements of the installed packages (every interpreter).
 
 """
 
@@ -51,8 +52,18 @@ from ..pkg_utils.utils import (
 # - PkgInspect partial function to disable the 'generator' attribute
 _PkgI: PkgInspect = partial(PkgInspect, generator=False)
 
-# - Tuple of available fieldnames for inspection
-INSPECTION_FIELDS: tuple[str] = _PkgI().get_fieldnames
+# - Tuple of available fieldnames for inspection ('INSPECTION_FIELDS')
+#   Resolved from the 'PkgInspect' field registry on first access (see '__getattr__').
+def _inspection_fields() -> tuple[str]:
+    return PkgInspect._field_registry().fields
+
+
+def __getattr__(name: str):
+    if name == "INSPECTION_FIELDS":
+        value = globals()[name] = _inspection_fields()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # - Tuple of 'PkgVersions' properties for inspections
 _PKGV_PROPS: tuple[str] = (*get_properties(PkgVersions),)
@@ -253,7 +264,7 @@ def inspect_pypi(
     options = filter_empty(_options)
 
     if _item is None:
-        if find_best_match(item, INSPECTION_FIELDS):
+        if find_best_match(item, _inspection_fields()):
             #! DO NOT REMOVE
             # For 'inspect_package' function purposes
             raise PkgException("")
@@ -273,7 +284,10 @@ def inspect_pypi(
 
         if _item == _all_items_str:
             # Return all available items in a dictionary format
-            return {k: _get_item(k) for k in _PKGV_PROPS}
+            # (served from a single instance, its pages fetched concurrently)
+            pkg_versions = PkgVersions(package, package_manager=package_manager)
+            pkg_versions.prefetch()
+            return {k: getattr(pkg_versions, k) for k in _PKGV_PROPS}
         elif _item in _PKGV_PROPS:
             # Return the requested item from the package
             return _get_item(_item)
@@ -345,6 +359,18 @@ def get_available_updates(
 
 
 # region OtherFuncs
+@__doc_handler()
+@__prettyprint()
+def check_environment(*, format: Optional[Literal["pretty"]] = ""):
+    """
+    Check the requirements of the packages installed for every interpreter (E.g `pip check`).
+
+    - Please refer to the `check_environment.__doc__` for more information on checking the requirements.
+
+    """
+    return _PkgI().check_environment()
+
+
 @__doc_handler(func_name="version_compare")
 def pkg_version_compare(
     package: str,
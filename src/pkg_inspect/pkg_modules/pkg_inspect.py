@@ -1,8 +1,18 @@
-import site
-
 from .pkg_metrics import PkgMetrics as PkgM
 from .pkg_versions import PkgVersions as PkgV
+from ..pkg_utils.dependency_graph import Conflict, DependencyGraph, ReverseDependency
+from ..pkg_utils.caching import (
+    CacheInfo,
+    LRUCache,
+    cached_method,
+    clear_instance_caches,
+    instance_cache_info,
+)
+from ..pkg_utils.discovery import InterpreterDiscovery, get_discovery
 from ..pkg_utils.exception import PkgException, RedPkgE
+from ..pkg_utils.footprint import Footprint, dist_footprint, footprints
+from ..pkg_utils.site_index import DistRecord, SiteIndex, get_site_index
+from ..pkg_utils.snapshot import ScanSnapshot, get_snapshot_registry
 from ..pkg_utils.utils import *
 
 
@@ -17,14 +27,19 @@ class _PkgInspect:
         - `package_versions`: Returns the package versions installed for each Python version.
         - `pyversions`: Returns the installed Python versions (Python version directories).
         - `installed_pythons`: Returns the installed Python versions as a `tuple[int, ...]`.
+
+    #### Methods:
+        - `check_environment`: Returns the unsatisfied requirements of the installed distributions.
     """
 
     __dict__ = {}
     __slots__ = (
-        "__weakrefs__",
+        "__weakref__",
         "_generator",
         "_workers",
         "_sort_by",
+        "_index",
+        "_discovery",
         "_pyversions",
         "_package_paths",
         "_site_packages",
@@ -38,11 +53,17 @@ class _PkgInspect:
         *,
         max_workers: int = None,
         sort_by: Union[ZeroOrOne, Literal["reverse"]] = 0,
+        site_index: SiteIndex = None,
+        discovery: InterpreterDiscovery = None,
     ) -> None:
         # Arguments
         self._generator = generator
         self._workers = max_workers
         self._sort_by = sort_by
+        # Persistent index of the site-packages directories and distributions
+        self._index = site_index or get_site_index()
+        # Engine used to locate the installed interpreters and their site-packages
+        self._discovery = discovery or get_discovery()
 
         # Attributes
         self._pyversions = None
@@ -112,94 +133,79 @@ class _PkgInspect:
             # Parse the version number if found
             return cls._vparser(version)
 
+    def _snapshot(self) -> ScanSnapshot:
+        # The scan snapshot is shared by every instance of the process
+        # (only rebuilt once stale or explicitly refreshed).
+        return get_snapshot_registry().get(self._discovery, self._index)
+
+    def refresh(self) -> None:
+        """Discard the process-wide scan snapshots so the next lookup rescans the interpreters."""
+        get_snapshot_registry().refresh()
+        self.cache_clear()
+
+    def cache_clear(self) -> None:
+        """Clear the cached results (E.g `inspect_package`) of this instance."""
+        clear_instance_caches(self)
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Return the hits, misses, maxsize and current size of each method cache of this instance."""
+        return instance_cache_info(self)
+
+    @base_exception_handler(item="the site-packages distributions")
+    def _get_distributions(self) -> Generator[tuple[Any, tuple[DistRecord, ...]], None, None]:
+        # E.g (3.12, (DistRecord('pandas', '2.2.1', '...'), ...))
+        yield from self._snapshot().distributions
+
     @base_exception_handler(item="the distinfo package-paths")
     def _get_package_paths(self) -> Generator[tuple[Any, set], Any, None]:
-        pyver_packages = (
+        yield from (
             (
                 # Python version
-                self._get_version_num(p),
-                # Generator of '.dist-info' or '.py' file package paths
-                (
-                    pkg
-                    for pkg in p.glob("*")
-                    if all(
-                        (
-                            # Check if the package is not a framework package
-                            not search(r"pyobjc", pkg),
-                            # Check if the package is a '.dist-info' or '.py' file
-                            check_sitepath_suffix(pkg),
-                        )
-                    )
-                ),
+                py_ver,
+                # Set of '.dist-info' or '.py' file package paths
+                {Path(dist.path) for dist in dists},
             )
-            for p in self._get_site_packages()
+            for py_ver, dists in self._get_distributions()
         )
 
-        # Iterate over the Python version and the package paths
-        for ver, ver_pkgs in pyver_packages:
-            # Get the package paths for the specified Python version
-            package_paths = set()
-            # Iterate over the package paths
-            for ver_pkg in ver_pkgs:
-                # Ensure that the package name is unique
-                # Some packages may be a '.py' file and a '.dist-info' path
-                pkg_name = get_package_name(ver_pkg)
-                if pkg_name not in package_paths:
-                    # Add the package name to the set
-                    # This is to ensure that the package name is unique
-                    package_paths.add(pkg_name)
-                if pkg_name in package_paths:
-                    # Remove the package name to be replaced with the package path
-                    package_paths.discard(pkg_name)
-                    # Add the package path instead
-                    package_paths.add(ver_pkg)
-            # Yield the Python version and the package paths
-            yield ver, package_paths
-
     @base_exception_handler(item="the site-packages")
     def _get_site_packages(self) -> Iterable[Path]:
         yield from (
-            v_path / v_dir.relative_to(v_path)
-            for v_path in self._get_versions()
-            for v_dir in v_path.rglob("site-packages")
+            site_dir
+            for interpreter in self._snapshot().interpreters
+            for site_dir in interpreter.site_dirs
         )
 
     @base_exception_handler(item="the python versions")
     def _get_versions(self) -> Generator[Path, None, None]:
-        sitep_path = Path(site.getsitepackages()[0]).parts
-        version_path = "/".join(sitep_path[: sitep_path.index("Versions") + 1])[1:]
-        yield from (
-            p
-            for p in Path(version_path).glob("*")
-            if p.is_dir() and self._get_version_num(p)
-        )
+        yield from (interpreter.root for interpreter in self._snapshot().interpreters)
 
     def _ver_executor(
-        self, distinfo_package: Path
+        self, distributions: Iterable[DistRecord]
     ) -> Generator[tuple[Any, str], Any, None]:
-        def _check_version(d_package) -> tuple[Any, str]:
-            package_name = get_package_name(d_package)
-            package_ver = self._get_version_num(d_package, dist_ver=True)
+        def _check_version(dist: DistRecord) -> tuple[Any, str]:
+            package_ver = None
+            if dist.version:
+                try:
+                    # Version recorded from the '.dist-info' directory name
+                    package_ver = self._vparser(dist.version)
+                except PkgException:
+                    package_ver = self._get_version_num(dist.path, dist_ver=True)
             if package_ver is None:
                 # Import the version number if the version number is not found
                 # Otherwise, will return Version("0.0.0") by default.
-                package_ver = PkgV.import_version(package_name, parse_version=True)
-            return package_name, package_ver
+                package_ver = PkgV.import_version(dist.name, parse_version=True)
+            return dist.name, package_ver
 
-        packages = executor(
-            _check_version,
-            distinfo_package,
-            max_workers=self._workers,
-        )
-        yield from sorted(packages)
+        yield from sorted(map(_check_version, distributions))
 
     def _get_package_versions(
         self,
     ) -> Generator[tuple[str, tuple[tuple[Any, str]]], None, None]:
         yield from (
             # E.g (3.12, (<packages>))
-            (py_ver, self._ver_executor(package))
-            for py_ver, package in self._get_package_paths()
+            (py_ver, self._ver_executor(dists))
+            for py_ver, dists in self._get_distributions()
         )
 
     def _get_package_names(
@@ -252,24 +258,35 @@ class _PkgInspect:
             - `PkgException`: If the package is not found in the specified Python version.
 
         """
+        # Return the package name of the distribution found
+        return self._find_distribution(py_version, package_name).name
+
+    def _find_distribution(self, py_version: str, package_name: str) -> DistRecord:
+        """
+        Find the distribution of the specified package for the specified Python version.
+
+        - Exact (normalized) names are resolved with a single dictionary lookup.
+        - Otherwise, a single fuzzy match is performed over the indexed names.
+
+        #### Raises:
+            - `PkgException`: If the package is not found in the specified Python version.
+        """
         py_version: PackageVersion = self._check_version(py_version)
-        # print(package_name)
-        package_name: str = self._fix_pkgname(package_name)
-        # print(package_name)
-        try:
-            # Check if the package is found in the specified Python version
-            return next(
-                pkg
-                for pkg in self._get_package_names(
-                    py_version=py_version, return_as_paths=False
-                )
-                if best_match(pkg, package_name)
-            )
-        except StopIteration:
-            # Raise an exception if the package is not found
-            raise PkgException(
-                f"The package ({package_name!r}) was not found in the specified Python version {py_version!r}"
-            )
+        name_index, names = self._snapshot().name_index(py_version)
+        if package_name:
+            key = normalize_name(package_name)
+            if dist := name_index.get(key):
+                return dist
+            # Fuzzy fallback over the precomputed (normalized) names
+            if match_found := process.extractOne(
+                key, names, scorer=fuzz.ratio, score_cutoff=95
+            ):
+                return name_index[match_found[0]]
+
+        # Raise an exception if the package is not found
+        raise PkgException(
+            f"The package ({package_name!r}) was not found in the specified Python version {py_version!r}"
+        )
 
     def _check_version(
         self, py_version: str, allow_none: bool = False
@@ -302,7 +319,7 @@ class _PkgInspect:
             )
         return py_version
 
-    @cache
+    @cached_method(maxsize=256)
     def _get_site_package(self, other_pkg: str = None, other_pyv: str = None) -> Path:
         """
         Get the site package for the specified Python version and package name.
@@ -310,17 +327,9 @@ class _PkgInspect:
         #### Returns:
             - `Path`: The site package for the specified Python version and package name.
         """
-        # Check if the package/pyversion is specified
-        pyv = self._check_version(other_pyv)
-        pkg = self._check_package(pyv, other_pkg)
-
         # Return the site package path for the specified package
         # Otherwise, will raise a 'PkgException' if the package is not found
-        return next(
-            distinfo_pkg
-            for distinfo_pkg in self.get_version_packages()
-            if search(pkg, get_stem(distinfo_pkg), compiler=True)
-        )
+        return Path(self._find_distribution(other_pyv, other_pkg).path)
 
     @property
     @generator_handler()
@@ -375,7 +384,7 @@ class _PkgInspect:
         return self._package_versions
 
     def _get_installed_pythons(self) -> Generator[Optional[PackageVersion], None, None]:
-        yield from (self._get_version_num(pyv) for pyv in self._get_versions())
+        yield from self._snapshot().versions()
 
     @property
     @generator_handler()
@@ -386,7 +395,7 @@ class _PkgInspect:
 
         #### Example:
 
-        >>> [PosixPath('/usr/local/Cellar/python@3.8/3.8.2_2/Frameworks/Python.framework/Versions/3.8'), ...]
+        >>> [PosixPath('/usr/lib/python3.8'), PosixPath('/root/.pyenv/versions/3.12.2/lib/python3.12'), ...]
         """
 
         if self._pyversions is None:
@@ -409,6 +418,127 @@ class _PkgInspect:
             self._installed_pythons = self._get_installed_pythons()
         return self._installed_pythons
 
+    def check_environment(self) -> Union[Iterator[Conflict], tuple[Conflict, ...]]:
+        """
+        Returns the unsatisfied requirements of the installed distributions, in every installed \
+            interpreter (E.g `pip check` for each interpreter).
+
+        - Built on the dependency graphs of the scan snapshot; the interpreters are \
+            checked one after the other and the conflicts are streamed as each interpreter is checked.
+        - Interpreters of the same Python version are checked separately (see `root`).
+        - A dependency is reported with an `installed` version of None if it is not installed.
+
+        #### Returns:
+            - `Union[Iterator[Conflict], tuple[Conflict, ...]]`: The `(pyversion, dependent, \
+                dependency, specifier, installed, root)` records (a tuple if `generator` is False).
+
+        #### Example:
+        ```python
+        >>> PkgInspect(generator=False).check_environment()
+        # Output:
+        (Conflict(pyversion=<Version('3.12')>, dependent='pandas', dependency='numpy', specifier=<SpecifierSet('>=1.26.0')>, installed=<Version('1.24.4')>, root=PosixPath('/usr/lib/python3.12')), ...)
+        ```
+        """
+        conflicts = self._snapshot().check_environment()
+        return conflicts if self._generator else (*conflicts,)
+
+
+# endregion
+
+
+# region _FieldRegistry
+# 'pypistats' fields (the 'stats-' prefix is removed for retrieval)
+_PYPISTATS_FIELDS: tuple[str, ...] = (
+    "stats-overall",
+    "stats-major",
+    "stats-minor",
+    "stats-recent",
+    "stats-system",
+    "all-pypi-stats",
+)
+# Fields retrieved by importing the package
+_IMPORT_FIELDS: tuple[str, ...] = ("doc", "source_file", "source_code")
+# Fields parsed from the 'METADATA' file
+_SHORT_FIELDS: tuple[str, ...] = ("short_license", "short_meta")
+
+# Separator runs of field aliases (E.g 'Short Meta' -> 'short_meta')
+_FIELD_SEPARATORS: Pattern = re.compile(r"[-_\s]+")
+
+
+def _field_key(field: str) -> str:
+    return _FIELD_SEPARATORS.sub("_", field.strip()).lower()
+
+
+class _FieldRegistry:
+    """
+    The inspection fields of a `PkgInspect` class and the names of their handlers.
+
+    - Fields are resolved with a dictionary lookup of their canonical name or alias \
+        (E.g 'short_meta', 'short-meta', 'Short Meta'). Fuzzy matching is only used \
+        as a fallback and its results are cached.
+
+    #### Args:
+        - `handlers` (Iterable[tuple[str, bool, Iterable[str]]]): The `(handler, validate, fields)` \
+            entries, listed by priority (the first handler of a field wins).
+        - `gh_keys` (tuple[str]): The GitHub statistics fields.
+        - `st_fields` (set[str]): The OS statistics fields.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "fields",
+        "handlers",
+        "gh_keys",
+        "st_fields",
+        "_aliases",
+        "_alias_keys",
+        "_fuzzy",
+    )
+
+    def __init__(
+        self,
+        handlers: Iterable[tuple[str, bool, Iterable[str]]],
+        *,
+        gh_keys: tuple[str, ...],
+        st_fields: set[str],
+    ) -> None:
+        # {field: (handler name, requires a validated package)}
+        self.handlers: dict[str, tuple[str, bool]] = {}
+        for handler, validate, fields in handlers:
+            for field in fields:
+                self.handlers.setdefault(field, (handler, validate))
+        self.fields: tuple[str, ...] = (*sorted(self.handlers),)
+        self.gh_keys = gh_keys
+        self.st_fields = st_fields
+
+        # {alias: field}
+        self._aliases: dict[str, str] = {}
+        for field in self.handlers:
+            self._aliases.setdefault(_field_key(field), field)
+        self._alias_keys = (*self._aliases,)
+        self._fuzzy = LRUCache(maxsize=256)
+
+    def resolve(self, item: str) -> Optional[str]:
+        """Return the inspection field matching the specified item (or None)."""
+        if item in self.handlers:
+            return item
+        key = _field_key(item)
+        if (field := self._aliases.get(key)) is not None:
+            return field
+
+        # Fuzzy fallback (None results are cached as well)
+        if (field := self._fuzzy.get(key, False)) is False:
+            match_found = process.extractOne(
+                key, self._alias_keys, scorer=fuzz.ratio, score_cutoff=85
+            )
+            field = self._aliases[match_found[0]] if match_found else None
+            self._fuzzy.set(key, field)
+        return field
+
+
+# {PkgInspect class: field registry}
+_FIELD_REGISTRIES: dict[type, _FieldRegistry] = {}
+
 
 # endregion
 
@@ -425,6 +555,10 @@ class PkgInspect(_PkgInspect):
         - `max_workers` (int): The maximum number of workers to use for concurrent execution.
             (`ThreadPoolExecutor`)
         - `sort_by` (Union[ZeroOrOne, Literal["reverse"]]): A value indicating whether to sort the distributions.
+        - `site_index` (SiteIndex): The persistent site-packages index to read distributions from.
+            - Defaults to the process-wide index stored under `CACHE_DIR`.
+        - `discovery` (InterpreterDiscovery): The engine used to locate the installed interpreters.
+            - Defaults to the process-wide discovery engine.
 
     #### Properties:
         - `package_paths` (Iterable[Path]): Property for site-package paths for each python version.
@@ -434,15 +568,27 @@ class PkgInspect(_PkgInspect):
 
     #### Methods:
         - `inspect_package`: Inspect details of an installed Python package.
+        - `dependency_graph`: Return the dependency graph of the installed distributions.
+        - `dependents`: Return the installed distributions requiring a package (every Python version).
+        - `check_environment`: Return the unsatisfied requirements of the installed distributions.
+        - `footprints`: Return the installed bytes and files of every distribution of the Python version.
+        - `refresh`: Discard the process-wide scan snapshots (E.g after installing a package).
+        - `cache_clear`: Clear the cached results of the instance.
+        - `cache_info`: Return the statistics of each method cache of the instance.
+
+    #### Note:
+        - The installed interpreters and distributions are scanned once per process and \
+            shared by every instance (see `SnapshotRegistry`). The snapshot is rebuilt \
+            once older than `max_age` seconds (Default: 30, `PKG_INSPECT_SNAPSHOT_TTL`).
     """
 
     __dict__ = {}
-    __slots__ = ("__weakrefs__", "_pyversion", "_pkg", "__pipm")
+    __slots__ = ("_pyversion", "_pkg", "__pipm")
 
     def __init__(
         self, package: PathOrStr = None, pyversion: str = None, **kwargs
     ) -> None:
-        # kwargs: 'generator', 'max_workers', 'sort_by'
+        # kwargs: 'generator', 'max_workers', 'sort_by', 'site_index', 'discovery'
         super().__init__(**kwargs)
         self._pyversion = self._check_version(pyversion, allow_none=True)
         self._pkg = self._fix_pkgname(package)
@@ -498,7 +644,7 @@ class PkgInspect(_PkgInspect):
             _musthave("_pyversion")
             _musthave("_pkg")
 
-    @cache
+    @cached_method(maxsize=128)
     def _import_meta(
         self, package: str = None, *, item: str = None
     ) -> Union[str, Any, None]:
@@ -540,7 +686,7 @@ class PkgInspect(_PkgInspect):
                         return has_doc(possible_pkg)
 
     @staticmethod
-    @cache
+    @lru_cache(maxsize=128)
     def __short_metadata(metadata_contents: str) -> dict[str, str]:
         # Parse the metadata contents
         # into a dictionary of the most important metadata fields.
@@ -607,7 +753,7 @@ class PkgInspect(_PkgInspect):
             _join_contents(_rs, contents=short_m)
         return short_m_contents
 
-    @cache
+    @cached_method(maxsize=128)
     def inspect_package(self, itemOrfile: str = "") -> Optional[Any]:
         """
         This method can be used to extract specific details about an installed Python package.
@@ -677,6 +823,7 @@ class PkgInspect(_PkgInspect):
                             - `isinstalled_version` (bool): Returns True if the package is the installed version.
                             - `installed_version` (PackageVersion): Returns the installed version of the package.
                             - `available_updates` (TupleOfPkgVersions): Returns the available updates of the package.
+                            - `footprint` (Footprint): Returns the installed bytes and files of the package (from its RECORD file).
 
                         - `PkgVersions fields`: Possible Fields from the `PkgVersions` class.
                             - `initial_version` (PackageVersion): Returns the initial version of the package.
@@ -703,7 +850,10 @@ class PkgInspect(_PkgInspect):
                         
                         - `PkgMetrics fields`: Possible Fields from the `PkgMetrics` class.
                             - `all_metric_stats` (dict[str, Any]): Returns all the OS statistics of the package.
-                            - `total_size` (int): Returns the total size of the package.
+                            - `total_size` (int): Returns the total installed size of the package \
+                                (see `footprint`; the size of the '.dist-info' directory if it has no RECORD file).
+                            - `st_fsize` (NamedTuple): Returns the size of the '.dist-info' directory entry itself \
+                                (not the installed files; see `total_size`).
                             - `date_installed` (datetime): Returns the date the package was installed.
                                 - NOTE: Will return either the 'st_birthtime' or 'st_ctime' of the package \
                                     depending on the OS.
@@ -740,144 +890,165 @@ class PkgInspect(_PkgInspect):
                 f"({itemOrfile = }) is not a valid option item for inspection and must be a string-type value."
             )
 
-        # All options for inspection fields
-        insp_fields: tuple[str] = (
-            (empty := ""),
-            (sp := "site_path"),
-            *METADATA_FIELDS,
-            *(shorts := ("short_license", "short_meta")),
-            *(pkgv_props := (*get_properties(PkgV), *(gh_keys := PkgV.gh_stat_keys()))),
-            *(
-                inspect_fields := (
-                    "doc",
-                    "source_file",
-                    "source_code",
-                )
-            ),
-            *(
-                pkgm_props := (
-                    (di := "date_installed"),
-                    *get_properties(PkgM),
-                    *(st_fields := self.__pipm().get_metrickeys),
-                )
-            ),
-            *(
-                pkgi_props := (
-                    *{
-                        (gvp := "get_version_packages"),
-                        *get_properties(PkgInspect),
-                        *(__pkgi_props := (*get_properties(__pkgi := _PkgInspect),)),
-                    },
-                )
-            ),
-            *(
-                pypistats_props := (
-                    "stats-overall",
-                    *(mm := ("stats-major", "stats-minor")),
-                    "stats-recent",
-                    "stats-system",
-                    aps := "all-pypi-stats",
-                )
+        fields = self._field_registry()
+        _item: Optional[str] = fields.resolve(itemOrfile)
+        if itemOrfile == "" or _item == "get_fieldnames":
+            # Return the inspection fields if no item is specified
+            return [*fields.fields]
+
+        # Any other item is treated as a file name within the packages directory
+        handler, validate = fields.handlers.get(_item, ("_inspect_files", True))
+        if validate:
+            # The following options require the package and/or Python version
+            # to be specified and validated.
+            self.__validate_pkg()
+        return getattr(self, handler)(_item, itemOrfile)
+
+    @classmethod
+    def _field_registry(cls) -> _FieldRegistry:
+        # The inspection fields are only computed once per class
+        if (registry := _FIELD_REGISTRIES.get(cls)) is None:
+            registry = _FIELD_REGISTRIES.setdefault(
+                cls,
+                _FieldRegistry(
+                    # Handlers are listed by priority (first match wins)
+                    (
+                        # Seperating '_PkgInspect' fields
+                        # to prevent from validating unrelevant args.
+                        (
+                            "_inspect_base",
+                            False,
+                            ("get_version_packages", *get_properties(_PkgInspect)),
+                        ),
+                        ("_inspect_pypistats", False, _PYPISTATS_FIELDS),
+                        (
+                            "_inspect_versions",
+                            True,
+                            (*get_properties(PkgV), *PkgV.gh_stat_keys()),
+                        ),
+                        ("_inspect_attribute", True, (*get_properties(cls),)),
+                        ("_inspect_import", True, _IMPORT_FIELDS),
+                        ("_inspect_site_path", True, ("site_path",)),
+                        (
+                            "_inspect_metrics",
+                            True,
+                            (
+                                "date_installed",
+                                *get_properties(PkgM),
+                                *(st_fields := PkgM().get_metrickeys),
+                            ),
+                        ),
+                        ("_inspect_files", True, (*METADATA_FIELDS, *_SHORT_FIELDS)),
+                    ),
+                    gh_keys=PkgV.gh_stat_keys(),
+                    st_fields=st_fields,
+                ),
+            )
+        return registry
+
+    def _inspect_base(self, item: str, *_) -> Any:
+        if item == "get_version_packages":
+            return getattr(self, item)(return_as_paths=True)
+        return getattr(
+            _PkgInspect(
+                generator=False, site_index=self._index, discovery=self._discovery
             ),
+            item,
         )
 
-        _item: Optional[Any] = find_best_match(itemOrfile, insp_fields)
-        if itemOrfile == empty or _item == "get_fieldnames":
-            # Return the metadata fields if no item is specified
-            return filter_empty(insp_fields)
-
-        # Seperating '_PkgInspect' conditional statements
-        # to prevent from validating unrelevant args.
-        if _item in (gvp, *__pkgi_props):
-            if _item == gvp:
-                return getattr(self, _item)(return_as_paths=True)
-            return getattr(__pkgi(generator=False), _item)
-
-        elif _item in pypistats_props:
-            # Check if the package is specified
-            self.__check_attrs(attr="_pkg")
-            rm_stats_prefix = partial(remove_prefix, prefix="stats-")
-
-            @exception_handler(
-                msg=f"The 'pypistats' module must be installed to retrieve the {_item!r} item.",
-                exceptions=(AttributeError, ModuleNotFoundError),
-                raise_with=ModuleNotFoundError,
-            )
-            def _get_pypistat(item_obj):
-                # Return the specified item from the 'pypistats' module into a dictionary.
-                import pypistats
+    def _inspect_pypistats(self, item: str, *_) -> dict[str, Any]:
+        # Check if the package is specified
+        self.__check_attrs(attr="_pkg")
+        rm_stats_prefix = partial(remove_prefix, prefix="stats-")
+        mm, aps = _PYPISTATS_FIELDS[1:3], _PYPISTATS_FIELDS[-1]
 
-                p_stats_json = json.loads(
-                    getattr(pypistats, item_obj)(self._pkg, format="json")
-                )
-                return {p_stats_json["type"]: p_stats_json["data"]}
-
-            def _fix_keys(item_obj):
-                if item_obj in map(rm_stats_prefix, mm):
-                    item_obj = "python_" + item_obj
-                return item_obj
-
-            # Check if the item is a property of the 'pypistats' module
-            if _item != aps:
-                _item = rm_stats_prefix(_item)
-
-            # Fix the keys for the statistics
-            _item = _fix_keys(_item)
-
-            if _item == aps:
-                # Return all the statistics from the 'pypistats' module
-                # in a dictionary format.
-                full_pypi_stats = {}
-                _pypi_methods = [
-                    *map(rm_stats_prefix, pypistats_props),
-                ]
-                # Iterate over the 'pypistats' module properties
-                for m in _pypi_methods:
-                    # Fix the keys for the statistics
-                    m = _fix_keys(m)
-                    if m != aps:
-                        # Update the dictionary with the statistics
-                        full_pypi_stats.update(**_get_pypistat(m))
-                # Return the full statistics
-                return full_pypi_stats
-            # Otherwise, return the specified item from the 'pypistats' module
-            return _get_pypistat(_item)
-
-        # The following options require the package and/or Python version
-        # to be specified and validated.
-        self.__validate_pkg()
-
-        if _item in pkgv_props:
-            get_pkgv = lambda it: getattr(self.__pipv(), it)
-            if _item in gh_keys or _item == (gh_stats_str := "github_stats"):
-                gh_stats = get_pkgv(gh_stats_str)
-                if _item == gh_stats_str:
-                    return gh_stats
-                return gh_stats[_item]
-            # Check if the item is a property of the 'PkgVersions' class
-            return get_pkgv(_item)
-        elif _item in pkgi_props:
-            return getattr(self, _item)
-        elif _item in inspect_fields:
-            # Return the source file for the specified package
-            return self._import_meta(self._pkg, item=_item)
+        @exception_handler(
+            msg=f"The 'pypistats' module must be installed to retrieve the {item!r} item.",
+            exceptions=(AttributeError, ModuleNotFoundError),
+            raise_with=ModuleNotFoundError,
+        )
+        def _get_pypistat(item_obj):
+            # Return the specified item from the 'pypistats' module into a dictionary.
+            import pypistats
 
+            p_stats_json = json.loads(
+                getattr(pypistats, item_obj)(self._pkg, format="json")
+            )
+            return {p_stats_json["type"]: p_stats_json["data"]}
+
+        def _fix_keys(item_obj):
+            if item_obj in map(rm_stats_prefix, mm):
+                item_obj = "python_" + item_obj
+            return item_obj
+
+        # Check if the item is a property of the 'pypistats' module
+        if item != aps:
+            item = rm_stats_prefix(item)
+
+        # Fix the keys for the statistics
+        item = _fix_keys(item)
+
+        if item == aps:
+            # Return all the statistics from the 'pypistats' module
+            # in a dictionary format.
+            full_pypi_stats = {}
+            _pypi_methods = [
+                *map(rm_stats_prefix, _PYPISTATS_FIELDS),
+            ]
+            # Iterate over the 'pypistats' module properties
+            for m in _pypi_methods:
+                # Fix the keys for the statistics
+                m = _fix_keys(m)
+                if m != aps:
+                    # Update the dictionary with the statistics
+                    full_pypi_stats.update(**_get_pypistat(m))
+            # Return the full statistics
+            return full_pypi_stats
+        # Otherwise, return the specified item from the 'pypistats' module
+        return _get_pypistat(item)
+
+    def _inspect_versions(self, item: str, *_) -> Any:
+        # Check if the item is a property of the 'PkgVersions' class
+        get_pkgv = lambda it: getattr(self.__pipv(), it)
+        if item in self._field_registry().gh_keys or item == (
+            gh_stats_str := "github_stats"
+        ):
+            gh_stats = get_pkgv(gh_stats_str)
+            if item == gh_stats_str:
+                return gh_stats
+            return gh_stats[item]
+        return get_pkgv(item)
+
+    def _inspect_attribute(self, item: str, *_) -> Any:
+        return getattr(self, item)
+
+    def _inspect_import(self, item: str, *_) -> Optional[str]:
+        # Return the source file for the specified package
+        return self._import_meta(self._pkg, item=item)
+
+    def _inspect_site_path(self, *_) -> Path:
+        # Return the site path for the specified package
+        return self.get_site_package()
+
+    def _inspect_metrics(self, item: str, *_) -> Any:
+        # Check if the item is a property of the 'PkgMetrics' class
+        site_path = self.get_site_package()
+        if item == "total_size" and (footprint := dist_footprint(site_path)) is not None:
+            # The installed bytes (RECORD file), not the size of the '.dist-info' directory
+            return bytes_converter(footprint.size)
+        pkgm_cls = self.__pipm(alter_if_string(site_path))
+        if item == "date_installed":
+            # Return the date the package was installed
+            return pkgm_cls.date_installed(self._pkg)
+        elif item in self._field_registry().st_fields:
+            return pkgm_cls.all_metric_stats[self._pkg].get(item)
+        # Otherwise, return the specified field from the 'PkgMetrics' class
+        return getattr(pkgm_cls, item)
+
+    def _inspect_files(self, _item: Optional[str], itemOrfile: str) -> Optional[Any]:
         # dist-info site path
         site_path: Path = self.get_site_package()
-
-        if _item == sp:
-            # Return the site path for the specified package
-            return site_path
-        elif _item in pkgm_props:
-            # Check if the item is a property of the 'PkgMetrics' class
-            pkgm_cls = self.__pipm(alter_if_string(site_path))
-            if _item == di:
-                # Return the date the package was installed
-                return pkgm_cls.date_installed(self._pkg)
-            elif _item in st_fields:
-                return pkgm_cls.all_metric_stats[self._pkg].get(_item)
-            # Otherwise, return the specified field from the 'PkgMetrics' class
-            return getattr(pkgm_cls, _item)
+        shorts = _SHORT_FIELDS
 
         # Read the contents of the specified file
         read_file = lambda fp: iread(site_path / fp)
@@ -1015,6 +1186,57 @@ class PkgInspect(_PkgInspect):
         # Otherwise, return the item for both versions of the package
         return (*next(self_and_other),)
 
+    def dependency_graph(self) -> DependencyGraph:
+        """
+        Return the dependency graph of the distributions installed for the specified Python version.
+
+        - Built from the `Requires-Dist` metadata of every distribution (markers evaluated \
+            for the Python version) and cached with the scan snapshot.
+        - Each interpreter has its own graph (see `graph.interpreter`); if several interpreters \
+            share the Python version, the first one (sorted by root) is used.
+
+        #### Example:
+        ```python
+        >>> graph = PkgInspect(pyversion="3.12").dependency_graph()
+        >>> graph.closure("pandas")
+        # Output:
+        ('numpy', 'python-dateutil', 'pytz', 'six', 'tzdata')
+        ```
+
+        #### Raises:
+            - `PkgException`: If the Python version is not specified or not installed.
+        """
+        self.__check_attrs("_pyversion")
+        return self._snapshot().dependency_graph(self._check_version(self._pyversion))
+
+    def dependents(self, package: str = None) -> tuple[ReverseDependency, ...]:
+        """
+        Return the installed distributions requiring the specified package, in every installed interpreter.
+
+        - The reverse-dependency index is built once per scan snapshot; \
+            each lookup is then a single dictionary lookup.
+
+        #### Args:
+            - `package` (str, optional): The package name. Defaults to the inspected package.
+
+        #### Returns:
+            - `tuple[ReverseDependency, ...]`: The `(pyversion, dependent, specifier, root)` records \
+                (sorted by Python version, interpreter root and dependent).
+
+        #### Example:
+        ```python
+        >>> PkgInspect("numpy").dependents()
+        # Output:
+        (ReverseDependency(pyversion=<Version('3.12')>, dependent='pandas', specifier=<SpecifierSet('>=1.26.0')>, root=PosixPath('/usr/lib/python3.12')), ...)
+        ```
+
+        #### Raises:
+            - `PkgException`: If no package is specified.
+        """
+        if not (package := package or self._pkg):
+            raise PkgException("The package to find the dependents of must be specified.")
+        return self._snapshot().dependents(package)
+
     def get_site_package(self) -> Path:
         """
         Get the site package for the specified Python version and package name.
@@ -1077,6 +1299,47 @@ class PkgInspect(_PkgInspect):
         """Return the installed version of the specified package."""
         return self._get_version_num(self.get_site_package(), dist_ver=True)
 
+    @property
+    def footprint(self) -> Footprint:
+        """
+        Return the on-disk footprint (installed bytes and files) of the specified package.
+
+        - Read from the `RECORD` file of the package (every installed file, not only \
+            the '.dist-info' directory) and cached against its modification time.
+
+        #### Example:
+        >>> PkgInspect("pandas", "3.12").footprint
+        >>> Footprint(size=70931415, files=2207, missing=0)
+
+        #### Raises:
+            - `PkgException`: If the package has no `RECORD` file (E.g a '.py' module).
+        """
+        site_path = self.get_site_package()
+        if (footprint := dist_footprint(site_path)) is None:
+            raise PkgException(
+                f"The footprint of {self._pkg!r} could not be read (no RECORD file in {site_path})."
+            )
+        return footprint
+
+    def footprints(self) -> dict[str, Optional[Footprint]]:
+        """
+        Return the on-disk footprint of every distribution installed for the specified Python version.
+
+        - The `RECORD` files are read in parallel (see `footprint`).
+
+        #### Returns:
+            - `dict[str, Optional[Footprint]]`: The footprint of each distribution name \
+                (None if it has no `RECORD` file).
+
+        #### Raises:
+            - `PkgException`: If the Python version is not specified or not installed.
+        """
+        self.__check_attrs("_pyversion")
+        name_index, _ = self._snapshot().name_index(self._check_version(self._pyversion))
+        dists = [d for d in name_index.values() if d.path.endswith(".dist-info")]
+        by_path = footprints((d.path for d in dists), max_workers=self._workers)
+        return {d.name: by_path[d.path] for d in dists}
+
     @cached_property
     @generator_handler(is_string=True)
     def get_fieldnames(self) -> tuple[str]:
@@ -55,7 +55,7 @@ class PkgMetrics(Iterable):
 
     __dict__ = {}
     __slots__ = (
-        "__weakrefs__",
+        "__weakref__",
         "_paths",
         "_full_posix",
         "_workers",
@@ -309,6 +309,9 @@ class PkgMetrics(Iterable):
         """
         Retrieves the total size of all specified paths in a `NamedTuple` with human-readable format.
 
+        - The `st_size` of each path itself: for a '.dist-info' directory, this is the size of \
+            the metadata directory entry, not of the installed files (see `PkgInspect.footprint`).
+
         #### Returns:
             - `NamedTuple`: A NamedTuple containing the total stats of all specified paths with human-readable format.
         """
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-import importlib_metadata
-from bs4 import BeautifulSoup
+from contextlib import contextmanager
 
 from ..pkg_utils.utils import *
+from ..pkg_utils.caching import (
+    CacheInfo,
+    cached_method,
+    clear_instance_caches,
+    instance_cache_info,
+)
 from ..pkg_utils.exception import PkgException, RedPkgE
+from ..pkg_utils.index_backends import (
+    HTMLHistoryBackend,
+    IndexBackend,
+    ReleaseRecord,
+    get_backends,
+)
+from ..pkg_utils.release_dates import parse_release_date
+from ..pkg_utils.util_types import AsyncIterator, Coroutine
+from ..pkg_utils.version_index import VersionIndex
 
 
 # region _DateTime
@@ -48,7 +62,7 @@ class _DateTime(Iterable):
     DATE_W_TIME: str = DATE_ONLY + "T%I:%M:%S %p"
 
     __dict__ = {}
-    __slots__ = ("__weakrefs", "_date", "_seconds", "_wt")
+    __slots__ = ("__weakref__", "_date", "_seconds", "_wt")
 
     def __init__(
         self, seconds: IntOrFloat = None, date: str = None, with_time: bool = False
@@ -86,6 +100,9 @@ class _DateTime(Iterable):
     @classmethod
     def _strptime(cls, dt_, dt_format: str = None) -> datetime:
         dtf = dt_format or cls.DATE_ONLY
+        if dtf == cls.DATE_ONLY:
+            # Month lookup table instead of 'strptime' (E.g 'Jan 1, 2021')
+            return parse_release_date(dt_)
         return datetime.strptime(dt_, dtf)
 
     @classmethod
@@ -187,13 +204,15 @@ class _DateTimeVersions(_DateTime):
 
     MIN_VERSION: str = "0.0.0"
 
+    # The parsed minimum date and version (E.g `__str__` omits unspecified items)
+    _MIN_DT: datetime = _DateTime._strptime(_DateTime.MIN_DATE)
+    _MIN_VN: PackageVersion = intern_version(MIN_VERSION)
+
     __dict__ = {}
     __slots__ = (
-        "__weakrefs__",
-        "__datet",
-        "__pipv",
         "_d",
         "_v",
+        "_key",
     )
 
     def __init__(
@@ -202,26 +221,32 @@ class _DateTimeVersions(_DateTime):
         version: str = "0.0.0",
         with_time: bool = False,
     ) -> None:
-        self._d = self._validate_dtv(date)
-        self._v = self._validate_dtv(version, is_version=True)
         self._wt = with_time
-
-        # `PkgVersions` is not inherited to avoid possible circular imports
-        self.__pipv = PkgVersions
-        self.__datet = self.__class__.__base__
+        # The date and version are parsed once (eagerly) and stored with their sort key,
+        # so that comparisons, sorting and hashing never parse again.
+        self._d: datetime = self._parse_date(
+            self._validate_dtv(date), with_time=with_time
+        )
+        self._v: PackageVersion = PkgVersions.parse_version(
+            self._validate_dtv(version, is_version=True)
+        )
+        self._key: tuple[datetime, PackageVersion] = self._d, self._v
 
     def __iter__(self) -> Iterator[DateTimeAndVersion]:
-        return iter((self.date, self.version))
+        return iter(self._key)
 
     def __getitem__(self, num: int) -> DateTimeAndVersion:
         try:
             # self: (date, version)
-            return (*self,)[num]
+            return self._key[num]
         except IndexError as idxe:
             raise idxe
 
+    def __len__(self) -> int:
+        return 2
+
     def __hash__(self) -> int:
-        return super().__hash__()
+        return hash(self._key)
 
     def __str__(self) -> str:
         """
@@ -239,10 +264,8 @@ class _DateTimeVersions(_DateTime):
                     - `parsed_version`: <Version('2.25.1')> (string representation)
         """
 
-        valid_date = self.__pipv.compare_dates(self.date, self.MIN_DATE, "ne")
-        valid_version = self.__pipv.compare_versions(
-            self.base_version, self.MIN_VERSION, "ne"
-        )
+        valid_date = self._d != self._MIN_DT
+        valid_version = self._v != self._MIN_VN
 
         if all((valid_date, valid_version)):
             return f"{(self.__format__('dt'), self.__format__('vn'))}"
@@ -299,23 +322,22 @@ class _DateTimeVersions(_DateTime):
             - If the release dates are not equal, the release dates are compared.
         """
 
+        # E.g 'operator.lt', 'operator.eq', ...
+        op: operator[Any] = get_opmethod(op_method)
+
         def decorator(func):
-            @wraps(func)
-            def wrapper(self, __other: Union[_DateTimeVersions, Any]):
-                # E.g 'operator.lt', 'operator.eq', ...
-                op: operator[Any] = get_opmethod(op_method)
+            if version_only:
 
-                if version_only:
+                @wraps(func)
+                def version_wrapper(self, __other: Any):
                     v1, v2 = func(self, __other)
-                    if "__pipv" in self.__slots__:
-                        vparser = self.__pipv.parse_version
-                    else:
-                        vparser = self.parse_version
-                    return op(v1.version, vparser(v2))
-
-                if all(
-                    map(lambda x: not isinstance(x, _DateTimeVersions), (self, __other))
-                ):
+                    return op(v1.version, PkgVersions.parse_version(v2))
+
+                return version_wrapper
+
+            @wraps(func)
+            def wrapper(self, __other: Union[_DateTimeVersions, Any]):
+                if not isinstance(__other, _DateTimeVersions):
                     # Raise a `PkgException` if the specified object is not an instance of `_DateTimeVersions`.
                     raise PkgException(
                         "The specified objects must be an instance of '_DateTimeVersions'."
@@ -323,24 +345,9 @@ class _DateTimeVersions(_DateTime):
                         f"\n{type(self) = }"
                         f"\n{type(__other) = }"
                     )
-
-                # E.g 'operator.lt', 'operator.eq', ...
-                # op: operator[Any] = get_opmethod(op_method)
-                if all(self) and all(__other):
-                    # Compare the release dates and versions
-                    # If the release dates are equal, compare the versions
-                    return (
-                        op(self.date, __other.date),
-                        op(self.version, __other.version),
-                    )[self.date == __other.date]
-
-                if all((self.date, __other.date)):
-                    # Compare the release dates only
-                    return op(self.date, __other.date)
-
-                if all((self.version, __other.version)):
-                    # Compare the versions only
-                    return op(self.version, __other.version)
+                # Compare the release dates and, if equal, the versions
+                # E.g (self.date, self.version) < (__other.date, __other.version)
+                return op(self._key, __other._key)
 
             return wrapper
 
@@ -492,7 +499,7 @@ class _DateTimeVersions(_DateTime):
                 "The specified 'date' and 'version' arguments cannot be None."
             )
 
-        if not isinstance(dtv, (datetime, package_version.Version, IntOrFloatOrStr)):
+        if not isinstance(dtv, (datetime, package_version.Version, int, float, str)):
             # Raise a `PkgException` if the specified date or version is not a valid instance
             raise PkgException(
                 "The specified 'date' and 'version' arguments are considered invalid."
@@ -513,17 +520,17 @@ class _DateTimeVersions(_DateTime):
     @property
     def date(self) -> datetime:
         """Return the parsed release date of the package."""
-        return self.__datet(date=self._d, with_time=self._wt).dt_date
+        return self._d
 
     @property
     def version(self) -> PackageVersion:
         """Return the parsed version of the package."""
-        return self.__pipv.parse_version(self._v)
+        return self._v
 
     @property
     def base_version(self) -> str:
         """Return the base version of the package."""
-        return self.version.base_version
+        return self._v.base_version
 
     @property
     def distribution(self) -> tuple[datetime, PackageVersion]:
@@ -550,9 +557,7 @@ class _DateTimeVersions(_DateTime):
 
     @property
     def default_distributions(self) -> tuple[datetime, PackageVersion]:
-        return self._parse_date(self.MIN_DATE), self.__pipv.parse_version(
-            self.MIN_VERSION
-        )
+        return self._MIN_DT, self._MIN_VN
 
 
 # endregion
@@ -560,19 +565,23 @@ class _DateTimeVersions(_DateTime):
 
 class _DtvRepr(Iterable):
     __slots__ = (
-        "__weakrefs__",
+        "__weakref__",
         "__dtv",
     )
 
     def __init__(self, __dtv) -> None:
-        self.__dtv = (_DateTimeVersions(*i) for i in __dtv)
+        # Materialized once (the history can be iterated any number of times)
+        self.__dtv = (*(_DateTimeVersions(*i) for i in __dtv),)
 
     def __iter__(self) -> Iterator:
         return iter(self.__dtv)
 
+    def __len__(self) -> int:
+        return len(self.__dtv)
+
     def __getitem__(self, num: int) -> DateTimeAndVersion:
         try:
-            return (*self,)[num]
+            return self.__dtv[num]
         except IndexError as idxe:
             raise idxe
 
@@ -600,6 +609,9 @@ class PkgVersions:
                 - `1`: Sort the version history by the package versions.
                 - `reverse`: Reverse the sorting order.
             - Defaults to 'versions'.
+        - `backends` (Iterable[IndexBackend], optional): The index backends to build the version history from.
+            - The backends are tried in order until one succeeds.
+            - Defaults to the PyPI JSON API, the PEP 691 Simple API and the `#history` page (see `index_backends`).
 
     ### Attributes:
         - `API` (str): The API endpoint for fetching package versions.
@@ -612,6 +624,12 @@ class PkgVersions:
         - `is_latest`: Property to check if the specified version is the latest version.
         - `total_versions`: Property containing the total number of versions in the version history.
         - `get_updates`: Method to retrieve the available updates for the specified package.
+        - `bulk`: Method to fetch the version histories of many packages concurrently.
+        - `prefetch`: Method to fetch every upstream page of the package concurrently.
+        - `bulk_async`: Asynchronous counterpart of `bulk`.
+        - `versions_between`: Method to retrieve the released versions within a range.
+        - `cache_clear`: Method to clear the cached responses of the instance.
+        - `cache_info`: Method to retrieve the statistics of each method cache of the instance.
 
     ### Example:
     ```python
@@ -630,7 +648,7 @@ class PkgVersions:
     # Example: "Jan 1, 2021"
     # This pattern is specifically designed for the `PkgVersions` class to accurately match release dates
     # when parsing package version history release dates from PyPI.
-    DATE_PATTERN: Pattern = r"[A-Z][a-z]{2}\s\d{1,2},\s\d{4}"
+    DATE_PATTERN: Pattern = HTMLHistoryBackend.DATE_PATTERN
 
     # Pattern for matching package versions
     # - The pattern matches the version number in the format 'x.x' or 'x.x.x'.
@@ -640,7 +658,7 @@ class PkgVersions:
     # Examples:
     #       1. "1.5"
     #       2. "4.25.1"
-    VERSION_PATTERN: Pattern = r"\d+\.\d+(\.\d+)?"
+    VERSION_PATTERN: Pattern = HTMLHistoryBackend.VERSION_PATTERN
 
     # TODO: Implement beta versions
     BETA_VERSION_PATTERN: Pattern = r"(beta|dev|pre[-_ ]?release|rc)"
@@ -651,12 +669,13 @@ class PkgVersions:
 
     __dict__ = {}
     __slots__ = (
-        "__weakrefs__",
+        "__weakref__",
         "_pkg_name",
         "_pkg_manager",
         "_pkg_url",
         "_pkg_path",
         "_sort_by",
+        "_backends",
         "_vhistory",
         "_initial",
         "_latest",
@@ -674,6 +693,7 @@ class PkgVersions:
         package_manager: str = None,
         *,
         sort_by: Union[DatesOrVersions, ZeroOrOne] = "versions",
+        backends: Iterable[IndexBackend] = None,
     ) -> None:
         # Example: `PkgVersions("pandas") < PkgVersions("pandas")`
         # Compares the latest version of the specified package with the latest version of the other package
@@ -683,6 +703,7 @@ class PkgVersions:
         self._pkg_manager = package_manager
         self._sort_by = sort_by
         self._pkg_path = self._validate_package(self._pkg_name)
+        self._backends = (*backends,) if backends else get_backends()
 
         # Data Properties
         self._vhistory = None  # Version History
@@ -700,7 +721,7 @@ class PkgVersions:
 
     def __len__(self) -> int:
         """Return the total number of versions in the version history."""
-        return len((*self._version_history(),))
+        return len(self._version_index())
 
     def __sizeof__(self) -> int:
         """Return the total number of versions in the version history."""
@@ -721,6 +742,14 @@ class PkgVersions:
         """Return the hash value of the version history."""
         return hash(self.version_history)
 
+    def cache_clear(self) -> None:
+        """Clear the cached responses (E.g the version history page) of this instance."""
+        clear_instance_caches(self)
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Return the hits, misses, maxsize and current size of each method cache of this instance."""
+        return instance_cache_info(self)
+
     @classmethod
     def import_version(
         cls, package_name: str, *, parse_version: bool = False
@@ -735,6 +764,7 @@ class PkgVersions:
         ### Returns:
             - `Union[version.Version, str]`: The version of the specified package.
         """
+        importlib_metadata = lazy_import("importlib_metadata")
         try:
             # Retrieve the version of the specified package
             found_ver = importlib_metadata.version(package_name)
@@ -846,10 +876,8 @@ class PkgVersions:
             # Parse the version using the `packaging.version` module
             if version is None:
                 version = PkgVersions.MIN_VERSION
-            parsed_version: PackageVersion = package_version.parse(version)
-            return [parsed_version, getattr(parsed_version, "base_version")][
-                return_base
-            ]
+            parsed_version: PackageVersion = intern_version(version)
+            return parsed_version.base_version if return_base else parsed_version
         except (*BASE_EXCEPTIONS, package_version.InvalidVersion):
             raise RedPkgE(
                 f"The specified {version = } is not a valid version format to parse."
@@ -933,14 +961,50 @@ class PkgVersions:
             items=(current_dt, other_dt), op_method=op_method, item_type="dates"
         )
 
-    @cache
+    @cached_method(maxsize=32)
     def _main_request(self, url: PathOrStr, parse_html: bool = True) -> Union[str, Any]:
         """Return the main asynchronous request for the version history page (#history) of the specified package."""
-        try:
-            url_contents = asyncio.run(url_request(url))
-            if parse_html:
-                url_contents = self._parse_html(url_contents)
+        from ..pkg_utils.loop_runner import get_loop_runner
+
+        with self._request_errors(url):
+            url_contents = get_loop_runner().run(url_request(url))
+        return self._parse_html(url_contents) if parse_html else url_contents
+
+    async def request_async(
+        self, url: PathOrStr, parse_html: bool = True
+    ) -> Union[str, Any]:
+        """
+        Await the contents of the specified url (from any running event loop).
+
+        - The request is executed on the shared background event loop, \
+            so the caller's event loop is never blocked.
+        - The contents are parsed in the default executor of the running event loop \
+            (never on the event loop thread itself).
+
+        #### Args:
+            - `url` (PathOrStr): The url to request.
+            - `parse_html` (bool, optional): Whether to parse the contents with `BeautifulSoup`. Defaults to True.
+
+        #### Returns:
+            - `Union[str, BeautifulSoup]`: The (parsed) contents of the url.
+
+        #### Raises:
+            - `PkgException`: If the url could not be found.
+        """
+        from ..pkg_utils.loop_runner import get_loop_runner
+
+        with self._request_errors(url):
+            url_contents = await get_loop_runner().run_async(url_request(url))
+        if not parse_html:
             return url_contents
+        loop = lazy_import("asyncio").get_running_loop()
+        return await loop.run_in_executor(None, self._parse_html, url_contents)
+
+    @contextmanager
+    def _request_errors(self, url: PathOrStr) -> Generator[None, None, None]:
+        ClientResponseError = lazy_import("aiohttp", "ClientResponseError")
+        try:
+            yield
         except ClientResponseError as cre:
             raise RedPkgE(
                 f"An error occurred while trying to find {url!r}.",
@@ -949,22 +1013,9 @@ class PkgVersions:
                 f"\n- {self.github_stats_url = }"
                 f"\n[ORG-ERROR]: {cre}",
             )
-        except BASE_EXCEPTIONS as be_error:
-            raise be_error
 
     def _parse_html(self, html_contents: str) -> BeautifulSoup:
-        return BeautifulSoup(html_contents, "html.parser")
-
-    def _history_page(self) -> Generator[Any, str, None]:
-        # Parse the specified package history release page using BeautifulSoup.
-        # Return the release distribution.
-        hsoup: BeautifulSoup = self._main_request(self._pkg_path)
-        yield from (
-            rd  # release-date
-            for i in hsoup.find_all("div", class_="release")
-            # Removes all instances of pre-releases
-            if search(self.VERSION_PATTERN, rd := i.get_text(strip=True))
-        )
+        return lazy_import("bs4", "BeautifulSoup")(html_contents, "html.parser")
 
     def _get_gh_stats(self):
         gh_soup = self._main_request(self.github_stats_url)
@@ -983,7 +1034,7 @@ class PkgVersions:
                     # E.g., '7' -> 7
                     k: int(v) if v.isdigit()
                     # E.g., '1,023' -> 1023
-                    else int(clean(v)) if search(r"[,][^a-zA-Z]", v)
+                    else int(clean(v, ",")) if search(r"[,][^a-zA-Z]", v)
                     # E.g., '12.4 MB' -> Stats NamedTuple
                     else str_to_bytes(*v.split())
                     if v[0].isdigit()
@@ -1001,36 +1052,179 @@ class PkgVersions:
     def gh_stat_keys() -> tuple[str]:
         return (*sorted(GH_STATS),)
 
-    def _version_history(self) -> Generator[DateTimeAndVersion, None, None]:
-        @exception_handler(item=f"{self._pkg_path!r}", exceptions=TimeoutError)
-        def get_vers(p: Pattern):
-            def search_func(i):
-                return search(pattern=p, obj=i, compiler=True).group()
+    @cached_method(maxsize=1)
+    def _release_records(self) -> tuple[ReleaseRecord, ...]:
+        """Return the release records of the package from the first index backend to succeed."""
+        error = None
+        for backend in self._backends:
+            try:
+                contents = self._main_request(
+                    backend.url(self._pkg_name), parse_html=False
+                )
+                return backend.releases(contents, self._pkg_name)
+            except (PkgException, *BASE_EXCEPTIONS) as backend_error:
+                # Fall back to the next backend (E.g the JSON API is unavailable on a mirror)
+                error = backend_error
+        if error is not None:
+            raise error
+        return ()
+
+    async def _release_records_async(self) -> tuple[ReleaseRecord, ...]:
+        """
+        Await the release records of the package (cached for the synchronous accessors).
 
-            return executor(search_func, self._history_page(), timeout=LONG_TIMEOUT)
+        - The contents are fetched on the event loop and parsed in its default executor, \
+            so the loop keeps serving the other requests meanwhile.
+        """
+        loop = lazy_import("asyncio").get_running_loop()
+        error = None
+        for backend in self._backends:
+            try:
+                contents = await self.request_async(
+                    backend.url(self._pkg_name), parse_html=False
+                )
+                records = await loop.run_in_executor(
+                    None, partial(backend.releases, contents, self._pkg_name)
+                )
+            except (PkgException, *BASE_EXCEPTIONS) as backend_error:
+                error = backend_error
+            else:
+                PkgVersions._release_records.cache_set(self, records)
+                return records
+        if error is not None:
+            raise error
+        return ()
+
+    @classmethod
+    def _bulk_fetcher(cls, kwargs: dict[str, Any]) -> Callable[[str], Coroutine]:
+        async def fetch(package: str) -> PkgVersions:
+            pkg_versions = cls(package, **kwargs)
+            await pkg_versions._release_records_async()
+            return pkg_versions
+
+        return fetch
+
+    @classmethod
+    def bulk(
+        cls, packages: Iterable[str], *, limit: int = None, **kwargs
+    ) -> Iterator[tuple[str, Union[PkgVersions, PkgException, Exception]]]:
+        """
+        Fetch the version histories of the specified packages concurrently.
+
+        - The histories are fetched on the shared event loop (and HTTP session) \
+            with at most `limit` requests running at once.
+        - The results are yielded as each completes (not in the order of `packages`).
+
+        ### Args:
+            - `packages` (Iterable[str]): The names of the packages (duplicates are fetched once).
+            - `limit` (int, optional): The maximum number of concurrent fetches. \
+                Defaults to `DEFAULT_STREAM_LIMIT` (32).
+            - `**kwargs`: The keyword arguments of each `PkgVersions` instance (E.g `backends`).
 
+        ### Returns:
+            - `Iterator[tuple[str, Union[PkgVersions, PkgException, Exception]]]`: The `(package, result)` pairs, \
+                where `result` is either a `PkgVersions` instance (with its version history loaded) \
+                or the error raised while fetching it.
+
+        ### Example:
+        ```python
+        for package, result in PkgVersions.bulk(("pandas", "numpy", "not-a-package")):
+            if isinstance(result, (PkgException, Exception)):
+                print(package, "failed:", result)
+            else:
+                print(package, result.latest_version)
+        ```
+        """
+        from ..pkg_utils.loop_runner import get_loop_runner
+
+        return get_loop_runner().stream(
+            cls._bulk_fetcher(kwargs), dict.fromkeys(packages), limit=limit
+        )
+
+    @classmethod
+    async def bulk_async(
+        cls, packages: Iterable[str], *, limit: int = None, **kwargs
+    ) -> AsyncIterator[tuple[str, Union[PkgVersions, PkgException, Exception]]]:
+        """
+        Asynchronous counterpart of `bulk` (from any running event loop).
+
+        ### Example:
+        ```python
+        async for package, result in PkgVersions.bulk_async(requirements):
+            ...
+        ```
+        """
+        from ..pkg_utils.loop_runner import get_loop_runner
+
+        async for result in get_loop_runner().stream_async(
+            cls._bulk_fetcher(kwargs), dict.fromkeys(packages), limit=limit
+        ):
+            yield result
+
+    async def prefetch_async(self) -> None:
+        """
+        Await the release history, the GitHub statistics (libraries.io) and \
+            the downloads (pepy.tech) pages of the package concurrently.
+
+        - Each page is parsed once (off the event loop, see `request_async`) and cached; \
+            every property is then computed from the cache.
+
+        #### Raises:
+            - `PkgException`: If a page could not be found (the other pages are still cached).
+        """
+        asyncio = lazy_import("asyncio")
+
+        pages = (self.github_stats_url, self.downloads_url)
+        records, *soups = await asyncio.gather(
+            self._release_records_async(),
+            *map(self.request_async, pages),
+            return_exceptions=True,
+        )
+        for url, soup in zip(pages, soups):
+            if not isinstance(soup, BaseException):
+                PkgVersions._main_request.cache_set(self, soup, url)
+        for result in (records, *soups):
+            if isinstance(result, BaseException):
+                raise result
+
+    def prefetch(self) -> PkgVersions:
+        """
+        Fetch every upstream page of the package concurrently (see `prefetch_async`).
+
+        ### Example:
+        ```python
+        pkg_versions = PkgVersions("pandas").prefetch()
+        pkg_versions.latest_version, pkg_versions.github_stats, pkg_versions.total_downloads
+        ```
+        """
+        from ..pkg_utils.loop_runner import get_loop_runner
+
+        get_loop_runner().run(self.prefetch_async())
+        return self
+
+    @cached_method(maxsize=1)
+    def _version_index(self) -> VersionIndex:
+        """Return the (version sorted) index of the release records of the package."""
+        return VersionIndex(self._release_records())
+
+    @cached_method(maxsize=1)
+    def _version_history(self) -> Generator[DateTimeAndVersion, None, None]:
         # Tuple containing the release date and version of the package:
         #  - release_date ('datetime' instance)
         #  - version ('version.Version' instance)
-        return _DtvRepr(
-            self.create_dtv(*dv)
-            for dv in zip(
-                get_vers(self.DATE_PATTERN),
-                get_vers(self.VERSION_PATTERN),
-            )
-        )
+        return _DtvRepr(self.create_dtv(*r) for r in self._release_records())
 
     def _get_dtv(self, method: MinOrMax = max) -> TupleDoubleStr:
         """Return the initial or latest release date and version of the package."""
-        return [min, max][method == max](self._version_history(), key=itemgetter(1))
+        index = self._version_index()
+        return index.latest() if method == max else index.initial()
 
     def _get_total_downloads(self, return_url: bool = False) -> str:
-        downloads_soup = self._main_request(
-            (downloads_url := self.DOWNLOADS_API.format(self._pkg_name))
-        )
+        downloads_url = self.DOWNLOADS_API.format(self._pkg_name)
         if return_url:
             return downloads_url
 
+        downloads_soup = self._main_request(downloads_url)
         try:
             _url, total_downloads = [
                 d.text
@@ -1070,7 +1264,7 @@ class PkgVersions:
                 date = d
                 dh_dict[date] = []
             else:
-                d = int(clean(d))
+                d = int(clean(d, ","))
                 dh_dict[date].append(d)
         total_downloads = soup_unpacker(
             "td",
@@ -1135,9 +1329,9 @@ class PkgVersions:
 
     @property
     def total_downloads(self) -> str:
-        if self._downloads_url is None:
-            self._downloads_url = self._get_total_downloads()
-        return self._downloads_url
+        if self._tdownloads is None:
+            self._tdownloads = self._get_total_downloads()
+        return self._tdownloads
 
     @property
     def github_stats(self):
@@ -1165,10 +1359,32 @@ class PkgVersions:
             self._downloads_url = self._get_total_downloads(return_url=True)
         return self._downloads_url
 
-    @_DateTimeVersions.operator_handler("==", version_only=True)
     def is_latest(self, other_py: PackageVersion) -> bool:
         """Check if the specified version is the latest version."""
-        return self.latest_version, self.parse_version(other_py)
+        return self._version_index().is_latest(self.parse_version(other_py))
+
+    def versions_between(
+        self, lo: Union[PackageVersion, str], hi: Union[PackageVersion, str]
+    ) -> tuple[PackageVersion, ...]:
+        """
+        Retrieve the released versions within the specified (inclusive) range.
+
+        ### Args:
+            - `lo` (Union[version.Version, str]): The lowest version of the range.
+            - `hi` (Union[version.Version, str]): The highest version of the range.
+
+        ### Returns:
+            - `tuple[version.Version, ...]`: The versions `v` such that `lo <= v <= hi` (ascending).
+
+        ### Example:
+        ```python
+        PkgVersions("pandas").versions_between("2.0", "2.1")
+        # Output: (<Version('2.0.0')>, <Version('2.0.1')>, ..., <Version('2.1.0')>)
+        ```
+        """
+        return self._version_index().between(
+            self.parse_version(lo), self.parse_version(hi)
+        )
 
     def get_updates(self, current_version: str) -> Optional[Iterator[PackageVersion]]:
         """
@@ -1189,22 +1405,19 @@ class PkgVersions:
             and will be ignored when checking for updates.
         """
         current_v = self.parse_version(current_version)
-        version_h = sorted(v for _, v in self._version_history())
+        version_index = self._version_index()
         # TODO: Implement beta versions
         # beta_h = sorted(v for _, v in self._pre_releases())
         # full_history = version_h + beta_h
 
-        try:
-            # Get the index of the current version in the version history
-            current_v_idx = version_h.index(current_v)
-        except ValueError:
+        if current_v not in version_index:
             # Raise a `PkgException` if the current version is not found in the version history
             raise PkgException(
                 f"Appears {current_v!r} was not found in {self._pkg_name!r} versions history."
             )
         # Get the updates after the current version
-        updates = version_h[current_v_idx + 1 :]
-        if not updates or self.is_latest(current_v):
+        updates = [*version_index.updates(current_v)]
+        if not updates or version_index.is_latest(current_v):
             updates = None
             # Print a warning message if no updates are found
             # or if the specified version is the latest version.
@@ -0,0 +1,3 @@
+# 'utils' must be initialized before 'util_types' and 'exception' (circular imports),
+# whichever 'pkg_utils' module is imported first (E.g the 'pkg-inspect' CLI entry point).
+from . import utils
@@ -0,0 +1,219 @@
+"""
+This module provides the bounded caches used in place of `functools.cache` on methods.
+
+`functools.cache` on a bound method keys every entry on `self`, keeping each instance \
+(and everything it references) alive for the lifetime of the process. The caches here \
+are instead held per instance, bounded in size (LRU), optionally expire (TTL) and are \
+released as soon as their instance is garbage collected (weak references).
+"""
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from threading import RLock
+from time import monotonic
+
+from .utils import namedtuple, wraps
+from .util_types import Any, Callable, Hashable, Optional
+
+
+# Statistics of a cache (mirrors `functools._CacheInfo`)
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize"))
+
+# Sentinel for missing cache entries
+_MISSING = object()
+
+
+# region LRUCache
+class LRUCache:
+    """
+    A thread-safe, size-bounded (least recently used) cache with an optional time-to-live.
+
+    #### Args:
+        - `maxsize` (int, optional): The maximum number of entries. Defaults to 128.
+            - `None` for an unbounded cache.
+        - `ttl` (float, optional): The number of seconds an entry remains valid.
+            - `None` (default) for entries that never expire.
+
+    #### Methods:
+        - `get`: Return the cached value of a key (or the specified default).
+        - `set`: Cache the value of a key (evicting the least recently used entry if full).
+        - `cache_info`: Return the hits, misses, maxsize and current size of the cache.
+        - `cache_clear`: Remove every entry and reset the statistics.
+    """
+
+    __slots__ = ("__weakref__", "_data", "_hits", "_lock", "_maxsize", "_misses", "_ttl")
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = RLock()
+        # {key: (expires, value)}
+        self._data: OrderedDict[Hashable, tuple[Optional[float], Any]] = OrderedDict()
+        self._hits = self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{(*self.cache_info(),)}"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires, value = entry
+                if expires is None or expires > monotonic():
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return value
+                # Expired entry
+                del self._data[key]
+            self._misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = None if self._ttl is None else monotonic() + self._ttl
+        with self._lock:
+            self._data[key] = expires, value
+            self._data.move_to_end(key)
+            if self._maxsize is not None:
+                while len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+
+# endregion
+
+
+# region MethodCache
+# Per-instance caches: {id(instance): {method qualname: LRUCache}}
+# Entries are removed by a weakref finalizer once their instance is collected.
+_INSTANCE_CACHES: dict[int, dict[str, LRUCache]] = {}
+_INSTANCE_LOCK = RLock()
+
+
+def _instance_caches(instance: Any, create: bool = True) -> Optional[dict[str, LRUCache]]:
+    key = id(instance)
+    with _INSTANCE_LOCK:
+        caches = _INSTANCE_CACHES.get(key)
+        if caches is None and create:
+            caches = _INSTANCE_CACHES[key] = {}
+            weakref.finalize(instance, _INSTANCE_CACHES.pop, key, None)
+        return caches
+
+
+def _make_key(args: tuple, kwargs: dict) -> Optional[Hashable]:
+    key = args + ((_MISSING, *sorted(kwargs.items())) if kwargs else ())
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable arguments are never cached
+        return
+    return key
+
+
+def cached_method(maxsize: Optional[int] = 128, ttl: Optional[float] = None):
+    """
+    Decorator to cache the results of a method per instance.
+
+    - Instances are only weakly referenced; their caches are released once collected.
+    - Instances are not hashed (E.g `PkgVersions.__hash__` performs a network request).
+    - Calls with unhashable arguments bypass the cache.
+
+    #### Args:
+        - `maxsize` (int, optional): The maximum number of cached results per instance. Defaults to 128.
+        - `ttl` (float, optional): The number of seconds a result remains valid. Defaults to None.
+
+    #### Example:
+    ```python
+    class Example:
+        __slots__ = ("__weakref__",)
+
+        @cached_method(maxsize=32, ttl=60)
+        def fetch(self, url: str) -> str: ...
+
+    Example.fetch.cache_info(instance)
+    Example.fetch.cache_set(instance, "<html>...", "https://example.com")
+    ```
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+
+        def get_cache(self, create: bool = True) -> Optional[LRUCache]:
+            caches = _instance_caches(self, create=create)
+            if caches is None:
+                return
+            if (cache := caches.get(name)) is None and create:
+                cache = caches.setdefault(name, LRUCache(maxsize, ttl))
+            return cache
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs) -> Any:
+            if (key := _make_key(args, kwargs)) is None:
+                return func(self, *args, **kwargs)
+            cache = get_cache(self)
+            if (result := cache.get(key, _MISSING)) is _MISSING:
+                result = func(self, *args, **kwargs)
+                cache.set(key, result)
+            return result
+
+        def cache_set(instance: Any, result: Any, *args, **kwargs) -> None:
+            # Cache a result computed elsewhere (E.g by an asynchronous counterpart)
+            if (key := _make_key(args, kwargs)) is not None:
+                get_cache(instance).set(key, result)
+
+        def cache_info(instance: Any) -> CacheInfo:
+            cache = get_cache(instance, create=False)
+            return cache.cache_info() if cache else CacheInfo(0, 0, maxsize, 0)
+
+        def cache_clear(instance: Any = None) -> None:
+            if instance is None:
+                # Clear the caches of every instance
+                with _INSTANCE_LOCK:
+                    for caches in _INSTANCE_CACHES.values():
+                        if cache := caches.get(name):
+                            cache.cache_clear()
+            elif cache := get_cache(instance, create=False):
+                cache.cache_clear()
+
+        wrapper.cache_set = cache_set
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def clear_instance_caches(instance: Any) -> None:
+    """Clear every method cache of the specified instance."""
+    for cache in (_instance_caches(instance, create=False) or {}).values():
+        cache.cache_clear()
+
+
+def instance_cache_info(instance: Any) -> dict[str, CacheInfo]:
+    """Return the statistics of every method cache of the specified instance."""
+    return {
+        name: cache.cache_info()
+        for name, cache in (_instance_caches(instance, create=False) or {}).items()
+    }
+
+
+# endregion
+
+
+__all__ = (
+    "CacheInfo",
+    "LRUCache",
+    "cached_method",
+    "clear_instance_caches",
+    "instance_cache_info",
+)
@@ -1,7 +1,7 @@
 from .metadata import __author__, __copyright__, __license__, __summary__, __url__, __version__
 from .utils import DUMMY_PATH, Any, CallableT, PathOrStr, iread, partial
+from ..pkg_functions import functions
 from ..pkg_functions.functions import (
-    INSPECTION_FIELDS,
     get_available_updates,
     get_installed_pythons,
     get_version_packages,
@@ -106,7 +106,7 @@ def cli_parser():
     elif args.license_type:
         return __license__
     elif args.options:
-        return INSPECTION_FIELDS
+        return functions.INSPECTION_FIELDS
     elif args.req:
         return _read("src/requirements.txt")
     elif args.source:
@@ -0,0 +1,476 @@
+"""
+This module provides the dependency graph of the distributions installed for an interpreter.
+
+The graphs are built from the `Requires-Dist` headers of every '.dist-info/METADATA' file \
+of the scan snapshot (see `build_dependency_graphs` and `SiteIndex.requirements`):
+
+- Nodes are the (PEP 503) normalized names of the installed distributions.
+- Edges are the parsed requirements whose environment markers hold for the interpreter \
+(E.g `numpy>=1.22; python_version >= "3.9"`). Requirements of extras are excluded.
+
+Each interpreter (E.g a pyenv 3.13 and a conda 3.13) has its own graph. Forward/reverse \
+dependencies, transitive closures, cycles and unsatisfied requirements (see \
+`check_dependencies`) are then in-memory graph operations. The graphs and the \
+reverse-dependency index of every interpreter (see `build_reverse_index`) are cached \
+with their snapshot (see `ScanSnapshot`).
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from packaging.markers import default_environment
+from packaging.requirements import InvalidRequirement, Requirement
+
+from .discovery import Interpreter
+from .site_index import DistRecord, read_requires_dist
+from .utils import (
+    executor,
+    intern_version,
+    namedtuple,
+    normalize_name,
+    os,
+    package_version,
+)
+from .util_types import Any, Iterable, Iterator, Optional, PackageVersion
+
+
+# Maximum number of cached parsed requirements (shared by every Python version)
+# Overridable with the 'PKG_INSPECT_REQUIREMENT_CACHE_SIZE' environment variable.
+REQUIREMENT_CACHE_SIZE: int = int(
+    os.environ.get("PKG_INSPECT_REQUIREMENT_CACHE_SIZE", 8192)
+)
+
+
+# Dependency of a distribution.
+#   - `name` (str): The normalized name of the required distribution.
+#   - `specifier` (SpecifierSet): The version specifier (E.g '<3,>=1.22').
+#   - `requirement` (Requirement): The parsed requirement (E.g 'numpy>=1.22; python_version >= "3.9"').
+Dependency = namedtuple("Dependency", ("name", "specifier", "requirement"))
+
+# Installed distribution depending on a distribution.
+#   - `pyversion` (Version): The Python version the dependent is installed for.
+#   - `dependent` (str): The normalized name of the dependent distribution.
+#   - `specifier` (SpecifierSet): The version specifier of the requirement (E.g '>=1.22').
+#   - `root` (Path): The library directory of the interpreter the dependent is installed for
+#       (E.g '/usr/lib/python3.12').
+ReverseDependency = namedtuple(
+    "ReverseDependency", ("pyversion", "dependent", "specifier", "root")
+)
+
+# Unsatisfied requirement of an installed distribution (see `check_dependencies`).
+#   - `pyversion` (Version): The Python version the dependent is installed for.
+#   - `dependent` (str): The normalized name of the dependent distribution.
+#   - `dependency` (str): The normalized name of the required distribution.
+#   - `specifier` (SpecifierSet): The version specifier of the requirement (E.g '<3,>=1.22').
+#   - `installed` (Version): The installed version of the dependency (None if not installed).
+#   - `root` (Path): The library directory of the interpreter the dependent is installed for
+#       (E.g '/usr/lib/python3.12').
+Conflict = namedtuple(
+    "Conflict", ("pyversion", "dependent", "dependency", "specifier", "installed", "root")
+)
+
+
+@lru_cache(maxsize=None)
+def marker_environment(py_version: PackageVersion) -> dict[str, str]:
+    """
+    Return the environment the markers are evaluated with for the specified Python version.
+
+    - The platform values are those of the running interpreter (same machine).
+    - Only the `major.minor` version of other interpreters is known (E.g '3.9' -> '3.9.0').
+    """
+    environment = default_environment()
+    python_version = f"{py_version.major}.{py_version.minor}"
+    if python_version != environment["python_version"]:
+        full_version = f"{python_version}.0"
+        environment.update(
+            python_version=python_version,
+            python_full_version=full_version,
+            implementation_version=full_version,
+        )
+    return environment
+
+
+@lru_cache(maxsize=REQUIREMENT_CACHE_SIZE)
+def _parse_requirement(requirement: str) -> Optional[tuple[Dependency, Any]]:
+    # E.g 'numpy>=1.22; python_version >= "3.9"' -> (Dependency(...), <Marker(...)>)
+    try:
+        parsed = Requirement(requirement)
+    except InvalidRequirement:
+        return
+    return Dependency(normalize_name(parsed.name), parsed.specifier, parsed), parsed.marker
+
+
+@lru_cache(maxsize=None)
+def _marker_holds(marker: Any, py_version: PackageVersion) -> bool:
+    # Markers are few and shared by many requirements (E.g 'python_version < "3.11"')
+    return marker.evaluate(marker_environment(py_version))
+
+
+def parse_dependency(
+    requirement: str, py_version: PackageVersion
+) -> Optional[Dependency]:
+    """
+    Return the dependency of the specified requirement for the specified Python version.
+
+    - Requirements are parsed once and markers evaluated once per Python version (cached).
+
+    #### Returns:
+        - `Optional[Dependency]`: The dependency or None if its marker does not hold \
+            (E.g an extra or another platform) or the requirement is invalid.
+    """
+    if (parsed := _parse_requirement(requirement)) is None:
+        return
+    dependency, marker = parsed
+    if marker is not None and not _marker_holds(marker, py_version):
+        return
+    return dependency
+
+
+def dist_dependencies(
+    requirements: Iterable[str], py_version: PackageVersion
+) -> tuple[Dependency, ...]:
+    """
+    Return the dependencies of a distribution (its `Requires-Dist` values) for the specified Python version.
+
+    - Requirements of the same distribution are merged (E.g 'numpy>=1.22' and 'numpy<3').
+    """
+    dependencies: dict[str, Dependency] = {}
+    for requirement in requirements:
+        if (dependency := parse_dependency(requirement, py_version)) is None:
+            continue
+        if (other := dependencies.get(dependency.name)) is not None:
+            dependency = other._replace(specifier=other.specifier & dependency.specifier)
+        dependencies[dependency.name] = dependency
+    return (*dependencies.values(),)
+
+
+# region DependencyGraph
+class DependencyGraph:
+    """
+    The dependency graph of the distributions installed for an interpreter.
+
+    #### Args:
+        - `distributions` (dict[str, DistRecord]): The installed distributions (normalized name -> record).
+        - `dependencies` (dict[str, tuple[Dependency, ...]]): The dependencies of each distribution.
+        - `interpreter` (Interpreter, optional): The interpreter the distributions are installed for.
+
+    #### Attributes:
+        - `distributions` (dict[str, DistRecord]): The nodes of the graph.
+        - `interpreter` (Optional[Interpreter]): The interpreter of the graph.
+        - `pyversion` (Optional[Version]): The Python version of the interpreter.
+
+    #### Methods:
+        - `dependencies`: Return the direct dependencies of a distribution.
+        - `dependents`: Return the distributions directly depending on a distribution.
+        - `edges`: Yield the `(dependent, dependency)` pairs of the graph.
+        - `closure`: Return the transitive dependencies of a distribution.
+        - `reverse_closure`: Return the distributions transitively depending on a distribution.
+        - `missing`: Return the dependencies that are not installed.
+        - `cycles`: Return the dependency cycles.
+
+    #### Note:
+        - Names are normalized (E.g 'Typing_Extensions' -> 'typing-extensions').
+        - Unknown distributions have no dependencies (nor dependents).
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "distributions",
+        "interpreter",
+        "pyversion",
+        "_forward",
+        "_reverse",
+    )
+
+    def __init__(
+        self,
+        distributions: dict[str, DistRecord],
+        dependencies: dict[str, tuple[Dependency, ...]],
+        interpreter: Interpreter = None,
+    ) -> None:
+        self.distributions = distributions
+        self.interpreter = interpreter
+        self.pyversion = None if interpreter is None else interpreter.version
+        self._forward: dict[str, tuple[Dependency, ...]] = {
+            name: dependencies.get(name, ()) for name in distributions
+        }
+        reverse: dict[str, list[str]] = {}
+        for name, deps in self._forward.items():
+            for dependency in deps:
+                reverse.setdefault(dependency.name, []).append(name)
+        self._reverse: dict[str, tuple[str, ...]] = {
+            name: (*sorted(names),) for name, names in reverse.items()
+        }
+
+    def __repr__(self) -> str:
+        edges = sum(map(len, self._forward.values()))
+        return (
+            f"{self.__class__.__name__}(pyversion={self.pyversion!r}, "
+            f"distributions={len(self)}, dependencies={edges})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.distributions)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.distributions)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self.distributions
+
+    def dependencies(self, name: str) -> tuple[Dependency, ...]:
+        """Return the direct dependencies of the specified distribution."""
+        return self._forward.get(normalize_name(name), ())
+
+    def dependents(self, name: str) -> tuple[str, ...]:
+        """Return the (sorted) distributions directly depending on the specified distribution."""
+        return self._reverse.get(normalize_name(name), ())
+
+    def edges(self) -> Iterator[tuple[str, Dependency]]:
+        """Yield the `(dependent, dependency)` pairs of the graph."""
+        for name, dependencies in self._forward.items():
+            for dependency in dependencies:
+                yield name, dependency
+
+    def _walk(self, name: str, neighbours) -> tuple[str, ...]:
+        start = normalize_name(name)
+        seen: set[str] = set()
+        stack = [start]
+        while stack:
+            for neighbour in neighbours(stack.pop()):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        seen.discard(start)
+        return (*sorted(seen),)
+
+    def closure(self, name: str) -> tuple[str, ...]:
+        """Return the (sorted) transitive dependencies of the specified distribution."""
+        return self._walk(
+            name, lambda node: (d.name for d in self._forward.get(node, ()))
+        )
+
+    def reverse_closure(self, name: str) -> tuple[str, ...]:
+        """Return the (sorted) distributions transitively depending on the specified distribution."""
+        return self._walk(name, lambda node: self._reverse.get(node, ()))
+
+    def missing(self) -> dict[str, tuple[str, ...]]:
+        """Return the dependencies that are not installed (name -> its dependents)."""
+        return {
+            name: dependents
+            for name, dependents in sorted(self._reverse.items())
+            if name not in self.distributions
+        }
+
+    def cycles(self) -> tuple[tuple[str, ...], ...]:
+        """
+        Return the dependency cycles (the strongly connected components with more than one \
+            distribution or depending on themselves).
+
+        - Tarjan's algorithm (iterative); each cycle is sorted by name.
+        """
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        cycles: list[tuple[str, ...]] = []
+
+        for root in self._forward:
+            if root in index:
+                continue
+            # (node, iterator over its installed dependencies)
+            work = [(root, iter(self._forward[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, deps = work[-1]
+                for dependency in deps:
+                    child = dependency.name
+                    if child not in self._forward:
+                        continue
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self._forward[child])))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or any(
+                            d.name == node for d in self._forward[node]
+                        ):
+                            cycles.append((*sorted(component),))
+        return (*sorted(cycles),)
+
+
+# endregion
+
+
+def build_dependency_graphs(
+    name_indexes: dict[Interpreter, dict[str, DistRecord]],
+    requires: dict[Interpreter, dict[str, tuple[str, ...]]] = None,
+) -> dict[Interpreter, DependencyGraph]:
+    """
+    Build the dependency graph of each interpreter.
+
+    - Missing requirements are read from the METADATA files of the '.dist-info' \
+        directories (of every interpreter) in a single parallel pass.
+    - The requirements shared across the interpreters are parsed once (see `parse_dependency`) \
+        and their markers evaluated once per Python version.
+
+    #### Args:
+        - `name_indexes` (dict[Interpreter, dict[str, DistRecord]]): \
+            The installed distributions (normalized name -> record) of each interpreter.
+        - `requires` (dict[Interpreter, dict[str, tuple[str, ...]]], optional): The (already read) \
+            `Requires-Dist` values of each '.dist-info' path of each interpreter \
+            (E.g `SiteIndex.requirements` of its site-packages directories).
+
+    #### Returns:
+        - `dict[Interpreter, DependencyGraph]`: The dependency graph of each interpreter.
+    """
+    requires = requires or {}
+    read: dict[str, tuple[str, ...]] = {}
+    if missing := [
+        *{
+            dist.path: None
+            for interpreter, name_index in name_indexes.items()
+            for dist in name_index.values()
+            if dist.path.endswith(".dist-info")
+            and dist.path not in requires.get(interpreter, ())
+        }
+    ]:
+        read.update(zip(missing, executor(read_requires_dist, missing)))
+
+    graphs: dict[Interpreter, DependencyGraph] = {}
+    for interpreter, name_index in name_indexes.items():
+        known = requires.get(interpreter, {})
+        graphs[interpreter] = DependencyGraph(
+            name_index,
+            {
+                name: dist_dependencies(
+                    known.get(dist.path) or read.get(dist.path, ()), interpreter.version
+                )
+                for name, dist in name_index.items()
+            },
+            interpreter,
+        )
+    return graphs
+
+
+def build_reverse_index(
+    graphs: dict[Interpreter, DependencyGraph]
+) -> dict[str, tuple[ReverseDependency, ...]]:
+    """
+    Build the reverse-dependency index of the specified dependency graphs (every interpreter).
+
+    #### Returns:
+        - `dict[str, tuple[ReverseDependency, ...]]`: The `(pyversion, dependent, specifier, root)` \
+            records of each (normalized) required name, sorted by Python version, \
+            interpreter root and dependent.
+    """
+    index: dict[str, list[ReverseDependency]] = {}
+    for interpreter, graph in sorted(graphs.items()):
+        for dependent, dependency in graph.edges():
+            index.setdefault(dependency.name, []).append(
+                ReverseDependency(
+                    interpreter.version, dependent, dependency.specifier, interpreter.root
+                )
+            )
+    return {
+        name: (*sorted(records, key=lambda r: (r.pyversion, r.root, r.dependent)),)
+        for name, records in index.items()
+    }
+
+
+def check_dependencies(
+    graph: DependencyGraph,
+    py_version: PackageVersion = None,
+    matches: dict[tuple[int, PackageVersion], bool] = None,
+) -> tuple[Conflict, ...]:
+    """
+    Return the unsatisfied requirements of the distributions of a dependency graph (E.g `pip check`).
+
+    - A requirement is unsatisfied if its distribution is not installed or if the installed \
+        version does not match its specifier (pre-releases included, as with `pip check`).
+    - Specifiers are those parsed once with the requirements (shared by every distribution \
+        and interpreter requiring the same string) and installed versions are interned, \
+        so each `(specifier, version)` pair is only evaluated once.
+
+    #### Args:
+        - `graph` (DependencyGraph): The dependency graph of the interpreter.
+        - `py_version` (PackageVersion, optional): The Python version of the graph. \
+            Defaults to `graph.pyversion`.
+        - `matches` (dict[tuple[int, PackageVersion], bool], optional): The evaluated \
+            `(id(specifier), version)` pairs (E.g shared by the graphs of a snapshot). \
+            The specifiers must outlive it.
+
+    #### Returns:
+        - `tuple[Conflict, ...]`: The unsatisfied requirements (sorted by dependent and dependency).
+    """
+    matches = {} if matches is None else matches
+    py_version = graph.pyversion if py_version is None else py_version
+    root = None if graph.interpreter is None else graph.interpreter.root
+    distributions = graph.distributions
+    conflicts: list[Conflict] = []
+    for dependent, dependency in graph.edges():
+        if (dist := distributions.get(dependency.name)) is None:
+            conflicts.append(
+                Conflict(
+                    py_version, dependent, dependency.name, dependency.specifier, None, root
+                )
+            )
+            continue
+        if not (dependency.specifier and dist.version):
+            # Any version (or a '.py' module) satisfies the requirement
+            continue
+        try:
+            installed = intern_version(dist.version)
+        except package_version.InvalidVersion:
+            # Not comparable (E.g a legacy version)
+            continue
+        key = id(dependency.specifier), installed
+        if (match := matches.get(key)) is None:
+            match = matches[key] = dependency.specifier.contains(
+                installed, prereleases=True
+            )
+        if not match:
+            conflicts.append(
+                Conflict(
+                    py_version,
+                    dependent,
+                    dependency.name,
+                    dependency.specifier,
+                    installed,
+                    root,
+                )
+            )
+    return (*sorted(conflicts, key=lambda c: (c.dependent, c.dependency)),)
+
+
+__all__ = (
+    "Conflict",
+    "Dependency",
+    "DependencyGraph",
+    "REQUIREMENT_CACHE_SIZE",
+    "ReverseDependency",
+    "build_dependency_graphs",
+    "build_reverse_index",
+    "check_dependencies",
+    "dist_dependencies",
+    "marker_environment",
+    "parse_dependency",
+)
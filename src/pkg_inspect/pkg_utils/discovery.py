@@ -0,0 +1,262 @@
+"""
+This module provides the interpreter discovery engine used to locate every installed \
+Python version and its site-packages (or dist-packages) directories.
+
+Discovery is a single bounded pass over a fixed set of glob patterns (no recursive \
+`rglob`), performed by pluggable "finders". Each finder yields `(version, site_dir)` \
+pairs and new finders can be added with `InterpreterDiscovery.register_finder`.
+"""
+from __future__ import annotations
+
+import site
+import sys
+from threading import RLock
+
+from .utils import Path, intern_version, namedtuple, os, re
+from .util_types import (
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    PackageVersion,
+    PathOrStr,
+)
+
+
+# Record of a discovered interpreter.
+#   - `version` (Version): The 'major.minor' version of the interpreter.
+#   - `root` (Path): The interpreter library directory (E.g '/usr/lib/python3.12').
+#   - `site_dirs` (tuple[Path, ...]): The site-packages directories of the interpreter.
+Interpreter = namedtuple("Interpreter", ("version", "root", "site_dirs"))
+
+# Pair yielded by each finder: ('3.12', Path('/usr/lib/python3/dist-packages'))
+FinderResult = tuple[str, Path]
+FinderT = Callable[[], Iterable[FinderResult]]
+
+# Possible names for the third-party package directories
+SITE_DIR_NAMES: tuple[str, ...] = ("site-packages", "dist-packages")
+
+# E.g 'python3.12' -> '3.12'
+_PYDIR_PATTERN = re.compile(r"^python(\d+\.\d+)$")
+
+
+def _home(*parts: str) -> Path:
+    return Path.home().joinpath(*parts)
+
+
+def _from_lib_dirs(*patterns: PathOrStr) -> Iterator[FinderResult]:
+    """
+    Yield the site-packages directories of each 'lib/pythonX.Y' directory matching the patterns.
+
+    - Patterns are expanded with a single (non-recursive) glob each.
+    """
+    for pattern in patterns:
+        pattern = Path(pattern)
+        anchor = Path(pattern.anchor or ".")
+        for lib_dir in anchor.glob(pattern.relative_to(anchor).as_posix()):
+            if match := _PYDIR_PATTERN.match(lib_dir.name):
+                for name in SITE_DIR_NAMES:
+                    if (site_dir := lib_dir / name).is_dir():
+                        yield match.group(1), site_dir
+
+
+# region InterpreterDiscovery
+class InterpreterDiscovery:
+    """
+    Discover the installed Python interpreters and their site-packages directories.
+
+    - Results are cached per instance until `refresh()` is called.
+    - The default finders cover the running interpreter, system installs \
+        (`/usr/lib`, `/usr/local/lib`), pyenv, conda, virtual environments \
+        and macOS framework builds.
+
+    #### Args:
+        - `finders` (Iterable[str], optional): The names of the registered finders to use.
+            - Defaults to every registered finder.
+
+    #### Methods:
+        - `interpreters`: Return the discovered interpreters.
+        - `versions`: Return the unique discovered Python versions.
+        - `refresh`: Discard the cached results.
+        - `register_finder`: Return a decorator registering a finder function (a classmethod).
+
+    #### Example:
+    ```python
+    @InterpreterDiscovery.register_finder("custom")
+    def custom_finder():
+        yield "3.12", Path("/opt/python/lib/python3.12/site-packages")
+    ```
+    """
+
+    FINDERS: dict[str, FinderT] = {}
+
+    __slots__ = ("__weakref__", "_finders", "_lock", "_interpreters")
+
+    def __init__(self, finders: Iterable[str] = None) -> None:
+        self._finders = (*(finders or ()),)
+        self._lock = RLock()
+        self._interpreters: Optional[tuple[Interpreter, ...]] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(finders={self._get_finders()!r})"
+
+    def __iter__(self) -> Iterator[Interpreter]:
+        return iter(self.interpreters())
+
+    @classmethod
+    def register_finder(cls, name: str) -> Callable[[FinderT], FinderT]:
+        """Decorator to register a finder yielding `(version, site_dir)` pairs."""
+
+        def decorator(func: FinderT) -> FinderT:
+            cls.FINDERS[name] = func
+            return func
+
+        return decorator
+
+    def _get_finders(self) -> tuple[str, ...]:
+        return self._finders or (*self.FINDERS,)
+
+    def _discover(self) -> tuple[Interpreter, ...]:
+        # {root: [version, [site_dirs]]}
+        roots: dict[Path, list] = {}
+        seen: set[str] = set()
+        for name in self._get_finders():
+            try:
+                results = (*self.FINDERS[name](),)
+            except (KeyError, OSError):
+                continue
+            for version, site_dir in results:
+                # Ignore duplicates (E.g symlinked 'lib64' or the running interpreter)
+                if (real := os.path.realpath(site_dir)) in seen:
+                    continue
+                seen.add(real)
+                site_dir = Path(site_dir)
+                root = roots.setdefault(site_dir.parent, [version, []])
+                root[1].append(site_dir)
+
+        return (
+            *sorted(
+                (
+                    Interpreter(intern_version(v), root, (*sorted(dirs),))
+                    for root, (v, dirs) in roots.items()
+                ),
+                key=lambda i: (i.version, i.root),
+            ),
+        )
+
+    def interpreters(self) -> tuple[Interpreter, ...]:
+        """Return the discovered interpreters (sorted by version)."""
+        with self._lock:
+            if self._interpreters is None:
+                self._interpreters = self._discover()
+            return self._interpreters
+
+    def versions(self) -> tuple[PackageVersion, ...]:
+        """Return the unique discovered Python versions (sorted)."""
+        return (*sorted({i.version for i in self.interpreters()}),)
+
+    def refresh(self) -> None:
+        """Discard the cached results so the next lookup rediscovers the interpreters."""
+        with self._lock:
+            self._interpreters = None
+
+
+# endregion
+
+
+# region Finders
+register_finder = InterpreterDiscovery.register_finder
+
+
+@register_finder("running")
+def _running_finder() -> Iterator[FinderResult]:
+    # The running interpreter (including Windows 'Lib/site-packages' layouts)
+    version = "{}.{}".format(*sys.version_info[:2])
+    user_site = site.getusersitepackages() if site.ENABLE_USER_SITE else None
+    for site_dir in (*site.getsitepackages(), user_site):
+        if site_dir and os.path.isdir(site_dir):
+            yield version, Path(site_dir)
+
+
+@register_finder("system")
+def _system_finder() -> Iterator[FinderResult]:
+    prefixes = ("/usr/lib", "/usr/lib64", "/usr/local/lib", "/usr/local/lib64")
+    yield from _from_lib_dirs(*(f"{p}/python3.*" for p in prefixes))
+
+    # Debian/Ubuntu share '/usr/lib/python3/dist-packages' between system interpreters
+    shared = Path("/usr/lib/python3/dist-packages")
+    if shared.is_dir():
+        python3 = Path(os.path.realpath("/usr/bin/python3")).name
+        if match := _PYDIR_PATTERN.match(python3):
+            yield match.group(1), shared
+
+
+@register_finder("pyenv")
+def _pyenv_finder() -> Iterator[FinderResult]:
+    pyenv_root = os.environ.get("PYENV_ROOT") or _home(".pyenv")
+    yield from _from_lib_dirs(Path(pyenv_root) / "versions/*/lib/python*")
+
+
+@register_finder("conda")
+def _conda_finder() -> Iterator[FinderResult]:
+    bases = {
+        *(
+            _home(name)
+            for name in (
+                "anaconda3",
+                "miniconda3",
+                "miniconda",
+                "miniforge3",
+                "mambaforge",
+            )
+        ),
+        Path("/opt/conda"),
+    }
+    if conda_exe := os.environ.get("CONDA_EXE"):
+        # E.g '~/miniconda3/bin/conda' -> '~/miniconda3'
+        bases.add(Path(conda_exe).parents[1])
+    for base in sorted(bases):
+        yield from _from_lib_dirs(base / "lib/python*", base / "envs/*/lib/python*")
+
+
+@register_finder("venv")
+def _venv_finder() -> Iterator[FinderResult]:
+    envs = {os.environ.get(k) for k in ("VIRTUAL_ENV", "CONDA_PREFIX")}
+    envs |= {sys.prefix, sys.base_prefix}
+    for env in sorted(filter(None, envs)):
+        yield from _from_lib_dirs(Path(env) / "lib/python*")
+
+
+@register_finder("framework")
+def _framework_finder() -> Iterator[FinderResult]:
+    # macOS framework builds (python.org installers & Homebrew)
+    yield from _from_lib_dirs(
+        "/Library/Frameworks/Python.framework/Versions/*/lib/python*",
+        "/usr/local/Cellar/python@*/*/Frameworks/Python.framework/Versions/*/lib/python*",
+        "/opt/homebrew/Cellar/python@*/*/Frameworks/Python.framework/Versions/*/lib/python*",
+    )
+
+
+# endregion
+
+
+_DISCOVERY: Optional[InterpreterDiscovery] = None
+_DISCOVERY_LOCK = RLock()
+
+
+def get_discovery() -> InterpreterDiscovery:
+    """Return the process-wide default `InterpreterDiscovery` instance."""
+    global _DISCOVERY
+    with _DISCOVERY_LOCK:
+        if _DISCOVERY is None:
+            _DISCOVERY = InterpreterDiscovery()
+        return _DISCOVERY
+
+
+__all__ = (
+    "SITE_DIR_NAMES",
+    "Interpreter",
+    "InterpreterDiscovery",
+    "get_discovery",
+    "register_finder",
+)
@@ -0,0 +1,153 @@
+"""
+This module provides the on-disk footprint (installed bytes and files) of the distributions.
+
+The footprint of a distribution is read from the `RECORD` file of its '.dist-info' \
+directory (every file installed with it, see PEP 376 / PEP 627) rather than from the \
+'.dist-info' directory itself:
+
+- Recorded sizes are used as is (no `stat` call).
+- Files without a recorded size (E.g `RECORD` itself or the '.pyc' files compiled at \
+install time) are stat-ed in batches, one `os.scandir` per directory.
+
+Footprints are cached in memory (see `FOOTPRINT_CACHE_SIZE`) against the modification \
+time of their `RECORD` file, which changes whenever the distribution is (re)installed.
+"""
+from __future__ import annotations
+
+import csv
+
+from .caching import LRUCache
+from .utils import executor, namedtuple, os
+from .util_types import Iterable, Optional, PathOrStr
+
+
+# Maximum number of cached footprints (one per '.dist-info' directory)
+# Overridable with the 'PKG_INSPECT_FOOTPRINT_CACHE_SIZE' environment variable.
+FOOTPRINT_CACHE_SIZE: int = int(os.environ.get("PKG_INSPECT_FOOTPRINT_CACHE_SIZE", 8192))
+
+# Name of the installed files record of a '.dist-info' directory
+RECORD_FILE: str = "RECORD"
+
+
+# On-disk footprint of a distribution.
+#   - `size` (int): The installed bytes (recorded sizes and stat-ed sizes of the other files).
+#   - `files` (int): The number of installed files.
+#   - `missing` (int): The number of files without a recorded size that no longer exist
+#       (excluded from `size` and `files`).
+Footprint = namedtuple("Footprint", ("size", "files", "missing"))
+
+
+# {RECORD path: (RECORD modification time (ns), footprint)}
+_FOOTPRINTS = LRUCache(maxsize=FOOTPRINT_CACHE_SIZE)
+
+
+def _scandir_sizes(directory: str, names: Iterable[str]) -> list[Optional[int]]:
+    # Sizes of the specified entries of a directory (None if missing)
+    try:
+        with os.scandir(directory) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return [None for _ in names]
+    sizes = []
+    for name in names:
+        try:
+            sizes.append(entries[name].stat(follow_symlinks=False).st_size)
+        except (KeyError, OSError):
+            sizes.append(None)
+    return sizes
+
+
+def read_record(dist_info: PathOrStr) -> Footprint:
+    """
+    Return the footprint of a distribution from the `RECORD` file of its '.dist-info' directory.
+
+    #### Args:
+        - `dist_info` (PathOrStr): The '.dist-info' directory of the distribution.
+
+    #### Raises:
+        - `OSError`: If the `RECORD` file cannot be read (E.g not installed by a wheel).
+    """
+    site_dir = os.path.dirname(os.fspath(dist_info).rstrip(os.sep))
+    size = files = 0
+    # {directory: names of the files without a recorded size}
+    unsized: dict[str, list[str]] = {}
+    seen: set[str] = set()
+    with open(os.path.join(dist_info, RECORD_FILE), newline="", encoding="utf-8") as f:
+        # E.g 'pandas/__init__.py,sha256=...,9103' (paths relative to the site-packages directory)
+        for row in csv.reader(f):
+            if not row or (path := row[0]) in seen:
+                continue
+            seen.add(path)
+            if len(row) > 2 and row[2].isdigit():
+                size += int(row[2])
+                files += 1
+            else:
+                directory, name = os.path.split(os.path.join(site_dir, path))
+                unsized.setdefault(directory, []).append(name)
+
+    missing = 0
+    for directory, names in unsized.items():
+        for file_size in _scandir_sizes(directory, names):
+            if file_size is None:
+                missing += 1
+            else:
+                size += file_size
+                files += 1
+    return Footprint(size, files, missing)
+
+
+def dist_footprint(dist_info: PathOrStr) -> Optional[Footprint]:
+    """
+    Return the (cached) footprint of a distribution (see `read_record`).
+
+    - The footprint is only read again once the modification time of its `RECORD` file changes.
+
+    #### Returns:
+        - `Optional[Footprint]`: The footprint or None if the distribution has no `RECORD` file.
+    """
+    record = os.path.join(dist_info, RECORD_FILE)
+    try:
+        mtime = os.stat(record).st_mtime_ns
+    except OSError:
+        return
+    cached = _FOOTPRINTS.get(record)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        footprint = read_record(dist_info)
+    except OSError:
+        return
+    _FOOTPRINTS.set(record, (mtime, footprint))
+    return footprint
+
+
+def footprints(dist_infos: Iterable[PathOrStr], **kwargs) -> dict[str, Optional[Footprint]]:
+    """
+    Return the footprints of the specified distributions (computed in parallel).
+
+    #### Args:
+        - `dist_infos` (Iterable[PathOrStr]): The '.dist-info' directories of the distributions.
+        - `kwargs`: The keyword arguments of `executor` (E.g `max_workers`).
+
+    #### Returns:
+        - `dict[str, Optional[Footprint]]`: The footprint of each '.dist-info' directory \
+            (None if it has no `RECORD` file).
+    """
+    paths = [*dict.fromkeys(map(os.fspath, dist_infos))]
+    return dict(zip(paths, executor(dist_footprint, paths, **kwargs)))
+
+
+def clear_footprints() -> None:
+    """Discard the cached footprints."""
+    _FOOTPRINTS.cache_clear()
+
+
+__all__ = (
+    "FOOTPRINT_CACHE_SIZE",
+    "Footprint",
+    "RECORD_FILE",
+    "clear_footprints",
+    "dist_footprint",
+    "footprints",
+    "read_record",
+)
@@ -0,0 +1,280 @@
+"""
+This module provides the persistent (SQLite) cache of HTTP responses shared across processes.
+
+- Responses are fresh for a configurable number of seconds per host (TTL); fresh \
+responses are served without any network round-trip.
+- Stale responses are revalidated with conditional requests (`If-None-Match` / \
+`If-Modified-Since`), so an unchanged page only costs a '304 Not Modified' round-trip.
+- The cache is bounded in size; the least recently used responses are evicted first.
+
+The cache is stored under the `CACHE_DIR` directory. If the database cannot be created \
+(e.g. read-only home directory), every lookup is a miss and nothing is stored.
+"""
+from __future__ import annotations
+
+import sqlite3
+import zlib
+from contextlib import closing
+from threading import RLock
+from time import time
+from urllib.parse import urlsplit
+
+from .utils import CACHE_DIR, Path, namedtuple, os
+from .util_types import Optional, PathOrStr
+
+
+# Default freshness (seconds) of the responses of hosts without a specific TTL
+# Overridable with the 'PKG_INSPECT_HTTP_CACHE_TTL' environment variable.
+DEFAULT_TTL: float = float(os.environ.get("PKG_INSPECT_HTTP_CACHE_TTL", 300))
+
+# Default freshness (seconds) of the responses per host
+DEFAULT_HOST_TTLS: dict[str, float] = {
+    # Release histories
+    "pypi.org": DEFAULT_TTL,
+    # Repository statistics and download counts (updated daily at most)
+    "libraries.io": 3600,
+    "pepy.tech": 3600,
+}
+
+# Default maximum size (bytes) of the stored (compressed) responses
+# Overridable with the 'PKG_INSPECT_HTTP_CACHE_SIZE' environment variable.
+DEFAULT_MAX_SIZE: int = int(os.environ.get("PKG_INSPECT_HTTP_CACHE_SIZE", 64 * 2**20))
+
+
+# Cached response of a single url.
+#   - `text` (str): The decoded body of the response.
+#   - `etag` (str): The 'ETag' header of the response (None if missing).
+#   - `last_modified` (str): The 'Last-Modified' header of the response (None if missing).
+#   - `fetched` (float): The time (epoch seconds) the response was last (re)validated.
+CachedResponse = namedtuple(
+    "CachedResponse", ("text", "etag", "last_modified", "fetched")
+)
+
+
+# region HTTPCache
+class HTTPCache:
+    """
+    A persistent, size-bounded (least recently used) cache of HTTP responses.
+
+    #### Args:
+        - `db_path` (PathOrStr, optional): The path of the SQLite database file.
+            - Defaults to `CACHE_DIR / "http_cache.sqlite3"`.
+        - `ttls` (dict[str, float], optional): The freshness (seconds) of the responses per host.
+            - Defaults to `DEFAULT_HOST_TTLS`.
+        - `default_ttl` (float, optional): The freshness of the responses of other hosts.
+            - Defaults to `DEFAULT_TTL` (300 seconds).
+        - `max_size` (int, optional): The maximum size (bytes) of the stored responses.
+            - Defaults to `DEFAULT_MAX_SIZE` (64 MiB).
+
+    #### Methods:
+        - `ttl`: Return the freshness (seconds) of the responses of a url.
+        - `get`: Return the cached response of a url (fresh or stale).
+        - `is_fresh`: Return whether a cached response can be served without revalidation.
+        - `conditional_headers`: Return the revalidation headers of a cached response.
+        - `store`: Store the response of a url (evicting the least recently used responses).
+        - `touch`: Mark the cached response of a url as revalidated ('304 Not Modified').
+        - `size`: Return the size (bytes) of the stored responses.
+        - `clear`: Remove every response from the cache.
+    """
+
+    # Bump whenever the schema changes to rebuild outdated databases.
+    SCHEMA_VERSION: int = 1
+    SCHEMA: tuple[str, ...] = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT,"
+        " fetched REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)",
+    )
+
+    __slots__ = (
+        "__weakref__",
+        "_db_path",
+        "_default_ttl",
+        "_lock",
+        "_max_size",
+        "_ttls",
+    )
+
+    def __init__(
+        self,
+        db_path: PathOrStr = None,
+        ttls: dict[str, float] = None,
+        default_ttl: float = None,
+        max_size: int = None,
+    ) -> None:
+        self._lock = RLock()
+        self._ttls = {**DEFAULT_HOST_TTLS, **(ttls or {})}
+        self._default_ttl = DEFAULT_TTL if default_ttl is None else float(default_ttl)
+        self._max_size = DEFAULT_MAX_SIZE if max_size is None else int(max_size)
+        self._db_path = self._init_db(
+            Path(db_path) if db_path else CACHE_DIR / "http_cache.sqlite3"
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(db_path={self._db_path!r}, "
+            f"max_size={self._max_size!r})"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path, timeout=30)
+
+    def _init_db(self, db_path: Path) -> Optional[Path]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(db_path, timeout=30)) as conn, conn:
+                (version,) = conn.execute("PRAGMA user_version").fetchone()
+                if version != self.SCHEMA_VERSION:
+                    # Rebuild the database if the schema is outdated
+                    for (table,) in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'"
+                    ).fetchall():
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                for stmt in self.SCHEMA:
+                    conn.execute(stmt)
+        except (OSError, sqlite3.Error):
+            # Persistence is optional; every lookup is then a miss.
+            return
+        return db_path
+
+    def _execute(self, *statements: tuple[str, tuple]) -> list[tuple]:
+        # Execute the statements in a single transaction, returning the rows of the last one.
+        if self._db_path is None:
+            return []
+        try:
+            with self._lock, closing(self._connect()) as conn, conn:
+                rows = []
+                for sql, params in statements:
+                    rows = conn.execute(sql, params).fetchall()
+                return rows
+        except sqlite3.Error:
+            return []
+
+    def ttl(self, url: str) -> float:
+        """Return the freshness (seconds) of the responses of the specified url (per host)."""
+        host = urlsplit(url).hostname or ""
+        while host:
+            if (ttl := self._ttls.get(host)) is not None:
+                return ttl
+            # E.g 'www.pepy.tech' -> 'pepy.tech'
+            host = host.partition(".")[2]
+        return self._default_ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached (fresh or stale) response of the specified url or None if missing."""
+        rows = self._execute(
+            ("UPDATE responses SET accessed = ? WHERE url = ?", (time(), url)),
+            (
+                "SELECT body, etag, last_modified, fetched FROM responses WHERE url = ?",
+                (url,),
+            ),
+        )
+        if not rows:
+            return
+        body, etag, last_modified, fetched = rows[0]
+        try:
+            text = zlib.decompress(body).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):
+            return
+        return CachedResponse(text, etag, last_modified, fetched)
+
+    def is_fresh(self, url: str, response: CachedResponse) -> bool:
+        """Return whether the cached response can be served without revalidation."""
+        return time() - response.fetched < self.ttl(url)
+
+    @staticmethod
+    def conditional_headers(response: CachedResponse) -> dict[str, str]:
+        """Return the conditional request headers revalidating the cached response."""
+        headers = {}
+        if response.etag:
+            headers["If-None-Match"] = response.etag
+        if response.last_modified:
+            headers["If-Modified-Since"] = response.last_modified
+        return headers
+
+    def store(
+        self, url: str, text: str, etag: str = None, last_modified: str = None
+    ) -> None:
+        """Store the response of the specified url (evicting the least recently used responses)."""
+        body = zlib.compress(text.encode("utf-8"))
+        if len(body) > self._max_size:
+            return
+        now = time()
+        self._execute(
+            (
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now, now, len(body)),
+            )
+        )
+        self._evict()
+
+    def _evict(self) -> None:
+        # Evict the least recently used responses exceeding the size budget.
+        # The running total is computed here (window functions need SQLite >= 3.25)
+        # and in its own transaction, so a failed eviction never discards the stored response.
+        if self._db_path is None:
+            return
+        try:
+            with self._lock, closing(self._connect()) as conn, conn:
+                (total,) = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+                if total <= self._max_size:
+                    return
+                evicted = []
+                for url, size in conn.execute(
+                    "SELECT url, size FROM responses ORDER BY accessed, rowid"
+                ).fetchall():
+                    if total <= self._max_size:
+                        break
+                    evicted.append((url,))
+                    total -= size
+                conn.executemany("DELETE FROM responses WHERE url = ?", evicted)
+        except sqlite3.Error:
+            pass
+
+    def touch(self, url: str) -> None:
+        """Mark the cached response of the specified url as revalidated (E.g '304 Not Modified')."""
+        now = time()
+        self._execute(
+            (
+                "UPDATE responses SET fetched = ?, accessed = ? WHERE url = ?",
+                (now, now, url),
+            )
+        )
+
+    def size(self) -> int:
+        """Return the size (bytes) of the stored responses."""
+        rows = self._execute(("SELECT COALESCE(SUM(size), 0) FROM responses", ()))
+        return rows[0][0] if rows else 0
+
+    def clear(self) -> None:
+        """Remove every response from the cache."""
+        self._execute(("DELETE FROM responses", ()))
+
+
+# endregion
+
+
+_HTTP_CACHE: Optional[HTTPCache] = None
+_HTTP_CACHE_LOCK = RLock()
+
+
+def get_http_cache() -> HTTPCache:
+    """Return the process-wide `HTTPCache` instance."""
+    global _HTTP_CACHE
+    with _HTTP_CACHE_LOCK:
+        if _HTTP_CACHE is None:
+            _HTTP_CACHE = HTTPCache()
+        return _HTTP_CACHE
+
+
+__all__ = (
+    "DEFAULT_HOST_TTLS",
+    "DEFAULT_MAX_SIZE",
+    "DEFAULT_TTL",
+    "CachedResponse",
+    "HTTPCache",
+    "get_http_cache",
+)
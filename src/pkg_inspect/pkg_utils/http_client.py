@@ -0,0 +1,221 @@
+"""
+This module provides the long-lived HTTP client used for every network request.
+
+- Connections are pooled (keep-alive) and bounded both overall and per host.
+- Transient failures (connection errors, timeouts, 429 and 5xx responses) are retried \
+with jittered exponential backoff, within a fixed retry budget.
+- Each phase of a request (connect, socket connect, socket read, total) has its own timeout.
+- Responses are cached on disk and revalidated with conditional requests (see `http_cache.HTTPCache`).
+
+NOTE: This module imports `aiohttp` and is therefore only imported on first use.
+"""
+from __future__ import annotations
+
+import asyncio
+import weakref
+from functools import partial
+from threading import RLock
+
+import aiohttp
+
+from .exception import RedPkgE
+from .http_cache import HTTPCache, get_http_cache
+from .utils import DEFAULT_TIMEOUT, Path, SystemRandom, os
+from .util_types import Any, Callable, Optional, PathOrStr
+
+
+# Response statuses worth retrying (timeouts, rate limiting and transient server errors)
+RETRY_STATUSES: frozenset[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Errors worth retrying (E.g 'ServerDisconnectedError', 'ClientConnectorError')
+_RETRY_ERRORS: tuple[type[Exception], ...] = (
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+
+_RANDOM = SystemRandom()
+
+
+# region HTTPClient
+class HTTPClient:
+    """
+    A pooled HTTP client with bounded concurrency and jittered exponential backoff.
+
+    - Sessions are bound to an event loop, so one session is kept per running loop.
+
+    #### Args:
+        - `limit` (int): The maximum number of simultaneous connections. Defaults to 64.
+        - `limit_per_host` (int): The maximum number of simultaneous connections per host. Defaults to 8.
+        - `retries` (int): The retry budget of each request. Defaults to 3.
+        - `backoff` (float): The base delay (seconds) of the exponential backoff. Defaults to 0.5.
+        - `max_backoff` (float): The maximum delay (seconds) between two attempts. Defaults to 10.
+        - `timeout` (aiohttp.ClientTimeout, optional): The timeouts of each phase of a request.
+            - Defaults to `connect=30`, `sock_connect=15`, `sock_read=60` and `total=DEFAULT_TIMEOUT`.
+        - `cache` (HTTPCache, optional): The cache of the responses. Defaults to None (no caching).
+
+    #### Methods:
+        - `get_text`: Return the text of the specified url.
+        - `close`: Close the session of the running event loop.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_limit",
+        "_limit_per_host",
+        "_retries",
+        "_backoff",
+        "_cache",
+        "_max_backoff",
+        "_timeout",
+        "_sessions",
+    )
+
+    def __init__(
+        self,
+        *,
+        limit: int = 64,
+        limit_per_host: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        timeout: aiohttp.ClientTimeout = None,
+        cache: HTTPCache = None,
+    ) -> None:
+        self._cache = cache
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._retries = retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._timeout = timeout or aiohttp.ClientTimeout(
+            total=DEFAULT_TIMEOUT, connect=30, sock_connect=15, sock_read=60
+        )
+        # {event loop: session}
+        self._sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, aiohttp.ClientSession
+        ] = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(limit={self._limit}, "
+            f"limit_per_host={self._limit_per_host}, retries={self._retries})"
+        )
+
+    def _session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = self._sessions[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    ssl=False,
+                    enable_cleanup_closed=True,
+                    ttl_dns_cache=DEFAULT_TIMEOUT,
+                ),
+                timeout=self._timeout,
+                raise_for_status=True,
+            )
+        return session
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Full jitter: uniform(0, min(max_backoff, backoff * 2 ** attempt))
+        return _RANDOM.uniform(0, min(self._max_backoff, self._backoff * 2**attempt))
+
+    @staticmethod
+    async def _off_loop(func: Callable, *args: Any, **kwargs: Any) -> Any:
+        # Blocking calls (E.g the SQLite cache and its (de)compression) run in the
+        # default executor so a slow or locked database never stalls the event loop.
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(func, *args, **kwargs)
+        )
+
+    async def get_text(self, url: PathOrStr, **kwargs: Any) -> str:
+        """
+        Return the text of the specified url.
+
+        - Fresh cached responses are returned without any request; stale ones are revalidated \
+            (a '304 Not Modified' response returns the cached text).
+        - Requests with additional arguments (E.g `params`, `headers`) bypass the cache.
+        - Cache lookups and writes run off the event loop (default executor).
+
+        #### Raises:
+            - `PkgException`: If the url is invalid.
+            - `aiohttp.ClientResponseError`: If the response status is not retryable \
+                (or the retry budget is exhausted).
+            - `aiohttp.ClientConnectionError`, `asyncio.TimeoutError`: If the retry budget is exhausted.
+        """
+        if isinstance(url, Path):
+            url = url.as_posix()
+
+        cache = self._cache if not kwargs else None
+        cached = await self._off_loop(cache.get, url) if cache is not None else None
+        if cached is not None:
+            if cache.is_fresh(url, cached):
+                return cached.text
+            kwargs["headers"] = cache.conditional_headers(cached)
+
+        for attempt in range(self._retries + 1):
+            try:
+                async with self._session().get(url, **kwargs) as response:
+                    if response.status == 304 and cached is not None:
+                        await self._off_loop(cache.touch, url)
+                        return cached.text
+                    text = await response.text()
+                    if cache is not None:
+                        await self._off_loop(
+                            cache.store,
+                            url,
+                            text,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+                    return text
+            except aiohttp.InvalidURL:
+                # If the URL is not valid, raise an `PkgException` error.
+                raise RedPkgE(
+                    "The specified url could not be found and is considered invalid...",
+                    f"\n{url = }",
+                )
+            except aiohttp.ClientResponseError as cre:
+                # E.g 'ContentTypeError' or '404 Not Found'
+                if cre.status not in RETRY_STATUSES or attempt == self._retries:
+                    raise cre
+            except _RETRY_ERRORS:
+                if attempt == self._retries:
+                    raise
+            await asyncio.sleep(self._backoff_delay(attempt))
+
+    async def close(self) -> None:
+        """Close the session of the running event loop (a new one is created on the next request)."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+# endregion
+
+
+_HTTP_CLIENT: Optional[HTTPClient] = None
+_HTTP_CLIENT_LOCK = RLock()
+
+
+def get_http_client() -> HTTPClient:
+    """
+    Return the process-wide `HTTPClient` instance.
+
+    - Responses are cached on disk unless the 'PKG_INSPECT_NO_HTTP_CACHE' environment variable is set.
+    """
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            no_cache = os.environ.get("PKG_INSPECT_NO_HTTP_CACHE")
+            _HTTP_CLIENT = HTTPClient(cache=None if no_cache else get_http_cache())
+        return _HTTP_CLIENT
+
+
+__all__ = (
+    "RETRY_STATUSES",
+    "HTTPClient",
+    "get_http_client",
+)
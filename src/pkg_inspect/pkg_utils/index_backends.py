@@ -0,0 +1,339 @@
+"""
+This module provides the package index backends the release history of a package is built from.
+
+Each backend knows the url of a package on the index and how to parse its contents \
+into `(release date, version)` records. They are tried in order until one succeeds:
+
+- `json`: The PyPI JSON API (`/pypi/<name>/json`).
+- `simple`: The PEP 691 Simple JSON API (`/simple/<name>/`), with PEP 700 upload times.
+- `html`: The `#history` page of the project (scraped with a streaming parser; the slowest source).
+
+The index url defaults to `https://pypi.org` and can be overridden with the \
+'PKG_INSPECT_INDEX_URL' environment variable (E.g a mirror or a local stand-in server).
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+
+from .release_dates import RELEASE_DATE_FORMAT, parse_release_date
+from .utils import (
+    datetime,
+    deque,
+    intern_version,
+    json,
+    namedtuple,
+    normalize_name,
+    os,
+    package_version,
+    re,
+)
+from .util_types import Callable, Iterable, Iterator, Optional, Pattern
+
+
+# Default index url (without a trailing slash)
+DEFAULT_INDEX_URL: str = os.environ.get("PKG_INSPECT_INDEX_URL", "https://pypi.org")
+
+# Default backends (in order of preference)
+# Overridable with the 'PKG_INSPECT_INDEX_BACKENDS' environment variable (E.g 'json,html').
+DEFAULT_BACKENDS: tuple[str, ...] = (
+    *filter(
+        None, os.environ.get("PKG_INSPECT_INDEX_BACKENDS", "json,simple,html").split(",")
+    ),
+)
+
+
+# Release of a package.
+#   - `date` (datetime): The release (upload) date.
+#   - `version` (str): The released version.
+ReleaseRecord = namedtuple("ReleaseRecord", ("date", "version"))
+
+
+def _release_date(timestamp: str) -> datetime:
+    # E.g '2021-01-01T12:00:00.123456Z' -> datetime(2021, 1, 1)
+    # (Dates only, as shown on the history page)
+    return datetime.fromisoformat(timestamp[:10])
+
+
+def _is_final_release(version: str) -> bool:
+    # Pre-releases (and invalid versions) are excluded from the release history
+    try:
+        return not intern_version(version).is_prerelease
+    except package_version.InvalidVersion:
+        return False
+
+
+# region IndexBackend
+class IndexBackend(ABC):
+    """
+    Abstract base class of the package index backends (`url` and `parse` must be implemented).
+
+    #### Args:
+        - `index_url` (str, optional): The url of the package index. Defaults to `DEFAULT_INDEX_URL`.
+
+    #### Methods:
+        - `url`: Return the url of the specified package on the index.
+        - `parse`: Yield the release records of the contents of the url.
+        - `releases`: Return the unique release records (newest first).
+    """
+
+    # Name of the backend (E.g 'json')
+    name: str = ""
+
+    __slots__ = ("__weakref__", "_index_url")
+
+    def __init__(self, index_url: str = None) -> None:
+        self._index_url = (index_url or DEFAULT_INDEX_URL).rstrip("/")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(index_url={self._index_url!r})"
+
+    @abstractmethod
+    def url(self, package: str) -> str:
+        """Return the url of the specified package on the index."""
+
+    @abstractmethod
+    def parse(self, contents: str, package: str) -> Iterator[ReleaseRecord]:
+        """Yield the release records of the contents of the url (in any order, duplicates allowed)."""
+
+    def releases(self, contents: str, package: str) -> tuple[ReleaseRecord, ...]:
+        """
+        Return the unique release records of the contents of the url (newest first).
+
+        #### Raises:
+            - `ValueError`: If no release could be parsed from the contents.
+        """
+        records: dict[str, ReleaseRecord] = {}
+        for record in self.parse(contents, package):
+            records.setdefault(record.version, record)
+        if not records:
+            raise ValueError(f"No releases of {package!r} were found by {self!r}.")
+        return (
+            *sorted(
+                records.values(),
+                key=lambda r: (r.date, intern_version(r.version)),
+                reverse=True,
+            ),
+        )
+
+
+# endregion
+
+
+# Registered backends: {name: backend class}
+BACKENDS: dict[str, type[IndexBackend]] = {}
+
+
+def register_backend(name: str) -> Callable[[type[IndexBackend]], type[IndexBackend]]:
+    """Decorator to register an `IndexBackend` class under the specified name."""
+
+    def decorator(cls: type[IndexBackend]) -> type[IndexBackend]:
+        cls.name = name
+        BACKENDS[name] = cls
+        return cls
+
+    return decorator
+
+
+# region Backends
+@register_backend("json")
+class PyPIJSONBackend(IndexBackend):
+    """The PyPI JSON API backend (`/pypi/<name>/json`)."""
+
+    __slots__ = ()
+
+    def url(self, package: str) -> str:
+        return f"{self._index_url}/pypi/{normalize_name(package)}/json"
+
+    def parse(self, contents: str, package: str) -> Iterator[ReleaseRecord]:
+        # {"releases": {version: [{"upload_time": ...}, ...]}}
+        for version, files in json.loads(contents)["releases"].items():
+            if files and _is_final_release(version):
+                yield ReleaseRecord(
+                    _release_date(min(f["upload_time"] for f in files)), version
+                )
+
+
+@register_backend("simple")
+class SimpleJSONBackend(IndexBackend):
+    """
+    The PEP 691 Simple JSON API backend (`/simple/<name>/`).
+
+    - The JSON representation is requested with the `format` query parameter (see PEP 691).
+    - The release dates are the upload times of the files (PEP 700, api-version 1.1).
+    """
+
+    # Suffixes of the distribution files whose version directly follows the project name
+    _SPLIT_SUFFIXES: tuple[str, ...] = (".whl", ".egg")
+
+    __slots__ = ()
+
+    def url(self, package: str) -> str:
+        return (
+            f"{self._index_url}/simple/{normalize_name(package)}/"
+            "?format=application/vnd.pypi.simple.v1+json"
+        )
+
+    @classmethod
+    def _file_version(cls, filename: str) -> Optional[str]:
+        if filename.endswith(cls._SPLIT_SUFFIXES):
+            # E.g 'pandas-2.2.1-cp312-cp312-win_amd64.whl' -> '2.2.1'
+            parts = filename.split("-")
+            return parts[1] if len(parts) > 2 else None
+        # E.g 'pandas-2.2.1.tar.gz' -> '2.2.1'
+        stem = filename.removesuffix(".gz").removesuffix(".bz2").removesuffix(".xz")
+        stem = stem.removesuffix(".tar").removesuffix(".zip").removesuffix(".tgz")
+        _, sep, version = stem.rpartition("-")
+        return version if sep else None
+
+    def parse(self, contents: str, package: str) -> Iterator[ReleaseRecord]:
+        # {"files": [{"filename": ..., "upload-time": ...}, ...]}
+        dates: dict[str, str] = {}
+        for file in json.loads(contents)["files"]:
+            version = self._file_version(file["filename"])
+            upload_time = file.get("upload-time")
+            if version is None or upload_time is None:
+                continue
+            if version not in dates or upload_time < dates[version]:
+                dates[version] = upload_time
+
+        for version, upload_time in dates.items():
+            if _is_final_release(version):
+                yield ReleaseRecord(_release_date(upload_time), version)
+
+
+class _ReleaseRowParser(HTMLParser):
+    """
+    Incremental (`feed`) parser of the release rows (`div.release`) of a history page.
+
+    - The text of each row is collected as it is fed (in a single pass) and \
+        the completed rows are queued in `rows` until drained.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows: deque[str] = deque()
+        self._depth = 0  # Depth of the nested 'div' elements within the current row
+        self._text: list[str] = []  # Stripped text nodes of the current row
+        self._node: list[str] = []  # Pieces of the current text node (split across chunks)
+
+    def _flush_node(self) -> None:
+        if self._node:
+            if text := "".join(self._node).strip():
+                self._text.append(text)
+            self._node.clear()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self._flush_node()
+        if tag != "div":
+            return
+        if self._depth:
+            self._depth += 1
+        elif "release" in (dict(attrs).get("class") or "").split():
+            self._depth = 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_node()
+        if tag != "div" or not self._depth:
+            return
+        self._depth -= 1
+        if not self._depth:
+            # E.g 'div.release' -> '2.2.1Feb 23, 2024'
+            self.rows.append("".join(self._text))
+            self._text.clear()
+
+    def handle_data(self, data: str) -> None:
+        if self._depth:
+            self._node.append(data)
+
+
+@register_backend("html")
+class HTMLHistoryBackend(IndexBackend):
+    """
+    The `#history` page backend (scrapes the release rows of the project page).
+
+    - The page is parsed in a single pass; the date and version of each release row \
+        are extracted together as soon as the row is complete (see `parse_chunks`).
+    """
+
+    # Pattern for matching release dates
+    # Example: "Jan 1, 2021"
+    DATE_PATTERN: Pattern = r"[A-Z][a-z]{2}\s\d{1,2},\s\d{4}"
+
+    # Pattern for matching package versions
+    # Examples: "1.5", "4.25.1"
+    VERSION_PATTERN: Pattern = r"\d+\.\d+(\.\d+)?"
+
+    # Format of the release dates
+    DATE_FORMAT: str = RELEASE_DATE_FORMAT
+
+    _DATE_RE: re.Pattern = re.compile(DATE_PATTERN, re.IGNORECASE)
+    _VERSION_RE: re.Pattern = re.compile(VERSION_PATTERN, re.IGNORECASE)
+
+    __slots__ = ()
+
+    def url(self, package: str) -> str:
+        return f"{self._index_url}/project/{package}/#history"
+
+    def _parse_row(self, row: str) -> Optional[ReleaseRecord]:
+        # E.g '2.2.1Feb 23, 2024' -> (datetime(2024, 2, 23), '2.2.1')
+        # Rows without a version (or date) are skipped
+        if (version := self._VERSION_RE.search(row)) and (
+            date := self._DATE_RE.search(row)
+        ):
+            return ReleaseRecord(parse_release_date(date.group()), version.group())
+
+    def parse_chunks(self, chunks: Iterable[str]) -> Iterator[ReleaseRecord]:
+        """
+        Yield the release records of the history page as its chunks are fed (E.g while downloading).
+
+        #### Args:
+            - `chunks` (Iterable[str]): The (decoded) chunks of the history page.
+        """
+        parser = _ReleaseRowParser()
+        rows = parser.rows
+        for chunk in chunks:
+            parser.feed(chunk)
+            while rows:
+                if record := self._parse_row(rows.popleft()):
+                    yield record
+        parser.close()
+        while rows:
+            if record := self._parse_row(rows.popleft()):
+                yield record
+
+    def parse(self, contents: str, package: str) -> Iterator[ReleaseRecord]:
+        return self.parse_chunks((contents,))
+
+
+# endregion
+
+
+def get_backends(
+    names: Iterable[str] = None, index_url: str = None
+) -> tuple[IndexBackend, ...]:
+    """
+    Return the specified index backends (in order of preference).
+
+    #### Args:
+        - `names` (Iterable[str], optional): The names of the backends. Defaults to `DEFAULT_BACKENDS`.
+        - `index_url` (str, optional): The url of the package index. Defaults to `DEFAULT_INDEX_URL`.
+
+    #### Raises:
+        - `KeyError`: If a backend is not registered.
+    """
+    return (*(BACKENDS[name](index_url) for name in (names or DEFAULT_BACKENDS)),)
+
+
+__all__ = (
+    "BACKENDS",
+    "DEFAULT_BACKENDS",
+    "DEFAULT_INDEX_URL",
+    "HTMLHistoryBackend",
+    "IndexBackend",
+    "PyPIJSONBackend",
+    "ReleaseRecord",
+    "SimpleJSONBackend",
+    "get_backends",
+    "register_backend",
+)
@@ -0,0 +1,272 @@
+"""
+This module provides the persistent event loop every network request is executed on.
+
+`asyncio.run` creates (and tears down) an event loop per call, discarding the pooled \
+HTTP session each time, and cannot be called while an event loop is already running \
+(E.g from an `aiohttp` application). The `LoopRunner` instead runs a single event loop \
+in a background (daemon) thread for the lifetime of the process:
+
+- Sync callers submit coroutines and receive `concurrent.futures.Future` objects (or block on `run`).
+- Async callers await `run_async`, without blocking their own event loop.
+- Batches of coroutines are executed with bounded parallelism and their results are \
+streamed as each completes (`stream` / `stream_async`).
+
+NOTE: This module imports `asyncio` and is therefore only imported on first use.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+from concurrent.futures import Future
+from contextlib import suppress
+from queue import SimpleQueue
+from threading import Event, RLock, Thread, get_ident
+
+from .exception import PkgException
+from .utils import os
+from .util_types import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+
+# Name of the thread running the event loop
+_LOOP_THREAD_NAME: str = "pkg_inspect-loop"
+
+# Default maximum number of coroutines of a batch running at once
+# Overridable with the 'PKG_INSPECT_STREAM_LIMIT' environment variable.
+DEFAULT_STREAM_LIMIT: int = int(os.environ.get("PKG_INSPECT_STREAM_LIMIT", 32))
+
+# Sentinel marking the end of a stream
+_DONE = object()
+
+
+# region LoopRunner
+class LoopRunner:
+    """
+    A thread-safe runner of coroutines on a persistent, background event loop.
+
+    - The event loop (and its thread) is started on first use and stopped at interpreter exit.
+    - Resources bound to the event loop (E.g the pooled HTTP session) are reused across calls.
+
+    #### Methods:
+        - `submit`: Schedule a coroutine and return its `concurrent.futures.Future`.
+        - `run`: Schedule a coroutine and block until its result is available.
+        - `run_async`: Schedule a coroutine and await its result (from any event loop).
+        - `stream`: Run a coroutine function over items and yield the results as each completes.
+        - `stream_async`: The asynchronous counterpart of `stream` (from any event loop).
+        - `shutdown`: Close the HTTP session and stop the event loop \
+            (a new one is started on the next call).
+    """
+
+    __slots__ = ("__weakref__", "_lock", "_loop", "_thread")
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(running={self.is_running()})"
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """Return whether the caller is running on the thread of the event loop."""
+        return self._thread is not None and self._thread.ident == get_ident()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if not self.is_running():
+                loop = asyncio.new_event_loop()
+                started = Event()
+
+                def run_forever() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    try:
+                        loop.run_forever()
+                    finally:
+                        loop.close()
+
+                self._loop = loop
+                self._thread = Thread(
+                    target=run_forever, name=_LOOP_THREAD_NAME, daemon=True
+                )
+                self._thread.start()
+                started.wait()
+            return self._loop
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule the specified coroutine on the event loop and return its future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+
+    def run(self, coro: Coroutine, timeout: float = None) -> Any:
+        """
+        Schedule the specified coroutine on the event loop and block until its result is available.
+
+        #### Raises:
+            - `RuntimeError`: If called from the event loop itself (it would deadlock).
+            - `TimeoutError`: If the result is not available within `timeout` seconds.
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                f"{self.__class__.__name__}.run() cannot be called from its own event loop, "
+                "use 'await run_async()' instead."
+            )
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def run_async(self, coro: Coroutine) -> Any:
+        """
+        Await the specified coroutine on the event loop, from any event loop.
+
+        - Coroutines awaited from the event loop itself are awaited directly.
+        """
+        if self.in_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    @staticmethod
+    async def _stream(
+        func: Callable[[Any], Coroutine],
+        items: Iterable[Any],
+        limit: int,
+        emit: Callable[[tuple[Any, Any]], None],
+    ) -> None:
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(item: Any) -> None:
+            async with semaphore:
+                try:
+                    result = await func(item)
+                except (PkgException, Exception) as error:
+                    # Errors are streamed as results (E.g `asyncio.gather(return_exceptions=True)`)
+                    result = error
+            emit((item, result))
+
+        await asyncio.gather(*map(run, items))
+
+    def stream(
+        self,
+        func: Callable[[Any], Coroutine],
+        items: Iterable[Any],
+        limit: int = None,
+    ) -> Iterator[tuple[Any, Any]]:
+        """
+        Run the coroutine function over the items on the event loop and \
+            yield the `(item, result or error)` pairs as each completes.
+
+        - At most `limit` coroutines run at once; the others wait for a free slot.
+        - Closing the iterator early cancels the remaining coroutines.
+
+        #### Args:
+            - `func` (Callable[[Any], Coroutine]): The coroutine function to call with each item.
+            - `items` (Iterable[Any]): The items.
+            - `limit` (int, optional): The maximum number of running coroutines. Defaults to `DEFAULT_STREAM_LIMIT`.
+
+        #### Raises:
+            - `RuntimeError`: If called from the event loop itself (it would deadlock).
+        """
+        if self.in_loop_thread():
+            raise RuntimeError(
+                f"{self.__class__.__name__}.stream() cannot be called from its own event loop, "
+                "use 'async for ... in stream_async()' instead."
+            )
+        results = SimpleQueue()
+        future = self.submit(
+            self._stream(func, items, limit or DEFAULT_STREAM_LIMIT, results.put)
+        )
+        future.add_done_callback(lambda _: results.put(_DONE))
+        try:
+            while (result := results.get()) is not _DONE:
+                yield result
+            future.result()
+        finally:
+            future.cancel()
+
+    async def stream_async(
+        self,
+        func: Callable[[Any], Coroutine],
+        items: Iterable[Any],
+        limit: int = None,
+    ) -> AsyncIterator[tuple[Any, Any]]:
+        """
+        Run the coroutine function over the items on the event loop and \
+            yield the `(item, result or error)` pairs as each completes (from any event loop).
+
+        - See `stream` for the arguments.
+        """
+        loop = asyncio.get_running_loop()
+        results = asyncio.Queue()
+
+        def emit(result: Any) -> None:
+            with suppress(RuntimeError):
+                # The caller's event loop may already be closed
+                loop.call_soon_threadsafe(results.put_nowait, result)
+
+        future = self.submit(
+            self._stream(func, items, limit or DEFAULT_STREAM_LIMIT, emit)
+        )
+        future.add_done_callback(lambda _: emit(_DONE))
+        try:
+            while (result := await results.get()) is not _DONE:
+                yield result
+            future.result()
+        finally:
+            future.cancel()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Close the HTTP session of the event loop and stop the event loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if thread is None or not thread.is_alive():
+            return
+
+        from .http_client import get_http_client
+
+        try:
+            asyncio.run_coroutine_threadsafe(get_http_client().close(), loop).result(
+                timeout=timeout
+            )
+        except Exception:
+            # The interpreter may be exiting; the loop is stopped regardless.
+            ...
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+
+
+# endregion
+
+
+_LOOP_RUNNER: Optional[LoopRunner] = None
+_LOOP_RUNNER_LOCK = RLock()
+
+
+def get_loop_runner() -> LoopRunner:
+    """Return the process-wide `LoopRunner` instance (shut down at exit)."""
+    global _LOOP_RUNNER
+    with _LOOP_RUNNER_LOCK:
+        if _LOOP_RUNNER is None:
+            _LOOP_RUNNER = LoopRunner()
+            atexit.register(_LOOP_RUNNER.shutdown)
+        return _LOOP_RUNNER
+
+
+__all__ = (
+    "DEFAULT_STREAM_LIMIT",
+    "LoopRunner",
+    "get_loop_runner",
+)
@@ -0,0 +1,149 @@
+"""
+This module provides the fast parsing of release dates (E.g 'Jan 1, 2021') and their \
+optional conversion to NumPy `datetime64` arrays.
+
+- `parse_release_date` parses the fixed `Mon D, YYYY` shape with a month lookup table \
+instead of `datetime.strptime` (one of the slowest and locale-sensitive stdlib calls), \
+only falling back to `strptime` for other shapes.
+- `release_dates_array` / `epoch_days_array` convert a whole history column at once \
+(NumPy is optional: `pip install pkg_inspect[numpy]`), so date-range filters and \
+cadence statistics become array operations.
+"""
+from __future__ import annotations
+
+from array import array
+
+from .utils import datetime, lazy_import
+from .util_types import Any, Iterable, Union
+
+
+# Format of the release dates (E.g 'Jan 1, 2021')
+RELEASE_DATE_FORMAT: str = "%b %d, %Y"
+
+# Ordinal of the epoch (1970-01-01)
+EPOCH_ORDINAL: int = datetime(1970, 1, 1).toordinal()
+
+# {'jan': 1, ..., 'dec': 12} (English month abbreviations, regardless of the locale)
+_MONTHS: dict[str, int] = {
+    month: number
+    for number, month in enumerate(
+        (
+            "jan",
+            "feb",
+            "mar",
+            "apr",
+            "may",
+            "jun",
+            "jul",
+            "aug",
+            "sep",
+            "oct",
+            "nov",
+            "dec",
+        ),
+        1,
+    )
+}
+
+
+def parse_release_date(date: str) -> datetime:
+    """
+    Parse the specified `Mon D, YYYY` release date (E.g 'Jan 1, 2021' -> datetime(2021, 1, 1)).
+
+    #### Raises:
+        - `ValueError`: If the date does not match the `RELEASE_DATE_FORMAT` format.
+    """
+    try:
+        month, day, year = date.split()
+        if day[-1] == ",":
+            return datetime(int(year), _MONTHS[month.lower()], int(day[:-1]))
+    except (KeyError, ValueError):
+        ...
+    # Other shapes (and the usual 'does not match format' error)
+    return datetime.strptime(date, RELEASE_DATE_FORMAT)
+
+
+def epoch_days(date: Union[datetime, str]) -> int:
+    """Return the number of days since the epoch of the specified (release) date."""
+    if isinstance(date, str):
+        date = parse_release_date(date)
+    return date.toordinal() - EPOCH_ORDINAL
+
+
+def _numpy() -> Any:
+    try:
+        return lazy_import("numpy")
+    except ImportError as import_error:
+        raise ImportError(
+            "NumPy is required for the 'datetime64' batch conversions "
+            "(pip install 'pkg_inspect[numpy]')."
+        ) from import_error
+
+
+def epoch_days_array(days: Union[array, Iterable[int]]) -> Any:
+    """
+    Return the specified days since the epoch as a NumPy `datetime64[D]` array.
+
+    - `array('l')` columns (E.g `VersionIndex.days`) are converted without copying the integers.
+
+    #### Raises:
+        - `ImportError`: If NumPy is not installed.
+    """
+    np = _numpy()
+    if isinstance(days, array):
+        values = np.frombuffer(days, dtype=np.dtype(f"i{days.itemsize}"))
+    else:
+        values = np.fromiter(days, dtype=np.int64)
+    return values.astype("datetime64[D]")
+
+
+# {'jan': '01', ..., 'dec': '12'} (the ISO month of each abbreviation)
+_ISO_MONTHS: dict[str, str] = {month: f"{number:02d}" for month, number in _MONTHS.items()}
+
+
+def _iso_date(date: Union[datetime, str]) -> str:
+    # E.g 'Jan 1, 2021' -> '2021-01-01' (the month table, no 'datetime' object)
+    if isinstance(date, str):
+        try:
+            month, day, year = date.split()
+            day = day[:-1] if day[-1] == "," else ""
+            if 0 < len(day) < 3 and day.isdigit() and len(year) == 4 and year.isdigit():
+                return f"{year}-{_ISO_MONTHS[month.lower()]}-{day.zfill(2)}"
+        except (KeyError, ValueError):
+            ...
+        # Other shapes (and the usual 'does not match format' error)
+        date = parse_release_date(date)
+    return f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+
+
+def release_dates_array(dates: Iterable[Union[datetime, str]]) -> Any:
+    """
+    Convert the specified release dates (E.g a whole history column) to a NumPy `datetime64[D]` array.
+
+    - Each date is mapped to its ISO form (E.g 'Jan 1, 2021' -> '2021-01-01') with the \
+        month table, then the whole column is converted by a single NumPy call.
+
+    #### Example:
+    ```python
+    dates = release_dates_array(("Jan 1, 2021", "Feb 15, 2022"))
+    dates[dates >= np.datetime64("2022-01-01")]
+    # Output: array(['2022-02-15'], dtype='datetime64[D]')
+    ```
+
+    #### Raises:
+        - `ImportError`: If NumPy is not installed.
+        - `ValueError`: If a date does not match the `RELEASE_DATE_FORMAT` format.
+    """
+    np = _numpy()
+    # Out of range days (E.g 'Feb 30, 2021') are rejected by NumPy ('Day out of range')
+    return np.array([*map(_iso_date, dates)], dtype="datetime64[D]")
+
+
+__all__ = (
+    "EPOCH_ORDINAL",
+    "RELEASE_DATE_FORMAT",
+    "epoch_days",
+    "epoch_days_array",
+    "parse_release_date",
+    "release_dates_array",
+)
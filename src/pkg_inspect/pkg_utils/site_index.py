@@ -0,0 +1,344 @@
+"""
+This module provides a persistent (SQLite) index of the site-packages directories \
+of the installed Python versions and the distributions found within each of them.
+
+The index is stored under the `CACHE_DIR` directory and is invalidated per directory \
+using the directory modification time (`st_mtime_ns`), so only the site-packages \
+directories that have changed since the last scan are ever rescanned.
+
+The `Requires-Dist` values of the distributions are stored with the same invalidation, \
+read (in parallel) the first time they are requested for a given modification time.
+"""
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from threading import RLock
+
+from .utils import CACHE_DIR, Path, executor, namedtuple, os
+from .util_types import Iterable, Iterator, Optional, PathOrStr
+
+
+# Record of a single distribution found within a site-packages directory.
+#   - `name` (str): The package name of the distribution.
+#   - `version` (str): The version of the distribution (None for '.py' modules).
+#   - `path` (str): The full path of the '.dist-info' directory or '.py' file.
+DistRecord = namedtuple("DistRecord", ("name", "version", "path"))
+
+
+def _mtime(path: PathOrStr) -> Optional[int]:
+    """Return the modification time (ns) of the specified path or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return
+
+
+# Entry suffixes classified as distributions by the scanner
+_DIST_INFO: str = ".dist-info"
+_PY_MODULE: str = ".py"
+
+
+def iter_site_dir(site_dir: PathOrStr) -> Iterator[DistRecord]:
+    """
+    Yield the distributions found within the specified site-packages directory.
+
+    - The directory is read in a single `os.scandir` pass and every entry is \
+        classified by its name only (plain string operations, no `Path` objects, \
+        regular expressions or additional `stat` calls).
+    - Framework ('pyobjc') entries are skipped.
+
+    #### Args:
+        - `site_dir` (PathOrStr): The site-packages directory to scan.
+
+    #### Yields:
+        - `DistRecord`: The `(name, version, path)` record of each distribution.
+            - E.g `('pandas', '2.2.1', '.../site-packages/pandas-2.2.1.dist-info')`
+            - E.g `('six', None, '.../site-packages/six.py')`
+    """
+    with os.scandir(site_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if "pyobjc" in name.lower():
+                continue
+            if name.endswith(_DIST_INFO):
+                # E.g 'pandas-2.2.1.dist-info' -> ('pandas', '2.2.1')
+                pkg_name, _, version = name[: -len(_DIST_INFO)].partition("-")
+                yield DistRecord(pkg_name, version or None, entry.path)
+            elif name.endswith(_PY_MODULE):
+                # E.g 'six.py' -> 'six'
+                yield DistRecord(name[: -len(_PY_MODULE)], None, entry.path)
+
+
+# Header of the requirements within a METADATA file (case-insensitive)
+_REQUIRES_DIST: str = "requires-dist:"
+
+
+def read_requires_dist(dist_info: PathOrStr) -> tuple[str, ...]:
+    """
+    Return the `Requires-Dist` values of the METADATA file of the specified '.dist-info' directory.
+
+    - Only the headers are read (the description following the first blank line is skipped).
+    """
+    requires: list[str] = []
+    try:
+        with open(
+            os.path.join(dist_info, "METADATA"), encoding="utf-8", errors="replace"
+        ) as metadata:
+            for line in metadata:
+                if not line.strip():
+                    break
+                if line[: len(_REQUIRES_DIST)].lower() == _REQUIRES_DIST:
+                    requires.append(line[len(_REQUIRES_DIST) :].strip())
+    except OSError:
+        return ()
+    return (*requires,)
+
+
+def scan_site_dir(site_dir: PathOrStr) -> tuple[DistRecord, ...]:
+    """
+    Scan the specified site-packages directory for '.dist-info' directories and '.py' modules.
+
+    #### Args:
+        - `site_dir` (PathOrStr): The site-packages directory to scan.
+
+    #### Returns:
+        - `tuple[DistRecord, ...]`: The distributions found within the site-packages directory.
+    """
+    try:
+        return (*iter_site_dir(site_dir),)
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+
+
+# region SiteIndex
+class SiteIndex:
+    """
+    A persistent index of site-packages directories -> distributions.
+
+    - Results are kept in memory for the running process and persisted to an SQLite \
+        database so that subsequent processes can skip unchanged directories entirely.
+    - If the database cannot be created (e.g. read-only home directory), the index \
+        silently falls back to the in-memory layer only.
+
+    #### Args:
+        - `db_path` (PathOrStr, optional): The path of the SQLite database file.
+            - Defaults to `CACHE_DIR / "site_index.sqlite3"`.
+
+    #### Methods:
+        - `distributions`: Return the distributions found within a site-packages directory.
+        - `requirements`: Return the `Requires-Dist` values of the distributions of a site-packages directory.
+        - `clear`: Remove every entry from the index.
+    """
+
+    # Bump whenever the schema changes to rebuild outdated databases.
+    SCHEMA_VERSION: int = 3
+    SCHEMA: tuple[str, ...] = (
+        # 'requires_mtime': The modification time the requirements were read at (NULL if never)
+        "CREATE TABLE IF NOT EXISTS site_dirs ("
+        " path TEXT PRIMARY KEY, mtime INTEGER, requires_mtime INTEGER)",
+        "CREATE TABLE IF NOT EXISTS distributions ("
+        " site_dir TEXT NOT NULL, name TEXT NOT NULL, version TEXT,"
+        " path TEXT NOT NULL, PRIMARY KEY (site_dir, path))",
+        "CREATE TABLE IF NOT EXISTS requirements ("
+        " site_dir TEXT NOT NULL, path TEXT NOT NULL, requirement TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS requirements_site_dir ON requirements (site_dir)",
+    )
+
+    __slots__ = ("__weakref__", "_db_path", "_lock", "_requires", "_sites")
+
+    def __init__(self, db_path: PathOrStr = None) -> None:
+        self._lock = RLock()
+        # In-memory layer: {site_dir: (mtime, records)}
+        self._sites: dict[str, tuple[int, tuple[DistRecord, ...]]] = {}
+        # In-memory layer: {site_dir: (mtime, {dist-info path: requirements})}
+        self._requires: dict[str, tuple[int, dict[str, tuple[str, ...]]]] = {}
+        self._db_path = self._init_db(
+            Path(db_path) if db_path else CACHE_DIR / "site_index.sqlite3"
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(db_path={self._db_path!r})"
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path, timeout=30)
+
+    def _init_db(self, db_path: Path) -> Optional[Path]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(db_path, timeout=30)) as conn, conn:
+                (version,) = conn.execute("PRAGMA user_version").fetchone()
+                if version != self.SCHEMA_VERSION:
+                    # Rebuild the database if the schema is outdated
+                    for (table,) in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'"
+                    ).fetchall():
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                for stmt in self.SCHEMA:
+                    conn.execute(stmt)
+        except (OSError, sqlite3.Error):
+            # Persistence is optional; the in-memory layer is always available.
+            return
+        return db_path
+
+    def _query(self, sql: str, *params) -> list[tuple]:
+        if self._db_path is None:
+            return []
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return []
+
+    def _write(self, *statements: tuple[str, Iterable]) -> None:
+        if self._db_path is None:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                for sql, rows in statements:
+                    conn.executemany(sql, rows)
+        except sqlite3.Error:
+            ...
+
+    def distributions(self, site_dir: PathOrStr) -> tuple[DistRecord, ...]:
+        """
+        Return the distributions found within the specified site-packages directory.
+
+        - The directory is only rescanned if its modification time differs from the indexed one.
+
+        #### Args:
+            - `site_dir` (PathOrStr): The site-packages directory.
+
+        #### Returns:
+            - `tuple[DistRecord, ...]`: The distributions found within the directory.
+        """
+        site_dir = Path(site_dir).as_posix()
+        mtime = _mtime(site_dir)
+        with self._lock:
+            cached = self._sites.get(site_dir)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            stored = self._query("SELECT mtime FROM site_dirs WHERE path = ?", site_dir)
+            if stored and stored[0][0] == mtime:
+                records = (
+                    *(
+                        DistRecord(*row)
+                        for row in self._query(
+                            "SELECT name, version, path FROM distributions"
+                            " WHERE site_dir = ? ORDER BY path",
+                            site_dir,
+                        )
+                    ),
+                )
+            else:
+                records = scan_site_dir(site_dir)
+                self._write(
+                    ("DELETE FROM distributions WHERE site_dir = ?", [(site_dir,)]),
+                    (
+                        # Replacing the row also invalidates the stored requirements
+                        "INSERT OR REPLACE INTO site_dirs (path, mtime) VALUES (?, ?)",
+                        [(site_dir, mtime)],
+                    ),
+                    (
+                        "INSERT OR REPLACE INTO distributions VALUES (?, ?, ?, ?)",
+                        [(site_dir, *r) for r in records],
+                    ),
+                )
+            self._sites[site_dir] = mtime, records
+            return records
+
+    def requirements(self, site_dir: PathOrStr) -> dict[str, tuple[str, ...]]:
+        """
+        Return the `Requires-Dist` values of the '.dist-info' directories within the specified \
+            site-packages directory.
+
+        - The METADATA files are only read (in parallel) if the directory has changed \
+            since they were last read; the values are persisted with the distributions.
+
+        #### Args:
+            - `site_dir` (PathOrStr): The site-packages directory.
+
+        #### Returns:
+            - `dict[str, tuple[str, ...]]`: The requirements of each '.dist-info' path.
+                - E.g `{'.../requests-2.31.0.dist-info': ('idna<4,>=2.5', ...)}`
+        """
+        records = self.distributions(site_dir)
+        site_dir = Path(site_dir).as_posix()
+        mtime = _mtime(site_dir)
+        with self._lock:
+            cached = self._requires.get(site_dir)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            dist_infos = [r.path for r in records if r.path.endswith(_DIST_INFO)]
+            stored = self._query(
+                "SELECT requires_mtime FROM site_dirs WHERE path = ?", site_dir
+            )
+            if stored and stored[0][0] is not None and stored[0][0] == mtime:
+                rows: dict[str, list[str]] = {}
+                for path, requirement in self._query(
+                    "SELECT path, requirement FROM requirements"
+                    " WHERE site_dir = ? ORDER BY rowid",
+                    site_dir,
+                ):
+                    rows.setdefault(path, []).append(requirement)
+                requires = {p: (*rows.get(p, ()),) for p in dist_infos}
+            else:
+                requires = dict(zip(dist_infos, executor(read_requires_dist, dist_infos)))
+                self._write(
+                    ("DELETE FROM requirements WHERE site_dir = ?", [(site_dir,)]),
+                    (
+                        "INSERT INTO requirements VALUES (?, ?, ?)",
+                        [
+                            (site_dir, path, requirement)
+                            for path, values in requires.items()
+                            for requirement in values
+                        ],
+                    ),
+                    (
+                        "UPDATE site_dirs SET requires_mtime = ? WHERE path = ?",
+                        [(mtime, site_dir)],
+                    ),
+                )
+            self._requires[site_dir] = mtime, requires
+            return requires
+
+    def clear(self) -> None:
+        """Remove every entry from the (in-memory and on-disk) index."""
+        with self._lock:
+            self._sites.clear()
+            self._requires.clear()
+            self._write(
+                *(
+                    (f"DELETE FROM {table}", [()])
+                    for table in ("site_dirs", "distributions", "requirements")
+                )
+            )
+
+
+# endregion
+
+
+_SITE_INDEX: Optional[SiteIndex] = None
+_SITE_INDEX_LOCK = RLock()
+
+
+def get_site_index() -> SiteIndex:
+    """Return the process-wide default `SiteIndex` instance."""
+    global _SITE_INDEX
+    with _SITE_INDEX_LOCK:
+        if _SITE_INDEX is None:
+            _SITE_INDEX = SiteIndex()
+        return _SITE_INDEX
+
+
+__all__ = (
+    "DistRecord",
+    "SiteIndex",
+    "get_site_index",
+    "iter_site_dir",
+    "read_requires_dist",
+    "scan_site_dir",
+)
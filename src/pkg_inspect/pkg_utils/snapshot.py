@@ -0,0 +1,343 @@
+"""
+This module provides the process-wide registry of scan snapshots shared by every \
+`PkgInspect` instance.
+
+A snapshot captures the discovered interpreters and the distributions of each of their \
+site-packages directories at a point in time. Within the staleness window (`max_age`), \
+snapshots are served without touching the filesystem at all; once stale, the next \
+lookup rediscovers the interpreters and revalidates the site index (which itself only \
+rescans the modified site-packages directories).
+"""
+from __future__ import annotations
+
+from threading import RLock
+from time import monotonic
+
+from .dependency_graph import (
+    Conflict,
+    DependencyGraph,
+    ReverseDependency,
+    build_dependency_graphs,
+    build_reverse_index,
+    check_dependencies,
+)
+from .discovery import Interpreter, InterpreterDiscovery
+from .site_index import DistRecord, SiteIndex
+from .utils import normalize_name, os
+from .util_types import Any, Iterator, Optional, PackageVersion, Union
+
+
+# Default staleness window (seconds) of the snapshots
+# Overridable with the 'PKG_INSPECT_SNAPSHOT_TTL' environment variable.
+DEFAULT_MAX_AGE: float = float(os.environ.get("PKG_INSPECT_SNAPSHOT_TTL", 30))
+
+
+# region ScanSnapshot
+class ScanSnapshot:
+    """
+    An immutable view of the installed interpreters and their distributions.
+
+    #### Attributes:
+        - `interpreters` (tuple[Interpreter, ...]): The discovered interpreters.
+        - `distributions` (tuple[tuple[PackageVersion, tuple[DistRecord, ...]], ...]): \
+            The distributions of each site-packages directory, paired with its Python version.
+        - `created` (float): The (monotonic) creation time of the snapshot.
+
+    #### Args:
+        - `interpreters` (tuple[Interpreter, ...]): The discovered interpreters.
+        - `distributions` (tuple[tuple[PackageVersion, tuple[DistRecord, ...]], ...]): \
+            The distributions of each site-packages directory, in the order of the \
+            interpreters and their site-packages directories (see `SnapshotRegistry`).
+        - `site_index` (SiteIndex, optional): The site index the distributions were read from \
+            (the `Requires-Dist` values are then read from it, see `SiteIndex.requirements`).
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "interpreters",
+        "distributions",
+        "created",
+        "_lock",
+        "_interpreter_dists",
+        "_name_indexes",
+        "_site_index",
+        "_dependency_graphs",
+        "_reverse_index",
+    )
+
+    def __init__(
+        self,
+        interpreters: tuple[Interpreter, ...],
+        distributions: tuple[tuple[PackageVersion, tuple[DistRecord, ...]], ...],
+        site_index: SiteIndex = None,
+    ) -> None:
+        self.interpreters = interpreters
+        self.distributions = distributions
+        self.created = monotonic()
+        self._lock = RLock()
+        # {interpreter: distributions of each of its site-packages directories}
+        self._interpreter_dists: dict[Interpreter, tuple[tuple[DistRecord, ...], ...]] = {}
+        site_dists = iter(distributions)
+        for interpreter in interpreters:
+            self._interpreter_dists[interpreter] = (
+                *(dists for _, (_, dists) in zip(interpreter.site_dirs, site_dists)),
+            )
+        # {py_version or interpreter: (name index, indexed names)}
+        self._name_indexes: dict[Any, tuple[dict[str, DistRecord], tuple[str, ...]]] = {}
+        self._site_index = site_index
+        # {interpreter: dependency graph} and {name: reverse dependencies} (built together on first use)
+        self._dependency_graphs: Optional[dict[Interpreter, DependencyGraph]] = None
+        self._reverse_index: Optional[dict[str, tuple[ReverseDependency, ...]]] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(interpreters={len(self.interpreters)}, "
+            f"distributions={sum(len(d) for _, d in self.distributions)})"
+        )
+
+    def age(self) -> float:
+        """Return the age (seconds) of the snapshot."""
+        return monotonic() - self.created
+
+    def versions(self) -> tuple[PackageVersion, ...]:
+        """Return the unique Python versions of the snapshot (sorted)."""
+        return (*sorted({i.version for i in self.interpreters}),)
+
+    def name_index(
+        self, key: Union[PackageVersion, Interpreter]
+    ) -> tuple[dict[str, DistRecord], tuple[str, ...]]:
+        """
+        Return the (PEP 503) normalized name -> distribution index for the specified \
+            Python version or interpreter.
+
+        - The index is built once per key and snapshot.
+        - A Python version indexes every interpreter of that version (E.g a pyenv and a \
+            conda 3.13), an `Interpreter` only its own site-packages directories.
+        - '.dist-info' directories take precedence over '.py' modules of the same name.
+
+        #### Returns:
+            - `tuple[dict[str, DistRecord], tuple[str, ...]]`: The index and its indexed names.
+        """
+        with self._lock:
+            if (cached := self._name_indexes.get(key)) is not None:
+                return cached
+
+            if isinstance(key, Interpreter):
+                site_dists = self._interpreter_dists.get(key, ())
+            else:
+                site_dists = (dists for pyver, dists in self.distributions if pyver == key)
+            name_index: dict[str, DistRecord] = {}
+            for dists in site_dists:
+                for dist in dists:
+                    name = normalize_name(dist.name)
+                    if name not in name_index or (
+                        dist.version and not name_index[name].version
+                    ):
+                        name_index[name] = dist
+            cached = self._name_indexes[key] = name_index, (*name_index,)
+            return cached
+
+    def _build_dependency_graphs(self) -> dict[Interpreter, DependencyGraph]:
+        with self._lock:
+            if self._dependency_graphs is None:
+                # {interpreter: {'.dist-info' path: Requires-Dist values}}
+                requires: dict[Interpreter, dict[str, tuple[str, ...]]] = {}
+                if self._site_index is not None:
+                    for interpreter in self.interpreters:
+                        requires[interpreter] = interpreter_requires = {}
+                        for site_dir in interpreter.site_dirs:
+                            interpreter_requires.update(
+                                self._site_index.requirements(site_dir)
+                            )
+                graphs = build_dependency_graphs(
+                    {i: self.name_index(i)[0] for i in self.interpreters}, requires
+                )
+                self._reverse_index = build_reverse_index(graphs)
+                self._dependency_graphs = graphs
+            return self._dependency_graphs
+
+    def dependency_graphs(self) -> dict[Interpreter, DependencyGraph]:
+        """
+        Return the dependency graph of each interpreter (sorted by version and root).
+
+        - The graphs of every interpreter (and the reverse-dependency index) are built \
+            together on first use and cached with the snapshot.
+        """
+        return {**self._build_dependency_graphs()}
+
+    def dependency_graph(self, key: Union[PackageVersion, Interpreter]) -> DependencyGraph:
+        """
+        Return the dependency graph of the distributions installed for the specified \
+            interpreter or Python version.
+
+        - A Python version selects its first interpreter (sorted by root); pass the \
+            `Interpreter` itself to select another interpreter of the same version.
+
+        #### Raises:
+            - `KeyError`: If the interpreter or Python version is not part of the snapshot.
+        """
+        graphs = self._build_dependency_graphs()
+        if isinstance(key, Interpreter):
+            return graphs[key]
+        for interpreter, graph in graphs.items():
+            if interpreter.version == key:
+                return graph
+        raise KeyError(key)
+
+    def dependents(self, name: str) -> tuple[ReverseDependency, ...]:
+        """
+        Return the installed distributions requiring the specified distribution, \
+            in every interpreter (a single dictionary lookup once built).
+
+        #### Returns:
+            - `tuple[ReverseDependency, ...]`: The `(pyversion, dependent, specifier, root)` records \
+                (sorted by Python version, interpreter root and dependent).
+        """
+        self._build_dependency_graphs()
+        return self._reverse_index.get(normalize_name(name), ())
+
+    def check_environment(self) -> Iterator[Conflict]:
+        """
+        Yield the unsatisfied requirements of the installed distributions, in every interpreter \
+            (E.g `pip check` for each interpreter).
+
+        - The interpreters are checked one after the other (see `check_dependencies`), \
+            in version and root order, and their conflicts are yielded as soon as each \
+            interpreter is checked.
+        - Specifier evaluations are shared across the interpreters (the check is \
+            CPU-bound: the memo, not threads, is what keeps it fast).
+
+        #### Yields:
+            - `Conflict`: The `(pyversion, dependent, dependency, specifier, installed, root)` records.
+        """
+        graphs = self._build_dependency_graphs()
+        # {(id(specifier), version): match} (the specifiers are kept alive by the graphs)
+        matches: dict[tuple[int, PackageVersion], bool] = {}
+        for graph in graphs.values():
+            yield from check_dependencies(graph, matches=matches)
+
+
+# endregion
+
+
+# region SnapshotRegistry
+class SnapshotRegistry:
+    """
+    A thread-safe registry of `ScanSnapshot` objects shared across the process.
+
+    - One snapshot is kept per `(discovery, site_index)` pair.
+    - Snapshots older than `max_age` seconds are rebuilt on the next lookup, and the \
+        stale snapshots of the other pairs are evicted (E.g those of a discarded \
+        `InterpreterDiscovery` or `SiteIndex`), so they are not kept for the life of the process.
+
+    #### Args:
+        - `max_age` (float, optional): The staleness window (seconds) of the snapshots.
+            - Defaults to `DEFAULT_MAX_AGE` (30 seconds).
+            - `0` disables sharing (every lookup rebuilds the snapshot).
+
+    #### Methods:
+        - `get`: Return the snapshot for a discovery engine and site index.
+        - `refresh`: Discard every snapshot (and the cached discovery results).
+    """
+
+    __slots__ = ("__weakref__", "_lock", "_max_age", "_snapshots")
+
+    def __init__(self, max_age: float = None) -> None:
+        self._lock = RLock()
+        self._max_age = DEFAULT_MAX_AGE if max_age is None else float(max_age)
+        # {(discovery, site_index): snapshot}
+        self._snapshots: dict[tuple[InterpreterDiscovery, SiteIndex], ScanSnapshot] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_age={self._max_age!r})"
+
+    @property
+    def max_age(self) -> float:
+        """The staleness window (seconds) of the snapshots."""
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, value: float) -> None:
+        with self._lock:
+            self._max_age = float(value)
+
+    def _build(
+        self, discovery: InterpreterDiscovery, site_index: SiteIndex
+    ) -> ScanSnapshot:
+        interpreters = discovery.interpreters()
+        return ScanSnapshot(
+            interpreters,
+            (
+                *(
+                    (interpreter.version, site_index.distributions(p))
+                    for interpreter in interpreters
+                    for p in interpreter.site_dirs
+                ),
+            ),
+            site_index,
+        )
+
+    def get(
+        self, discovery: InterpreterDiscovery, site_index: SiteIndex
+    ) -> ScanSnapshot:
+        """
+        Return the snapshot for the specified discovery engine and site index.
+
+        - The snapshot is rebuilt if it does not exist or is older than `max_age`.
+        """
+        key = discovery, site_index
+        with self._lock:
+            self._evict_stale(key)
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.age() < self._max_age:
+                return snapshot
+            if snapshot is not None:
+                # Stale: Pick up newly (un)installed interpreters as well
+                discovery.refresh()
+            snapshot = self._snapshots[key] = self._build(discovery, site_index)
+            return snapshot
+
+    def _evict_stale(self, keep: tuple[InterpreterDiscovery, SiteIndex]) -> None:
+        # Drop the stale snapshots of the other pairs (their discovery results are
+        # stale as well: the next lookup of an evicted pair rediscovers the interpreters)
+        for key, snapshot in [*self._snapshots.items()]:
+            if key != keep and snapshot.age() >= self._max_age:
+                del self._snapshots[key]
+                key[0].refresh()
+
+    def refresh(self) -> None:
+        """Discard every snapshot so the next lookup rescans the installed interpreters."""
+        with self._lock:
+            for discovery, _ in self._snapshots:
+                discovery.refresh()
+            self._snapshots.clear()
+
+
+# endregion
+
+
+_REGISTRY: Optional[SnapshotRegistry] = None
+_REGISTRY_LOCK = RLock()
+
+
+def get_snapshot_registry() -> SnapshotRegistry:
+    """Return the process-wide `SnapshotRegistry` instance."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = SnapshotRegistry()
+        return _REGISTRY
+
+
+def refresh_snapshots() -> None:
+    """Discard the process-wide scan snapshots (E.g after installing a package)."""
+    get_snapshot_registry().refresh()
+
+
+__all__ = (
+    "DEFAULT_MAX_AGE",
+    "ScanSnapshot",
+    "SnapshotRegistry",
+    "get_snapshot_registry",
+    "refresh_snapshots",
+)
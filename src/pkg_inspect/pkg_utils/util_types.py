@@ -16,8 +16,11 @@ from .utils import (
 )
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
+    Coroutine,
     Generator,
+    Hashable,
     Iterable,
     Iterator,
     Literal,
@@ -59,8 +62,11 @@ ZeroOrOne = Literal[0, 1]
 
 __all__ = (
     "Any",
+    "AsyncIterator",
     "Callable",
+    "Coroutine",
     "Generator",
+    "Hashable",
     "Iterable",
     "Iterator",
     "Literal",
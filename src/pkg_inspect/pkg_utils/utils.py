@@ -5,25 +5,19 @@ offering a diverse set of tools for common tasks.
 from __future__ import annotations
 
 # Shared Modules
-import asyncio
+# NOTE: The network stack ('asyncio', 'aiohttp', 'bs4') is imported lazily (see 'LazyImports').
+import atexit
 import importlib
 import inspect
 import json
 import operator
 import os
 import re
-from aiohttp import ClientSession, TCPConnector
-from aiohttp.client_exceptions import (
-    ClientConnectionError,
-    ClientResponseError,
-    ContentTypeError,
-    InvalidURL,
-    ServerDisconnectedError,
-)
-from collections import Counter, namedtuple
+from collections import Counter, deque, namedtuple
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
-from functools import cache, cached_property, partial, wraps
+from functools import cache, cached_property, lru_cache, partial, wraps
 from itertools import chain, cycle, filterfalse, islice, tee
 from operator import itemgetter
 from packaging import version as package_version
@@ -32,6 +26,8 @@ from random import SystemRandom
 from rapidfuzz import fuzz, process
 from reprlib import recursive_repr
 from string import ascii_letters, ascii_lowercase, ascii_uppercase, digits, punctuation
+from threading import RLock, current_thread
+from time import monotonic
 
 # Exception Handler and Type Hint Variables
 from .exception import PkgException, RedPkgE
@@ -75,6 +71,15 @@ from .util_types import (
 DUMMY_PATH: Path = Path(__file__).parents[3]
 
 
+# Default cache directory for persistent (on-disk) data
+#   - Can be overridden with the 'PKG_INSPECT_CACHE_DIR' environment variable.
+#   - Defaults to '$XDG_CACHE_HOME/pkg_inspect' or '~/.cache/pkg_inspect'.
+CACHE_DIR: Path = Path(
+    os.environ.get("PKG_INSPECT_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pkg_inspect"
+)
+
+
 # Field names and custom types to extract
 # from the package's METADATA file or dist-info ('site_path') directory.
 METADATA_FIELDS: tuple[str] = (
@@ -255,13 +260,163 @@ def has_decorators(c, decorator: str = "__wrapped__"):
 # endregion
 
 
+# region LazyImports
+# Heavy (network-only) dependencies resolved on first access
+# {attribute: (module, attribute within the module)}
+_LAZY_ATTRS: dict[str, tuple[str, Optional[str]]] = {
+    "asyncio": ("asyncio", None),
+    "importlib_metadata": ("importlib_metadata", None),
+    "BeautifulSoup": ("bs4", "BeautifulSoup"),
+    **{
+        name: ("aiohttp", name)
+        for name in (
+            "ClientConnectionError",
+            "ClientResponseError",
+            "ClientSession",
+            "ContentTypeError",
+            "InvalidURL",
+            "ServerDisconnectedError",
+            "TCPConnector",
+        )
+    },
+}
+
+
+def lazy_import(module: str, attr: str = None) -> Any:
+    """
+    Import the specified module on first use and return it (or one of its attributes).
+
+    #### Example:
+    ```python
+    BeautifulSoup = lazy_import("bs4", "BeautifulSoup")
+    ```
+    """
+    imported_module = importlib.import_module(module)
+    return getattr(imported_module, attr) if attr else imported_module
+
+
+def __getattr__(name: str) -> Any:
+    # E.g 'utils.ClientSession' imports 'aiohttp' on first access only
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = lazy_import(module, attr)
+    return value
+
+
+# endregion
+
+
 # region ExecutorUtil
+# Thread name prefix of the shared thread pool workers
+# (distinct from the other 'pkg_inspect' threads, E.g the event loop thread)
+_POOL_THREAD_PREFIX: str = "pkg_inspect-pool"
+
+
+def _in_pool_thread() -> bool:
+    # 'ThreadPoolExecutor' workers are named '<prefix>_<index>'
+    prefix, sep, index = current_thread().name.rpartition("_")
+    return bool(sep) and prefix == _POOL_THREAD_PREFIX and index.isdigit()
+
+
+class PoolManager:
+    """
+    A process-wide manager of lazily created, size-bounded executor pools.
+
+    - One `ThreadPoolExecutor` and one `ProcessPoolExecutor` are created on first use \
+        and reused by every `executor` call (no pool creation on hot paths).
+    - Every pool is shut down at interpreter exit (pending work is cancelled).
+
+    #### Args:
+        - `max_threads` (int, optional): The number of threads of the thread pool.
+            - Defaults to `min(32, os.cpu_count() + 4)`.
+        - `max_processes` (int, optional): The number of processes of the process pool.
+            - Defaults to `os.cpu_count()`.
+
+    #### Methods:
+        - `get`: Return the pool of the specified executor type.
+        - `max_workers`: Return the number of workers of the specified executor type.
+        - `shutdown`: Shut down every pool (a new pool is created on the next `get`).
+    """
+
+    __slots__ = ("__weakref__", "_lock", "_pools", "_sizes")
+
+    def __init__(self, max_threads: int = None, max_processes: int = None) -> None:
+        cpus = os.cpu_count() or 1
+        self._lock = RLock()
+        self._pools: dict[type, Any] = {}
+        self._sizes: dict[type, int] = {
+            ThreadPoolExecutor: max_threads or min(32, cpus + 4),
+            ProcessPoolExecutor: max_processes or cpus,
+        }
+
+    def __repr__(self) -> str:
+        sizes = {k.__name__: v for k, v in self._sizes.items()}
+        return f"{self.__class__.__name__}({sizes})"
+
+    def max_workers(self, kind: type = ThreadPoolExecutor) -> int:
+        return self._sizes[kind]
+
+    def get(self, kind: type = ThreadPoolExecutor):
+        with self._lock:
+            if (pool := self._pools.get(kind)) is None:
+                kwargs = {"max_workers": self._sizes[kind]}
+                if kind is ThreadPoolExecutor:
+                    kwargs["thread_name_prefix"] = _POOL_THREAD_PREFIX
+                pool = self._pools[kind] = kind(**kwargs)
+            return pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_POOL_MANAGER: Optional[PoolManager] = None
+
+
+def get_pool_manager() -> PoolManager:
+    """Return the process-wide `PoolManager` instance (shut down at exit)."""
+    global _POOL_MANAGER
+    if _POOL_MANAGER is None:
+        _POOL_MANAGER = PoolManager()
+        atexit.register(_POOL_MANAGER.shutdown)
+    return _POOL_MANAGER
+
+
+def _bounded_map(
+    pool, func: Callable, iterables: tuple[Iterable, ...], window: int, deadline: float
+) -> Iterator[Any]:
+    # Ordered 'map' keeping at most 'window' calls in flight.
+    # Pending calls are cancelled once the deadline passes or the generator is closed.
+    items = zip(*iterables)
+    pending = deque(pool.submit(func, *i) for i in islice(items, window))
+    try:
+        while pending:
+            remaining = None if deadline is None else max(0, deadline - monotonic())
+            try:
+                result = pending.popleft().result(timeout=remaining)
+            except FutureTimeoutError:
+                # Not a 'TimeoutError' subclass prior to Python 3.11
+                raise TimeoutError(f"The execution deadline of {func!r} was exceeded.")
+            pending.extend(pool.submit(func, *i) for i in islice(items, 1))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 def executor(func: Callable, *args: Iterable, **kwargs: Any) -> Iterator[Any]:
     """
     Execute the specified function concurrently using the selected executor pool.
     The function is applied to the specified arguments and keyword arguments
     using the selected executor pool.
 
+    - The pools are shared by the whole process (see `PoolManager`).
+    - Calls made from within a shared thread pool worker are executed serially \
+        (prevents nested calls from exhausting the pool).
 
     #### Args:
         - `func` (Callable): The function to execute concurrently.
@@ -270,23 +425,32 @@ def executor(func: Callable, *args: Iterable, **kwargs: Any) -> Iterator[Any]:
             - `epool` (Union[Union[ProcessPoolExecutor, Literal["PPEx"]], Union[ThreadPoolExecutor, Literal["TPEx"]]]): \
                 The executor pool to use for the concurrent execution.
                 - Defaults to `ThreadPoolExecutor`.
-            - Including `<epool.map>` kwargs.
-                - `max_workers` (int, optional): The maximum number of workers to use for the concurrent execution.
-                - `chunksize` (int, optional): The chunksize to use for the concurrent execution.
-                - `timeout` (int, optional): The timeout to use for the concurrent execution.
-                    - Defaults to `DEFAULT_TIMEOUT` (300 seconds).
+            - `max_workers` (int, optional): The maximum number of calls in flight for this execution.
+                - Defaults to the size of the shared pool.
+            - `chunksize` (int, optional): The chunksize to use for the concurrent execution (`ProcessPoolExecutor` only).
+            - `timeout` (int, optional): The deadline (seconds) of the whole execution.
+                - Once exceeded, the pending calls are cancelled and a `TimeoutError` is raised.
+                - Defaults to None (no deadline).
 
     #### Returns:
         - `Iterator`: The result of the concurrent execution.
 
     #### Raises:
         - `PipException`: The 'max_workers' argument must be None or a positive integer value.
+        - `TimeoutError`: The deadline was exceeded.
+        - `TypeError`: An unsupported keyword argument was specified.
     """
     # Extract the 'max_workers' and 'epool' arguments from the keyword arguments
-    mw, epool, kwargs = popkwargs("max_workers", "epool", **kwargs)
+    mw, epool, timeout, chunksize, kwargs = popkwargs(
+        "max_workers", "epool", "timeout", "chunksize", **kwargs
+    )
+    if kwargs:
+        raise TypeError(
+            f"executor() got unexpected keyword argument(s): {', '.join(map(repr, kwargs))}"
+        )
 
     # Ensure the 'max_workers' argument is a valid type.
-    if all((mw is not None, not isinstance(mw, int))):
+    if mw is not None and (not isinstance(mw, int) or mw < 1):
         raise PkgException(
             "The 'max_workers' argument must be None or a positive integer value."
         )
@@ -299,8 +463,22 @@ def executor(func: Callable, *args: Iterable, **kwargs: Any) -> Iterator[Any]:
         in (ProcessPoolExecutor, "PPEx")
     ]
 
-    # Execute the function concurrently using the selected executor pool
-    yield from _exec(max_workers=mw).map(func, *args, **kwargs)
+    if _exec is ThreadPoolExecutor and _in_pool_thread():
+        # Already running within the shared thread pool
+        yield from map(func, *args)
+        return
+
+    manager = get_pool_manager()
+    pool = manager.get(_exec)
+    if _exec is ProcessPoolExecutor and chunksize:
+        # 'Executor.map' measures its timeout from the call (deadline)
+        yield from pool.map(func, *args, timeout=timeout, chunksize=chunksize)
+        return
+
+    # Execute the function concurrently using the shared executor pool
+    deadline = None if timeout is None else monotonic() + timeout
+    window = min(mw or manager.max_workers(_exec), manager.max_workers(_exec))
+    yield from _bounded_map(pool, func, args, window, deadline)
 
 
 # endregion
@@ -545,6 +723,56 @@ def rm_period(s: str) -> str:
     return clean(s, ".")
 
 
+# PEP 503 separator runs (E.g 'Key__Craftsman' -> 'key-craftsman')
+_NAME_SEPARATORS: Pattern = re.compile(r"[-_.]+")
+
+
+def normalize_name(name: str) -> str:
+    """Return the PEP 503 normalized form of the specified package name."""
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
+
+# endregion
+
+# region VersionUtils
+# Maximum number of interned versions
+# Overridable with the 'PKG_INSPECT_VERSION_CACHE_SIZE' environment variable.
+VERSION_CACHE_SIZE: int = int(os.environ.get("PKG_INSPECT_VERSION_CACHE_SIZE", 8192))
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _intern_version(version: str) -> package_version.Version:
+    return package_version.parse(version)
+
+
+def intern_version(
+    version: Union[str, package_version.Version]
+) -> package_version.Version:
+    """
+    Return the parsed (`packaging.version`) version of the specified string, interned.
+
+    - Equal strings return the same (immutable) `Version` object, so repeated versions \
+        (E.g '3.12' or '1.26.4' across an environment scan) are parsed and allocated once.
+    - The cache is bounded (least recently used); see `version_cache_info`.
+
+    #### Raises:
+        - `packaging.version.InvalidVersion`: If the version is not a valid (PEP 440) version.
+    """
+    if isinstance(version, package_version.Version):
+        return version
+    return _intern_version(version)
+
+
+def version_cache_info() -> NamedTuple:
+    """Return the hits, misses, maxsize and current size of the interned versions cache."""
+    return _intern_version.cache_info()
+
+
+def version_cache_clear() -> None:
+    """Remove every interned version and reset the statistics."""
+    _intern_version.cache_clear()
+
+
 # endregion
 
 # region GenUtils
@@ -561,7 +789,7 @@ class PkgGenRepr(Iterable):
     ```
     """
 
-    __slots__ = ("__weakrefs__", "_gen", "_gen_id")
+    __slots__ = ("__weakref__", "_gen", "_gen_id")
 
     def __init__(self, gen) -> None:
         self._gen = gen
@@ -1497,36 +1725,14 @@ def abbreviate_number(num: Union[int, str]):
 
 
 async def url_request(url: PathOrStr, **kwargs) -> Union[str, Any]:
-    try:
-        async with ClientSession(
-            connector=TCPConnector(
-                ssl=False,
-                enable_cleanup_closed=True,
-                force_close=True,
-                ttl_dns_cache=DEFAULT_TIMEOUT,
-            ),
-            raise_for_status=True,
-        ) as session:
-            if isinstance(url, Path):
-                url = url.as_posix()
-            async with session.get(url, **kwargs) as response:
-                # If the response is valid, return the response text.
-                return await response.text()
-    except ContentTypeError as cte:
-        # If the content type is not valid, raise a `ContentTypeError`.
-        raise cte
-    except (ClientConnectionError, ServerDisconnectedError):
-        # If the client connection is not valid, recursively retry the request.
-        return await url_request(url)
-    except InvalidURL:
-        # If the URL is not valid, raise an `PkgException` error.
-        raise RedPkgE(
-            "The specified url could not be found and is considered invalid...",
-            f"\n{url = }",
-        )
-    except ClientResponseError as cre:
-        # If the client response is not valid, raise a `ClientResponseError`.
-        raise cre
+    """
+    Return the text of the specified url using the shared (pooled) HTTP client.
+
+    - Transient failures are retried with jittered exponential backoff (see `http_client.HTTPClient`).
+    """
+    from .http_client import get_http_client
+
+    return await get_http_client().get_text(url, **kwargs)
 
 
 # endregion
@@ -0,0 +1,145 @@
+"""
+This module provides the sorted, array-backed index of the releases of a package.
+
+The releases are parsed once and stored as two parallel sequences sorted by version: \
+the parsed versions (`tuple[Version, ...]`) and their release dates as days since the \
+epoch (`array('l')`). Every query (initial/latest release, membership, updates, ranges) \
+is then an O(1) lookup or an O(log n) `bisect` over the sorted versions.
+
+The release dates column can be converted to a NumPy `datetime64[D]` array at once \
+(see `VersionIndex.dates_array`) for array-based date filters and statistics.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from statistics import fmean, median
+
+from .release_dates import EPOCH_ORDINAL as _EPOCH, epoch_days, epoch_days_array
+from .utils import datetime, intern_version, namedtuple
+from .util_types import Any, Iterable, Iterator, PackageVersion, Union
+
+
+VersionT = Union[PackageVersion, str]
+DateT = Union[datetime, str]
+
+# Release cadence of a package (days between consecutive releases).
+#   - `releases` (int): The number of releases.
+#   - `mean_days` (float): The mean number of days between two releases.
+#   - `median_days` (float): The median number of days between two releases.
+#   - `max_days` (int): The longest period (days) without a release.
+Cadence = namedtuple("Cadence", ("releases", "mean_days", "median_days", "max_days"))
+
+
+# region VersionIndex
+class VersionIndex:
+    """
+    An immutable index of `(release date, version)` records sorted by version.
+
+    #### Args:
+        - `records` (Iterable[tuple[datetime, VersionT]]): The release records (any order).
+
+    #### Attributes:
+        - `versions` (tuple[Version, ...]): The parsed versions (ascending).
+        - `days` (array): The release date of each version (days since the epoch).
+
+    #### Methods:
+        - `date`: Return the release date of the i-th version.
+        - `initial`: Return the `(date, version)` record of the lowest version.
+        - `latest`: Return the `(date, version)` record of the highest version.
+        - `index`: Return the position of a version (O(log n)).
+        - `is_latest`: Return whether a version is the highest version (O(1)).
+        - `updates`: Return the versions higher than a version (O(log n)).
+        - `between`: Return the versions within an (inclusive) range (O(log n)).
+        - `released_between`: Return the versions released within an (inclusive) date range.
+        - `cadence`: Return the release cadence statistics.
+        - `dates_array`: Return the release dates as a NumPy `datetime64[D]` array (requires NumPy).
+    """
+
+    __slots__ = ("__weakref__", "versions", "days")
+
+    def __init__(self, records: Iterable[tuple[datetime, VersionT]]) -> None:
+        # Sorted by version, then by release date
+        pairs = sorted((intern_version(v), d.toordinal() - _EPOCH) for d, v in records)
+        self.versions: tuple[PackageVersion, ...] = (*(v for v, _ in pairs),)
+        self.days: array = array("l", (d for _, d in pairs))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(versions={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __iter__(self) -> Iterator[tuple[datetime, PackageVersion]]:
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, i: int) -> tuple[datetime, PackageVersion]:
+        return self.date(i), self.versions[i]
+
+    def __contains__(self, version: VersionT) -> bool:
+        return self.index(version) != -1
+
+    def date(self, i: int) -> datetime:
+        """Return the release date of the i-th version."""
+        return datetime.fromordinal(self.days[i] + _EPOCH)
+
+    def initial(self) -> tuple[datetime, PackageVersion]:
+        """Return the `(date, version)` record of the lowest version."""
+        return self[0]
+
+    def latest(self) -> tuple[datetime, PackageVersion]:
+        """Return the `(date, version)` record of the highest version."""
+        return self[-1]
+
+    def index(self, version: VersionT) -> int:
+        """Return the position of the specified version or -1 if it was not released."""
+        version = intern_version(version)
+        i = bisect_left(self.versions, version)
+        return i if i < len(self.versions) and self.versions[i] == version else -1
+
+    def is_latest(self, version: VersionT) -> bool:
+        """Return whether the specified version is the highest version."""
+        return bool(self.versions) and intern_version(version) == self.versions[-1]
+
+    def updates(self, version: VersionT) -> tuple[PackageVersion, ...]:
+        """Return the versions higher than the specified version (ascending)."""
+        return self.versions[bisect_right(self.versions, intern_version(version)) :]
+
+    def between(self, lo: VersionT, hi: VersionT) -> tuple[PackageVersion, ...]:
+        """Return the versions `v` such that `lo <= v <= hi` (ascending)."""
+        return self.versions[
+            bisect_left(self.versions, intern_version(lo)) : bisect_right(
+                self.versions, intern_version(hi)
+            )
+        ]
+
+    def released_between(self, start: DateT, end: DateT) -> tuple[PackageVersion, ...]:
+        """Return the versions released from `start` to `end` (inclusive, ascending versions)."""
+        lo, hi = epoch_days(start), epoch_days(end)
+        return (*(v for v, d in zip(self.versions, self.days) if lo <= d <= hi),)
+
+    def cadence(self) -> Cadence:
+        """Return the release cadence statistics (days between consecutive releases)."""
+        days = sorted(self.days)
+        gaps = [b - a for a, b in zip(days, days[1:])]
+        if not gaps:
+            return Cadence(len(days), 0.0, 0.0, 0)
+        return Cadence(len(days), fmean(gaps), float(median(gaps)), max(gaps))
+
+    def dates_array(self) -> Any:
+        """
+        Return the release dates (parallel to `versions`) as a NumPy `datetime64[D]` array.
+
+        #### Raises:
+            - `ImportError`: If NumPy is not installed.
+        """
+        return epoch_days_array(self.days)
+
+
+# endregion
+
+
+__all__ = (
+    "Cadence",
+    "VersionIndex",
+)
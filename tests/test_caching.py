@@ -0,0 +1,64 @@
+import gc
+import time
+import unittest
+
+from src.pkg_inspect.pkg_utils.caching import LRUCache, cached_method
+
+
+class _Example:
+    __slots__ = ("__weakref__", "calls")
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached_method(maxsize=2)
+    def double(self, num: int) -> int:
+        self.calls += 1
+        return num * 2
+
+
+class TestCaching(unittest.TestCase):
+    def test_lru_bounds(self):
+        cache = LRUCache(maxsize=2)
+        for key in "abc":
+            cache.set(key, key.upper())
+
+        # Assert that the least recently used entry was evicted
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), "C")
+        self.assertEqual(cache.cache_info(), (1, 1, 2, 2))
+
+    def test_ttl(self):
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+
+    def test_cached_method(self):
+        first, second = _Example(), _Example()
+        for _ in range(3):
+            first.double(2)
+        second.double(2)
+
+        # Assert that results are cached per instance
+        self.assertEqual((first.calls, second.calls), (1, 1))
+        self.assertEqual(_Example.double.cache_info(first).hits, 2)
+        _Example.double.cache_clear(first)
+        self.assertEqual(_Example.double.cache_info(first).currsize, 0)
+
+    def test_instances_released(self):
+        from src.pkg_inspect.pkg_utils import caching
+
+        instance = _Example()
+        instance.double(2)
+        key = id(instance)
+        self.assertIn(key, caching._INSTANCE_CACHES)
+
+        # Assert that the cache does not keep the instance alive
+        del instance
+        gc.collect()
+        self.assertNotIn(key, caching._INSTANCE_CACHES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pkg_inspect.pkg_utils.discovery import InterpreterDiscovery
+from src.pkg_inspect.pkg_utils.site_index import SiteIndex
+from src.pkg_inspect.pkg_utils.snapshot import SnapshotRegistry
+from src.pkg_inspect.pkg_utils.utils import intern_version
+
+
+# {distribution: Requires-Dist values} installed for both Python versions
+_DISTRIBUTIONS = {
+    "app-1.0": (
+        "Lib_A>=1.0",
+        "lib-a<3",
+        'backport; python_version < "3.9"',
+        'pytest; extra == "test"',
+    ),
+    "lib_a-2.0": ("lib-b",),
+    "lib_b-1.0": ("lib-a", "missing-dep>=2"),
+    "backport-1.0": (),
+}
+
+
+def _write_dist(site_dir: Path, dist: str, requires: tuple) -> None:
+    dist_info = site_dir / f"{dist}.dist-info"
+    dist_info.mkdir(parents=True)
+    headers = [f"Name: {dist.split('-')[0]}", *(f"Requires-Dist: {r}" for r in requires)]
+    # The description (after the first blank line) is never parsed
+    body = "\n\nRequires-Dist: not-a-header\n"
+    (dist_info / "METADATA").write_text("\n".join(headers) + body)
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        site_dirs = []
+        for py_version in ("3.8", "3.12"):
+            site_dir = root / "lib" / f"python{py_version}" / "site-packages"
+            for dist, requires in _DISTRIBUTIONS.items():
+                _write_dist(site_dir, dist, requires)
+            site_dirs.append((py_version, site_dir))
+
+        InterpreterDiscovery.register_finder("_test")(lambda: site_dirs)
+        self.addCleanup(InterpreterDiscovery.FINDERS.pop, "_test")
+        self.site_dirs = dict(site_dirs)
+        self.discovery = InterpreterDiscovery(finders=("_test",))
+        self.site_index = SiteIndex(root / "site_index.sqlite3")
+        self.snapshot = SnapshotRegistry(max_age=60).get(self.discovery, self.site_index)
+        self.graph = self.snapshot.dependency_graph(intern_version("3.12"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_dependencies(self):
+        (lib_a,) = self.graph.dependencies("App")
+
+        # Assert that the requirements are normalized, merged and filtered by their markers
+        self.assertEqual(lib_a.name, "lib-a")
+        self.assertEqual(str(lib_a.specifier), "<3,>=1.0")
+        self.assertEqual(self.graph.dependents("LIB_A"), ("app", "lib-b"))
+        self.assertEqual(self.graph.dependencies("not-installed"), ())
+
+    def test_markers(self):
+        graph = self.snapshot.dependency_graph(intern_version("3.8"))
+
+        # Assert that the markers are evaluated for each Python version
+        self.assertIn("backport", [d.name for d in graph.dependencies("app")])
+        self.assertNotIn("backport", [d.name for d in self.graph.dependencies("app")])
+
+    def test_queries(self):
+        # Assert that the closure, cycle and missing queries traverse the graph
+        self.assertEqual(self.graph.closure("app"), ("lib-a", "lib-b", "missing-dep"))
+        self.assertEqual(self.graph.reverse_closure("lib-b"), ("app", "lib-a"))
+        self.assertEqual(self.graph.cycles(), (("lib-a", "lib-b"),))
+        self.assertEqual(self.graph.missing(), {"missing-dep": ("lib-b",)})
+
+    def test_dependents(self):
+        dependents = self.snapshot.dependents("Lib_A")
+
+        # Assert that the dependents of every interpreter are indexed with their specifiers
+        self.assertEqual(
+            [(str(r.pyversion), r.dependent, str(r.specifier), r.root) for r in dependents],
+            [
+                ("3.8", "app", "<3,>=1.0", self.site_dirs["3.8"].parent),
+                ("3.8", "lib-b", "", self.site_dirs["3.8"].parent),
+                ("3.12", "app", "<3,>=1.0", self.site_dirs["3.12"].parent),
+                ("3.12", "lib-b", "", self.site_dirs["3.12"].parent),
+            ],
+        )
+        self.assertEqual(
+            [str(r.pyversion) for r in self.snapshot.dependents("backport")], ["3.8"]
+        )
+        self.assertEqual(self.snapshot.dependents("not-required"), ())
+
+    def test_check_environment(self):
+        _write_dist(
+            self.site_dirs["3.12"],
+            "tool-1.0",
+            ("lib_b>=1.5", 'lib-a<2; python_version >= "3.9"', "backport==1.0.*"),
+        )
+        snapshot = SnapshotRegistry(max_age=60).get(self.discovery, self.site_index)
+        conflicts = snapshot.check_environment()
+
+        # Assert that the report is streamed and lists the missing and mismatched requirements
+        self.assertEqual(iter(conflicts), conflicts)
+        self.assertEqual(
+            [
+                (str(c.pyversion), c.dependent, c.dependency, str(c.specifier), str(c.installed))
+                for c in conflicts
+            ],
+            [
+                ("3.8", "lib-b", "missing-dep", ">=2", "None"),
+                ("3.12", "lib-b", "missing-dep", ">=2", "None"),
+                ("3.12", "tool", "lib-a", "<2", "2.0"),
+                ("3.12", "tool", "lib-b", ">=1.5", "1.0"),
+            ],
+        )
+
+    def test_check_interpreters(self):
+        # Same Python version, but 'lib-b' is not installed in this interpreter
+        env_site_dir = Path(self._tmp.name) / "env" / "lib" / "python3.12" / "site-packages"
+        _write_dist(env_site_dir, "tool-1.0", ("lib-b",))
+        InterpreterDiscovery.register_finder("_env")(lambda: [("3.12", env_site_dir)])
+        self.addCleanup(InterpreterDiscovery.FINDERS.pop, "_env")
+        discovery = InterpreterDiscovery(finders=("_test", "_env"))
+        snapshot = SnapshotRegistry(max_age=60).get(discovery, self.site_index)
+
+        # Assert that each interpreter is checked against its own distributions only
+        conflicts = snapshot.check_environment()
+        self.assertEqual(
+            [(str(c.pyversion), c.dependent, c.dependency, c.root) for c in conflicts],
+            [
+                ("3.8", "lib-b", "missing-dep", self.site_dirs["3.8"].parent),
+                ("3.12", "tool", "lib-b", env_site_dir.parent),
+                ("3.12", "lib-b", "missing-dep", self.site_dirs["3.12"].parent),
+            ],
+        )
+
+    def test_interpreters(self):
+        env_site_dir = Path(self._tmp.name) / "env" / "lib" / "python3.12" / "site-packages"
+        _write_dist(env_site_dir, "lib_a-1.0", ("other",))
+        InterpreterDiscovery.register_finder("_env")(lambda: [("3.12", env_site_dir)])
+        self.addCleanup(InterpreterDiscovery.FINDERS.pop, "_env")
+        discovery = InterpreterDiscovery(finders=("_test", "_env"))
+        snapshot = SnapshotRegistry(max_age=60).get(discovery, self.site_index)
+        graphs = snapshot.dependency_graphs()
+
+        # Assert that interpreters of the same Python version keep their own graph
+        self.assertEqual([str(g.pyversion) for g in graphs.values()], ["3.8", "3.12", "3.12"])
+        env_graph, site_graph = (
+            graphs[i] for i in graphs if str(i.version) == "3.12"
+        )
+        self.assertEqual(env_graph.interpreter.root, env_site_dir.parent)
+        self.assertEqual([*env_graph], ["lib-a"])
+        self.assertEqual([d.name for d in env_graph.dependencies("lib-a")], ["other"])
+        self.assertEqual([d.name for d in site_graph.dependencies("lib-a")], ["lib-b"])
+        self.assertIs(snapshot.dependency_graph(env_graph.interpreter), env_graph)
+
+        # Assert that the dependents are told apart by their interpreter root
+        self.assertEqual(
+            [(r.dependent, r.root) for r in snapshot.dependents("other")],
+            [("lib-a", env_site_dir.parent)],
+        )
+        self.assertEqual(
+            [r.root for r in snapshot.dependents("lib-b") if str(r.pyversion) == "3.12"],
+            [self.site_dirs["3.12"].parent],
+        )
+
+    def test_cached(self):
+        # Assert that the graph is cached with the snapshot
+        self.assertIs(self.snapshot.dependency_graph(intern_version("3.12")), self.graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from src.pkg_inspect.pkg_utils import discovery as discovery_module
+from src.pkg_inspect.pkg_utils.discovery import InterpreterDiscovery, get_discovery
+
+
+class TestInterpreterDiscovery(unittest.TestCase):
+    def setUp(self):
+        # Create a temporary interpreter with both 'site-packages' and 'dist-packages'
+        self._tmp = tempfile.TemporaryDirectory()
+        self.lib_dir = Path(self._tmp.name) / "lib" / "python3.12"
+        for name in ("site-packages", "dist-packages"):
+            (self.lib_dir / name).mkdir(parents=True)
+
+        @InterpreterDiscovery.register_finder("_test")
+        def _test_finder():
+            for site_dir in self.lib_dir.iterdir():
+                yield "3.12", site_dir
+
+        self.addCleanup(InterpreterDiscovery.FINDERS.pop, "_test")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_interpreters(self):
+        discovery = InterpreterDiscovery(finders=("_test",))
+        (interpreter,) = discovery.interpreters()
+
+        # Assert that both directories were grouped under the same interpreter
+        self.assertEqual(str(interpreter.version), "3.12")
+        self.assertEqual(interpreter.root, self.lib_dir)
+        self.assertEqual(len(interpreter.site_dirs), 2)
+
+    def test_cached_results(self):
+        discovery = InterpreterDiscovery(finders=("_test",))
+        result = discovery.interpreters()
+
+        # Assert that the results are cached until refreshed
+        (self.lib_dir / "dist-packages").rmdir()
+        self.assertIs(discovery.interpreters(), result)
+        discovery.refresh()
+        self.assertEqual(len(discovery.interpreters()[0].site_dirs), 1)
+
+    def test_shared_discovery(self):
+        class _SlowDiscovery(InterpreterDiscovery):
+            def __init__(self, *args, **kwargs):
+                time.sleep(0.05)
+                super().__init__(*args, **kwargs)
+
+        with mock.patch.object(discovery_module, "_DISCOVERY", None), mock.patch.object(
+            discovery_module, "InterpreterDiscovery", _SlowDiscovery
+        ), ThreadPoolExecutor(8) as pool:
+            results = [*pool.map(lambda _: get_discovery(), range(8))]
+
+        # Assert that concurrent first calls share a single instance
+        self.assertEqual(len({id(d) for d in results}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
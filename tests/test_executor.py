@@ -0,0 +1,56 @@
+import threading
+import time
+import unittest
+
+from src.pkg_inspect.pkg_utils.loop_runner import get_loop_runner
+from src.pkg_inspect.pkg_utils.utils import executor, get_pool_manager
+
+
+class TestExecutor(unittest.TestCase):
+    def test_shared_pool(self):
+        # Assert that every execution reuses the same (lazily created) pool
+        self.assertEqual([*executor(abs, (-1, -2, -3))], [1, 2, 3])
+        pool = get_pool_manager().get()
+        self.assertEqual([*executor(pow, (2, 3), (2, 2))], [4, 9])
+        self.assertIs(get_pool_manager().get(), pool)
+
+    def test_max_workers(self):
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        def task(_):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        # Assert that no more than 'max_workers' calls are in flight
+        [*executor(task, range(12), max_workers=2)]
+        self.assertLessEqual(peak[0], 2)
+
+    def test_deadline(self):
+        results = executor(time.sleep, (0.5,) * 4, max_workers=1, timeout=0.05)
+
+        # Assert that the deadline covers the whole execution
+        with self.assertRaises(TimeoutError):
+            [*results]
+
+    def test_unexpected_kwargs(self):
+        # Assert that unsupported keyword arguments are rejected (not silently dropped)
+        with self.assertRaises(TypeError):
+            [*executor(abs, (-1,), max_worker=2)]
+
+    def test_nested_detection(self):
+        async def names():
+            # Calls made from the event loop thread are not nested pool calls
+            return [*executor(lambda _: threading.current_thread().name, range(2))]
+
+        self.assertTrue(
+            all(n.startswith("pkg_inspect-pool_") for n in get_loop_runner().run(names()))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pkg_inspect.pkg_utils.footprint import (
+    clear_footprints,
+    dist_footprint,
+    footprints,
+    read_record,
+)
+
+
+class TestFootprint(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.site_dir = root / "lib" / "python3.12" / "site-packages"
+        self.dist_info = self.site_dir / "demo-1.0.dist-info"
+        self.dist_info.mkdir(parents=True)
+        (self.site_dir / "demo" / "__pycache__").mkdir(parents=True)
+        (root / "bin").mkdir()
+
+        # Files on disk (recorded sizes are trusted, the others are stat-ed)
+        (self.site_dir / "demo" / "__init__.py").write_text("x" * 100)
+        (self.site_dir / "demo" / "a,b.txt").write_text("x" * 10)
+        (self.site_dir / "demo" / "__pycache__" / "__init__.cpython-312.pyc").write_bytes(
+            b"x" * 40
+        )
+        (root / "bin" / "demo").write_text("x" * 5)
+        self.record = self.dist_info / "RECORD"
+        self.write_record(
+            "demo/__init__.py,sha256=abc,100",
+            '"demo/a,b.txt",sha256=def,10',
+            "demo/__init__.py,sha256=abc,100",
+            "demo/__pycache__/__init__.cpython-312.pyc,,",
+            "demo/__pycache__/gone.cpython-312.pyc,,",
+            "../../../bin/demo,sha256=ghi,5",
+            "demo-1.0.dist-info/RECORD,,",
+        )
+        clear_footprints()
+
+    def tearDown(self):
+        clear_footprints()
+        self._tmp.cleanup()
+
+    def write_record(self, *rows: str) -> None:
+        self.record.write_text("\n".join(rows) + "\n")
+
+    def test_read_record(self):
+        footprint = read_record(self.dist_info)
+        record_size = self.record.stat().st_size
+
+        # Assert that every installed file is counted once (duplicates and missing files excluded)
+        self.assertEqual(footprint.files, 5)
+        self.assertEqual(footprint.missing, 1)
+        self.assertEqual(footprint.size, 100 + 10 + 40 + 5 + record_size)
+
+    def test_cached(self):
+        footprint = dist_footprint(self.dist_info)
+        self.assertIs(dist_footprint(self.dist_info), footprint)
+
+        # Assert that a new RECORD (E.g a reinstall) invalidates the cached footprint
+        self.write_record("demo/__init__.py,sha256=abc,100")
+        st = self.record.stat()
+        os.utime(self.record, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        self.assertEqual(dist_footprint(self.dist_info), (100, 1, 0))
+
+    def test_footprints(self):
+        no_record = self.site_dir / "legacy-1.0.dist-info"
+        no_record.mkdir()
+        result = footprints([self.dist_info, no_record, str(self.dist_info)])
+
+        # Assert that the distributions without a RECORD file have no footprint
+        self.assertEqual(
+            result,
+            {str(self.dist_info): read_record(self.dist_info), str(no_record): None},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
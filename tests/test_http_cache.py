@@ -0,0 +1,138 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.pkg_inspect.pkg_utils.http_cache import HTTPCache
+from src.pkg_inspect.pkg_utils.http_client import HTTPClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    etag = '"v1"'
+    requests: list[int] = []
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == self.etag:
+            self.requests.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.requests.append(200)
+        body = f"release {self.etag}".encode()
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        ...
+
+
+class TestHTTPCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "http_cache.sqlite3"
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:{}/history".format(self.server.server_port)
+        _Handler.etag = '"v1"'
+        _Handler.requests.clear()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    def get_text(self, **kwargs) -> str:
+        async def _get_text():
+            # A new client (and cache) per call, as in a new process
+            client = HTTPClient(cache=HTTPCache(self.db_path, **kwargs))
+            try:
+                return await client.get_text(self.url)
+            finally:
+                await client.close()
+
+        return asyncio.run(_get_text())
+
+    def test_fresh(self):
+        # Assert that fresh responses are served without any request
+        self.assertEqual(self.get_text(), 'release "v1"')
+        self.assertEqual(self.get_text(), 'release "v1"')
+        self.assertEqual(_Handler.requests, [200])
+
+    def test_revalidate(self):
+        self.get_text(default_ttl=0)
+
+        # Assert that stale responses are revalidated ('304 Not Modified')
+        self.assertEqual(self.get_text(default_ttl=0), 'release "v1"')
+        _Handler.etag = '"v2"'
+        self.assertEqual(self.get_text(default_ttl=0), 'release "v2"')
+        self.assertEqual(_Handler.requests, [200, 304, 200])
+
+    def test_off_loop(self):
+        threads = []
+
+        class _Cache(HTTPCache):
+            def get(self, url):
+                threads.append(threading.get_ident())
+                return super().get(url)
+
+            def store(self, url, text, **kwargs):
+                threads.append(threading.get_ident())
+                return super().store(url, text, **kwargs)
+
+        async def _get_text():
+            client = HTTPClient(cache=_Cache(self.db_path))
+            try:
+                await client.get_text(self.url)
+                return threading.get_ident()
+            finally:
+                await client.close()
+
+        loop_thread = asyncio.run(_get_text())
+
+        # Assert that the (blocking) cache calls never run on the event loop thread
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(loop_thread, threads)
+
+    def test_host_ttl(self):
+        cache = HTTPCache(self.db_path, ttls={"example.org": 5}, default_ttl=1)
+
+        # Assert that the freshness is resolved per host (and parent domain)
+        self.assertEqual(cache.ttl("https://www.example.org/x"), 5)
+        self.assertEqual(cache.ttl("https://pepy.tech/projects/x"), 3600)
+        self.assertEqual(cache.ttl("http://127.0.0.1/"), 1)
+
+    def test_eviction(self):
+        cache = HTTPCache(self.db_path, max_size=3000)
+        # (Incompressible) responses of ~1000 bytes each
+        texts = [os.urandom(500).hex() for _ in range(10)]
+        for i, text in enumerate(texts):
+            cache.store(f"https://example.org/{i}", text)
+
+        # Assert that the least recently used responses are evicted
+        self.assertLessEqual(cache.size(), 3000)
+        self.assertIsNone(cache.get("https://example.org/0"))
+        self.assertEqual(cache.get("https://example.org/9").text, texts[9])
+
+    def test_eviction_order(self):
+        # Room for 3 (compressed) responses of ~560 bytes
+        cache = HTTPCache(self.db_path, max_size=1800)
+        texts = [os.urandom(500).hex() for _ in range(4)]
+        for i, text in enumerate(texts[:3]):
+            cache.store(f"https://example.org/{i}", text)
+        cache.get("https://example.org/0")
+        cache.store("https://example.org/3", texts[3])
+
+        # Assert that the response accessed the longest ago is evicted (not the oldest stored)
+        self.assertIsNone(cache.get("https://example.org/1"))
+        self.assertEqual(cache.get("https://example.org/0").text, texts[0])
+        self.assertEqual(cache.get("https://example.org/3").text, texts[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
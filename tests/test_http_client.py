@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aiohttp import ClientResponseError
+
+from src.pkg_inspect.pkg_utils.http_client import HTTPClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # {path: [statuses to respond with (the last one is repeated)]}
+    statuses: dict[str, list[int]] = {}
+    requests: list[str] = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        statuses = self.statuses[self.path]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        ...
+
+
+class TestHTTPClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:{}".format(self.server.server_port)
+        _Handler.requests.clear()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get_text(self, path: str, **kwargs) -> str:
+        async def _get_text():
+            client = HTTPClient(backoff=0.001, **kwargs)
+            try:
+                return await client.get_text(self.url + path)
+            finally:
+                await client.close()
+
+        return asyncio.run(_get_text())
+
+    def test_retry_transient_errors(self):
+        _Handler.statuses["/flaky"] = [503, 429, 200]
+
+        # Assert that transient statuses are retried with backoff
+        self.assertEqual(self.get_text("/flaky"), "ok")
+        self.assertEqual(len(_Handler.requests), 3)
+
+    def test_retry_budget(self):
+        _Handler.statuses["/down"] = [503]
+
+        # Assert that the retry budget is bounded
+        with self.assertRaises(ClientResponseError):
+            self.get_text("/down", retries=2)
+        self.assertEqual(len(_Handler.requests), 3)
+
+    def test_no_retry(self):
+        _Handler.statuses["/missing"] = [404]
+
+        # Assert that non-transient statuses are not retried
+        with self.assertRaises(ClientResponseError):
+            self.get_text("/missing")
+        self.assertEqual(len(_Handler.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
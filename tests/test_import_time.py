@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+# Source directory containing the 'pkg_inspect' package
+SRC_DIR = Path(__file__).parents[1] / "src"
+
+# Import-time budget (microseconds) of 'import pkg_inspect'
+IMPORT_BUDGET_US = int(os.environ.get("PKG_INSPECT_IMPORT_BUDGET_US", 50_000))
+
+# Dependencies that must only be imported when they are first used
+LAZY_MODULES = ("aiohttp", "bs4", "pypistats", "importlib_metadata")
+
+
+def importtime(module: str) -> dict[str, int]:
+    # Return the cumulative import time (us) of each module imported by 'module'
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stderr
+    timings = {}
+    for line in stderr.splitlines()[1:]:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_budget(self):
+        timings = importtime("pkg_inspect")
+
+        # Assert that the package itself imports within the budget
+        self.assertLess(timings["pkg_inspect"], IMPORT_BUDGET_US)
+        self.assertNotIn("pkg_inspect.pkg_modules", timings)
+
+    def test_lazy_dependencies(self):
+        timings = importtime("pkg_inspect.pkg_functions")
+
+        # Assert that the network stack is not imported eagerly
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, timings)
+
+    def test_lazy_inspection_fields(self):
+        code = (
+            "from pkg_inspect.pkg_functions import functions;"
+            "assert 'INSPECTION_FIELDS' not in vars(functions);"
+            "assert 'short_meta' in functions.INSPECTION_FIELDS"
+        )
+        env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+
+        # Assert that the inspection fields are only computed on first access
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+if __name__ == "__main__":
+    unittest.main()
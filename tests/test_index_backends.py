@@ -0,0 +1,278 @@
+import asyncio
+import json
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.pkg_inspect.pkg_modules.pkg_versions import PkgVersions
+from src.pkg_inspect.pkg_utils import http_client
+from src.pkg_inspect.pkg_utils.exception import PkgException
+from src.pkg_inspect.pkg_utils.http_cache import HTTPCache
+from src.pkg_inspect.pkg_utils.index_backends import (
+    HTMLHistoryBackend,
+    IndexBackend,
+    PyPIJSONBackend,
+    get_backends,
+)
+from src.pkg_inspect.pkg_utils.loop_runner import get_loop_runner
+
+
+# (version, upload time) of the releases served by the stand-in index
+_RELEASES = (
+    ("1.0.0", "2021-01-01T10:00:00"),
+    ("1.1.0", "2021-06-15T10:00:00"),
+    ("2.0.0rc1", "2021-12-01T10:00:00"),
+    ("2.0.0", "2022-01-10T10:00:00"),
+)
+
+
+def _pypi_json(name: str) -> dict:
+    return {
+        "releases": {
+            v: [{"filename": f"{name}-{v}.tar.gz", "upload_time": t}] for v, t in _RELEASES
+        }
+    }
+
+
+def _simple_json(name: str) -> dict:
+    return {
+        "meta": {"api-version": "1.1"},
+        "files": [
+            {"filename": f, "upload-time": t + "Z"}
+            for v, t in _RELEASES
+            for f in (f"{name}-{v}.tar.gz", f"{name}-{v}-py3-none-any.whl")
+        ],
+    }
+
+
+def _history_html(name: str) -> str:
+    rows = "".join(
+        f'<div class="release"><p>{v}</p><p>{datetime.fromisoformat(t):%b %d, %Y}</p></div>'
+        for v, t in reversed(_RELEASES)
+        if "rc" not in v
+    )
+    return f"<html><body>{rows}</body></html>"
+
+
+# Stand-in libraries.io (GitHub statistics) and pepy.tech (downloads) pages
+_STATS_HTML = """<dl class="row detail-card">
+<dt>
+Stars
+</dt>
+<dd>
+1,023
+</dd>
+<dt>
+Forks
+</dt>
+<dd>
+7
+</dd>
+</dl>"""
+_DOWNLOADS_HTML = "".join(
+    f'<div class="MuiGrid-root MuiGrid-item MuiGrid-grid-xs-12 css-woiofv">{text}</div>'
+    for text in ("https://pepy.tech", "1,234,567")
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Disabled endpoints (E.g {'/pypi/'}) respond with '404 Not Found'
+    disabled: set[str] = set()
+    # Paths of the received requests
+    requests: list[str] = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        parts = self.path.split("?")[0].strip("/").split("/")
+        kind, name = parts[0], parts[-1]
+        if any(self.path.startswith(d) for d in self.disabled):
+            body, status = b"", 404
+        elif kind == "pypi":
+            body, status = json.dumps(_pypi_json(name)).encode(), 200
+        elif kind == "simple":
+            body, status = json.dumps(_simple_json(name)).encode(), 200
+        elif kind == "stats":
+            body, status = _STATS_HTML.encode(), 200
+        elif kind == "downloads":
+            body, status = _DOWNLOADS_HTML.encode(), 200
+        else:
+            body, status = _history_html(name).encode(), 200
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        ...
+
+
+class TestIndexBackends(unittest.TestCase):
+    expected = (("2.0.0", 2022), ("1.1.0", 2021), ("1.0.0", 2021))
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.index_url = "http://127.0.0.1:{}".format(self.server.server_port)
+        self.package = "demo"
+
+        # Process-wide client with a temporary HTTP cache (never the user's cache)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(setattr, http_client, "_HTTP_CLIENT", http_client._HTTP_CLIENT)
+        client = http_client._HTTP_CLIENT = http_client.HTTPClient(
+            cache=HTTPCache(Path(self._tmp.name) / "http_cache.sqlite3")
+        )
+        self.addCleanup(lambda: get_loop_runner().run(client.close()))
+        _Handler.disabled = set()
+        _Handler.requests = []
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def history(self, *backends: str) -> tuple:
+        pkg = PkgVersions(
+            self.package, backends=get_backends(backends, index_url=self.index_url)
+        )
+        return tuple((str(v), d.year) for d, v in pkg.version_history)
+
+    def test_backends(self):
+        # Assert that every backend builds the same release history (pre-releases excluded)
+        for backend in ("json", "simple", "html"):
+            with self.subTest(backend=backend):
+                self.assertEqual(self.history(backend), self.expected)
+
+    def test_fallback(self):
+        _Handler.disabled = {"/pypi/", "/simple/"}
+
+        # Assert that the next backend is used if a backend fails
+        self.assertEqual(self.history("json", "simple", "html"), self.expected)
+
+    def test_version_queries(self):
+        pkg = PkgVersions(self.package, backends=get_backends(index_url=self.index_url))
+
+        # Assert that the history queries are served from the version index
+        self.assertEqual(len(pkg), 3)
+        self.assertEqual(str(pkg.initial_version.version), "1.0.0")
+        self.assertEqual(str(pkg.latest_version.version), "2.0.0")
+        self.assertTrue(pkg.is_latest("2.0"))
+        self.assertEqual([*map(str, pkg.get_updates("1.0.0"))], ["1.1.0", "2.0.0"])
+        self.assertEqual([*map(str, pkg.versions_between("1.0.1", "2"))], ["1.1.0", "2.0.0"])
+        self.assertEqual(len([*pkg.version_history]), len([*pkg.version_history]))
+
+    def test_bulk(self):
+        packages = [f"{self.package}-{i}" for i in range(5)]
+        backends = get_backends(index_url=self.index_url)
+        results = dict(PkgVersions.bulk([*packages, packages[0], ""], backends=backends))
+
+        # Assert that every (unique) package is fetched, with its errors streamed as results
+        self.assertEqual(results.keys(), {*packages, ""})
+        self.assertIsInstance(results.pop(""), PkgException)
+        for pkg in results.values():
+            # Assert that the history is served from the fetched records (no request)
+            self.assertEqual(pkg._release_records.cache_info(pkg).currsize, 1)
+            self.assertEqual(str(pkg.latest_version.version), "2.0.0")
+
+    def test_bulk_async(self):
+        async def main():
+            backends = get_backends(("json",), index_url=self.index_url)
+            return [
+                (package, str(pkg.latest_version.version))
+                async for package, pkg in PkgVersions.bulk_async(
+                    (self.package,), limit=1, backends=backends
+                )
+            ]
+
+        self.assertEqual(asyncio.run(main()), [(self.package, "2.0.0")])
+
+    def test_parsed_off_loop(self):
+        threads = []
+
+        class _Backend(PyPIJSONBackend):
+            def releases(self, contents, package):
+                threads.append(threading.current_thread().name)
+                return super().releases(contents, package)
+
+        results = dict(
+            PkgVersions.bulk((self.package,), backends=(_Backend(self.index_url),))
+        )
+
+        # Assert that the fetched contents are parsed outside of the event loop thread
+        self.assertEqual(str(results[self.package].latest_version.version), "2.0.0")
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], "pkg_inspect-loop")
+
+    def test_prefetch(self):
+        class _PkgVersions(PkgVersions):
+            STATS_API = f"{self.index_url}/stats/{{}}/{{}}"
+            DOWNLOADS_API = f"{self.index_url}/downloads/{{}}"
+
+        pkg = _PkgVersions(
+            self.package, backends=get_backends(("json",), index_url=self.index_url)
+        ).prefetch()
+        items = {
+            "latest_version": str(pkg.latest_version.version),
+            "total_versions": pkg.total_versions,
+            "github_stats": pkg.github_stats,
+            "total_downloads": pkg.total_downloads,
+            "downloads_url": pkg.downloads_url,
+        }
+
+        # Assert that every property is computed from the pages fetched (once) by 'prefetch'
+        self.assertEqual(len(_Handler.requests), 3)
+        self.assertEqual(items["latest_version"], "2.0.0")
+        self.assertEqual(items["total_versions"], 3)
+        self.assertEqual(items["github_stats"], {"Stars": 1023, "Forks": 7})
+        self.assertEqual(items["total_downloads"], "1.23 Million (1,234,567)")
+        self.assertEqual(items["downloads_url"], f"{self.index_url}/downloads/{self.package}")
+
+    def test_pages_parsed_off_loop(self):
+        threads = []
+
+        class _PkgVersions(PkgVersions):
+            STATS_API = f"{self.index_url}/stats/{{}}/{{}}"
+            DOWNLOADS_API = f"{self.index_url}/downloads/{{}}"
+
+            def _parse_html(self, html_contents):
+                threads.append(threading.current_thread().name)
+                return super()._parse_html(html_contents)
+
+        pkg = _PkgVersions(
+            self.package, backends=get_backends(("json",), index_url=self.index_url)
+        ).prefetch()
+
+        # Assert that the prefetched pages are parsed outside of the event loop thread
+        self.assertEqual(pkg.github_stats, {"Stars": 1023, "Forks": 7})
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn("pkg_inspect-loop", threads)
+
+    def test_abstract_backend(self):
+        class _Backend(IndexBackend):
+            def url(self, package):
+                return f"{self._index_url}/{package}"
+
+        # Assert that incomplete backends are rejected when constructed (not while fetching)
+        for backend in (IndexBackend, _Backend):
+            with self.assertRaises(TypeError):
+                backend(self.index_url)
+
+    def test_html_chunks(self):
+        contents = _history_html(self.package)
+        backend = HTMLHistoryBackend()
+        chunks = (contents[i : i + 7] for i in range(0, len(contents), 7))
+
+        # Assert that the history page can be parsed incrementally (E.g while downloading)
+        self.assertEqual(
+            [*backend.parse_chunks(chunks)], [*backend.parse(contents, self.package)]
+        )
+        self.assertEqual(
+            [(v, d.year) for d, v in backend.parse(contents, self.package)],
+            [*self.expected],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
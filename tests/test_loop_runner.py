@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+from concurrent.futures import Future
+
+from src.pkg_inspect.pkg_utils.loop_runner import LoopRunner
+
+
+async def _echo(value):
+    await asyncio.sleep(0)
+    return value, asyncio.get_running_loop()
+
+
+class TestLoopRunner(unittest.TestCase):
+    def setUp(self):
+        self.runner = LoopRunner()
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_run(self):
+        value, loop = self.runner.run(_echo(1))
+        future = self.runner.submit(_echo(2))
+
+        # Assert that every coroutine runs on the same (persistent) event loop
+        self.assertEqual(value, 1)
+        self.assertIsInstance(future, Future)
+        self.assertEqual(future.result(), (2, loop))
+
+    def test_run_async(self):
+        async def main():
+            return await asyncio.gather(
+                *(self.runner.run_async(_echo(i)) for i in range(3))
+            ), asyncio.get_running_loop()
+
+        results, caller_loop = asyncio.run(main())
+
+        # Assert that async callers are served from a running event loop
+        self.assertEqual([v for v, _ in results], [0, 1, 2])
+        self.assertTrue(all(loop is not caller_loop for _, loop in results))
+
+    def test_run_in_loop(self):
+        async def nested():
+            return self.runner.run(_echo(1))
+
+        # Assert that blocking on the event loop from itself is refused
+        with self.assertRaises(RuntimeError):
+            self.runner.run(nested())
+
+    def test_stream(self):
+        running = peak = 0
+
+        async def square(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05 * (3 - value))
+            running -= 1
+            if value < 0:
+                raise ValueError(value)
+            return value * value
+
+        results = [*self.runner.stream(square, (1, 2, 3, -1), limit=2)]
+
+        # Assert that the results (and errors) are streamed as each completes, within the limit
+        self.assertEqual(peak, 2)
+        self.assertEqual([r for _, r in results[:3]], [4, 9, 1])
+        self.assertIsInstance(dict(results)[-1], ValueError)
+
+    def test_stream_async(self):
+        async def main():
+            return [r async for r in self.runner.stream_async(_echo, range(3))]
+
+        # Assert that the results are streamed to the caller's event loop
+        self.assertEqual(sorted(i for i, _ in asyncio.run(main())), [0, 1, 2])
+
+    def test_shutdown(self):
+        _, loop = self.runner.run(_echo(1))
+        self.runner.shutdown()
+        self.assertFalse(self.runner.is_running())
+
+        # Assert that a new event loop is started on the next call
+        _, new_loop = self.runner.run(_echo(2))
+        self.assertTrue(loop.is_closed())
+        self.assertIsNot(loop, new_loop)
+
+
+if __name__ == "__main__":
+    unittest.main()
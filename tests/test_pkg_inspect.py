@@ -1,6 +1,10 @@
+import sys
 import unittest
+import weakref
 
 from src import *
+from src.pkg_inspect.pkg_modules.pkg_metrics import PkgMetrics
+from src.pkg_inspect.pkg_utils.utils import PkgGenRepr
 
 
 class TestPkgInspect(unittest.TestCase):
@@ -14,6 +18,16 @@ class TestPkgInspect(unittest.TestCase):
         # Assert that the result is a dictionary
         self.assertIsInstance(result, int)
 
+    def test_field_aliases(self):
+        # Get the inspection field registry of PkgInspect
+        fields = PkgInspect._field_registry()
+
+        # Assert that the aliases resolve to the same canonical field
+        for alias in ("short_meta", "short-meta", "Short Meta"):
+            self.assertEqual(fields.resolve(alias), "short_meta")
+        self.assertEqual(fields.resolve("st_size"), "st_size")
+        self.assertIsNone(fields.resolve("no_such_file.txt"))
+
     def test_check_package(self):
         # Create an instance of PkgInspect
         pkg_inspect = PkgInspect()
@@ -66,6 +80,18 @@ class TestPkgInspect(unittest.TestCase):
         # Assert that the result is not empty
         self.assertIsNotNone(result)
 
+    def test_total_size(self):
+        pkg_inspect = PkgInspect(package="packaging", pyversion="{}.{}".format(*sys.version_info))
+
+        # Assert that the total size is the installed footprint (not the '.dist-info' directory)
+        result = pkg_inspect.inspect_package(itemOrfile="total_size")
+        self.assertEqual(result.bytes_size, pkg_inspect.footprint.size)
+
+    def test_weakref(self):
+        # Assert that the slotted classes can be weakly referenced
+        for obj in (PkgInspect(), PkgMetrics(["."]), PkgGenRepr(iter(()))):
+            self.assertIs(weakref.ref(obj)(), obj)
+
 
 if __name__ == "__main__":
     unittest.main()
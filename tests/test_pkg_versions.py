@@ -0,0 +1,60 @@
+import unittest
+import weakref
+from datetime import datetime
+
+from packaging.version import Version
+
+from src.pkg_inspect.pkg_modules.pkg_versions import PkgVersions
+from src.pkg_inspect.pkg_utils.exception import PkgException
+from src.pkg_inspect.pkg_utils.utils import version_cache_info
+
+
+class TestDateTimeVersions(unittest.TestCase):
+    def test_parsed_once(self):
+        dtv = PkgVersions.create_dtv("Jan 1, 2021", "2.25.1")
+
+        # Assert that the date and version are parsed at construction
+        self.assertEqual(dtv.date, datetime(2021, 1, 1))
+        self.assertEqual(dtv.version, Version("2.25.1"))
+        self.assertIs(dtv.version, dtv.version)
+        self.assertEqual(str(dtv), "('Jan 01, 2021', '2.25.1')")
+
+    def test_ordering(self):
+        create = PkgVersions.create_dtv
+        dtvs = [
+            create("Jan 2, 2021", "1.0.0"),
+            create("Jan 1, 2021", "1.10.0"),
+            create("Jan 1, 2021", "1.9.0"),
+        ]
+
+        # Assert that the release dates are compared first, then the versions
+        self.assertEqual(
+            [str(d.version) for d in sorted(dtvs)], ["1.9.0", "1.10.0", "1.0.0"]
+        )
+        self.assertEqual(create("Jan 1, 2021", "1.9"), dtvs[2])
+        self.assertEqual(len({*dtvs, create("Jan 1, 2021", "1.9.0")}), 3)
+        with self.assertRaises(PkgException):
+            dtvs[0] < ("Jan 1, 2021", "1.0.0")
+
+    def test_weakref(self):
+        dtv = PkgVersions.create_dtv("Jan 1, 2021", "1.0.0")
+
+        # Assert that the parsed records can be weakly referenced (E.g by the caches)
+        self.assertIs(weakref.ref(dtv)(), dtv)
+
+
+class TestParseVersion(unittest.TestCase):
+    def test_interned(self):
+        hits = version_cache_info().hits
+        version = PkgVersions.parse_version("1.26.4")
+
+        # Assert that equal strings return the same (interned) Version object
+        self.assertIs(PkgVersions.parse_version("1.26.4"), version)
+        self.assertGreater(version_cache_info().hits, hits)
+        self.assertEqual(PkgVersions.parse_version("1.26.4", return_base=True), "1.26.4")
+        with self.assertRaises(PkgException):
+            PkgVersions.parse_version("not-a-version")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from src.pkg_inspect.pkg_modules.pkg_inspect import PkgInspect
+from src.pkg_inspect.pkg_utils.discovery import InterpreterDiscovery
+from src.pkg_inspect.pkg_utils.exception import PkgException
+from src.pkg_inspect.pkg_utils import site_index as site_index_module
+from src.pkg_inspect.pkg_utils.site_index import SiteIndex, get_site_index
+
+
+class TestSiteIndex(unittest.TestCase):
+    def setUp(self):
+        # Create a temporary site-packages directory with a few distributions
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.site_dir = self.tmp / "lib" / "python3.12" / "site-packages"
+        self.site_dir.mkdir(parents=True)
+        for dist in (
+            "pandas-2.2.1.dist-info",
+            "six.py",
+            "numpy",
+            "pyobjc-10.1.dist-info",
+        ):
+            (self.site_dir / dist).mkdir()
+        self.db_path = self.tmp / "cache" / "site_index.sqlite3"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_distributions(self):
+        index = SiteIndex(self.db_path)
+        result = {(d.name, d.version) for d in index.distributions(self.site_dir)}
+
+        # Assert that only the '.dist-info' and '.py' entries were indexed
+        self.assertEqual(result, {("pandas", "2.2.1"), ("six", None)})
+
+    def test_persistent_index(self):
+        SiteIndex(self.db_path).distributions(self.site_dir)
+        st = os.stat(self.site_dir)
+
+        # A new index (e.g. a new process) must read the stored entries
+        # without rescanning an unchanged (same mtime) site-packages directory.
+        (self.site_dir / "rich-13.0.0.dist-info").mkdir()
+        os.utime(self.site_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+        names = {d.name for d in SiteIndex(self.db_path).distributions(self.site_dir)}
+        self.assertNotIn("rich", names)
+
+        # Once modified, the site-packages directory must be rescanned.
+        os.utime(self.site_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        names = {d.name for d in SiteIndex(self.db_path).distributions(self.site_dir)}
+        self.assertIn("rich", names)
+
+    def test_persistent_requirements(self):
+        metadata = self.site_dir / "pandas-2.2.1.dist-info" / "METADATA"
+        metadata.write_text("Name: pandas\nRequires-Dist: numpy>=1.26\n\nDescription\n")
+        requires = SiteIndex(self.db_path).requirements(self.site_dir)
+        self.assertEqual([*requires.values()], [("numpy>=1.26",)])
+
+        # Assert that a new index reads the stored requirements of an unchanged directory
+        metadata.unlink()
+        self.assertEqual(SiteIndex(self.db_path).requirements(self.site_dir), requires)
+
+    def test_normalized_lookup(self):
+        (self.site_dir / "Key_Craftsman-1.0.dist-info").mkdir()
+        InterpreterDiscovery.register_finder("_test")(lambda: [("3.12", self.site_dir)])
+        self.addCleanup(InterpreterDiscovery.FINDERS.pop, "_test")
+        pkg_inspect = PkgInspect(
+            site_index=SiteIndex(self.db_path),
+            discovery=InterpreterDiscovery(finders=("_test",)),
+        )
+
+        # Assert that differently spelled names resolve to the same distribution
+        for name in ("key-craftsman", "KEY.CRAFTSMAN", "key__craftsman"):
+            self.assertEqual(pkg_inspect._check_package("3.12", name), "Key_Craftsman")
+        self.assertEqual(
+            pkg_inspect._get_site_package("Pandas", "3.12").name,
+            "pandas-2.2.1.dist-info",
+        )
+        with self.assertRaises(PkgException):
+            pkg_inspect._check_package("3.12", "requests")
+
+    def test_shared_site_index(self):
+        db_path = self.db_path
+
+        class _SlowSiteIndex(SiteIndex):
+            def __init__(self, *args, **kwargs):
+                time.sleep(0.05)
+                super().__init__(db_path)
+
+        with mock.patch.object(site_index_module, "_SITE_INDEX", None), mock.patch.object(
+            site_index_module, "SiteIndex", _SlowSiteIndex
+        ), ThreadPoolExecutor(8) as pool:
+            results = [*pool.map(lambda _: get_site_index(), range(8))]
+
+        # Assert that concurrent first calls share a single instance
+        self.assertEqual(len({id(i) for i in results}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
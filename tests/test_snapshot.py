@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+import weakref
+from pathlib import Path
+
+from src.pkg_inspect.pkg_utils.discovery import InterpreterDiscovery
+from src.pkg_inspect.pkg_utils.site_index import SiteIndex
+from src.pkg_inspect.pkg_utils.snapshot import SnapshotRegistry
+
+
+class TestSnapshotRegistry(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.site_dir = Path(self._tmp.name) / "lib" / "python3.12" / "site-packages"
+        (self.site_dir / "pandas-2.2.1.dist-info").mkdir(parents=True)
+
+        InterpreterDiscovery.register_finder("_test")(lambda: [("3.12", self.site_dir)])
+        self.addCleanup(InterpreterDiscovery.FINDERS.pop, "_test")
+        self.discovery = InterpreterDiscovery(finders=("_test",))
+        self.site_index = SiteIndex(Path(self._tmp.name) / "site_index.sqlite3")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_shared_snapshot(self):
+        registry = SnapshotRegistry(max_age=60)
+        snapshot = registry.get(self.discovery, self.site_index)
+
+        # Assert that the snapshot is shared until explicitly refreshed
+        (self.site_dir / "six.py").touch()
+        self.assertIs(registry.get(self.discovery, self.site_index), snapshot)
+        registry.refresh()
+        snapshot = registry.get(self.discovery, self.site_index)
+        names = {d.name for _, dists in snapshot.distributions for d in dists}
+        self.assertEqual(names, {"pandas", "six"})
+
+    def test_stale_snapshot(self):
+        registry = SnapshotRegistry(max_age=0)
+        snapshot = registry.get(self.discovery, self.site_index)
+
+        # Assert that stale snapshots are rebuilt on the next lookup
+        self.assertIsNot(registry.get(self.discovery, self.site_index), snapshot)
+
+    def test_evict_stale(self):
+        registry = SnapshotRegistry(max_age=0)
+        discovery = InterpreterDiscovery(finders=("_test",))
+        snapshot = weakref.ref(registry.get(discovery, self.site_index))
+        registry.get(self.discovery, self.site_index)
+
+        # Assert that the stale snapshots of the other pairs are evicted (and released)
+        self.assertEqual([*registry._snapshots], [(self.discovery, self.site_index)])
+        self.assertIsNone(snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
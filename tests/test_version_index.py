@@ -0,0 +1,92 @@
+import importlib.util
+import unittest
+from datetime import datetime
+
+from packaging.version import Version
+
+from src.pkg_inspect.pkg_utils.release_dates import (
+    parse_release_date,
+    release_dates_array,
+)
+from src.pkg_inspect.pkg_utils.version_index import VersionIndex
+
+
+class TestVersionIndex(unittest.TestCase):
+    def setUp(self):
+        # Release records in history order (newest first)
+        self.index = VersionIndex(
+            (
+                (datetime(2024, 1, 1), "2.0.0"),
+                (datetime(2023, 6, 1), "1.10.0"),
+                (datetime(2023, 1, 1), "1.9.1"),
+                (datetime(2022, 1, 1), "1.2"),
+            )
+        )
+
+    def test_sorted(self):
+        # Assert that the versions are sorted by version (not lexicographically)
+        self.assertEqual(
+            self.index.versions, tuple(map(Version, ("1.2", "1.9.1", "1.10.0", "2.0.0")))
+        )
+        self.assertEqual(self.index.initial(), (datetime(2022, 1, 1), Version("1.2")))
+        self.assertEqual(self.index.latest(), (datetime(2024, 1, 1), Version("2.0.0")))
+
+    def test_queries(self):
+        # Assert that the lookups are version (not string) comparisons
+        self.assertEqual(self.index.index("1.2.0"), 0)
+        self.assertEqual(self.index.index("1.3"), -1)
+        self.assertIn("1.10", self.index)
+        self.assertTrue(self.index.is_latest("2.0"))
+        self.assertFalse(self.index.is_latest("1.10.0"))
+        self.assertEqual(self.index.updates("1.9.1"), (Version("1.10.0"), Version("2.0.0")))
+        self.assertEqual(self.index.updates("2.0.0"), ())
+        self.assertEqual(
+            self.index.between("1.5", "1.10.0"), (Version("1.9.1"), Version("1.10.0"))
+        )
+
+    def test_dates(self):
+        # Assert that the date range filters and cadence are computed from the days column
+        self.assertEqual(
+            self.index.released_between("Jan 1, 2023", datetime(2023, 12, 31)),
+            (Version("1.9.1"), Version("1.10.0")),
+        )
+        cadence = self.index.cadence()
+        self.assertEqual(cadence.releases, 4)
+        self.assertEqual(cadence.max_days, 365)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires NumPy")
+    def test_dates_array(self):
+        import numpy as np
+
+        dates = self.index.dates_array()
+
+        # Assert that the days column is converted to 'datetime64[D]' at once
+        self.assertEqual(dates.dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(str(dates[0]), "2022-01-01")
+
+
+class TestReleaseDates(unittest.TestCase):
+    def test_parse_release_date(self):
+        # Assert that the 'Mon D, YYYY' shape is parsed regardless of the case or padding
+        for date in ("Jan 1, 2021", "jan 01, 2021", " Jan  1,  2021"):
+            self.assertEqual(parse_release_date(date), datetime(2021, 1, 1))
+        for date in ("Foo 1, 2021", "Feb 30, 2021", "Jan 1,2021", "2021-01-01"):
+            with self.assertRaises(ValueError):
+                parse_release_date(date)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires NumPy")
+    def test_release_dates_array(self):
+        dates = ("Jan 1, 2021", "dec 31, 1999", " Feb  29,  2024", datetime(2020, 5, 17))
+
+        # Assert that the array parsing matches `parse_release_date` (padded dates included)
+        self.assertEqual(
+            [str(d) for d in release_dates_array(dates)],
+            ["2021-01-01", "1999-12-31", "2024-02-29", "2020-05-17"],
+        )
+        for date in ("Feb 29, 2023", "Foo 1, 2021", "Jan 1, 20211"):
+            with self.assertRaises(ValueError):
+                release_dates_array(("Jan 1, 2021", date))
+
+
+if __name__ == "__main__":
+    unittest.main()